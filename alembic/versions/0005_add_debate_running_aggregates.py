@@ -0,0 +1,91 @@
+"""add debate running aggregates
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "debates",
+        sa.Column("turn_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "debates",
+        sa.Column(
+            "total_completion_tokens",
+            sa.BigInteger(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+    )
+    op.add_column("debates", sa.Column("last_turn_id", postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column(
+        "debates",
+        sa.Column("transcript", sa.Text(), nullable=False, server_default=sa.text("''")),
+    )
+
+    op.execute(
+        """
+        WITH agg AS (
+            SELECT
+                t.debate_id,
+                count(*) AS turn_count,
+                coalesce(
+                    sum(
+                        CASE
+                            WHEN jsonb_typeof(t.usage -> 'completion_tokens') = 'number'
+                            THEN (t.usage ->> 'completion_tokens')::numeric::bigint
+                            ELSE 0
+                        END
+                    ),
+                    0
+                ) AS total_completion_tokens,
+                (array_agg(t.id ORDER BY t.created_at DESC, t.id DESC))[1] AS last_turn_id,
+                btrim(
+                    string_agg(
+                        'Round ' || t.round || ' - '
+                        || CASE t.actor
+                            WHEN 'debater_a' THEN 'A'
+                            WHEN 'debater_b' THEN 'B'
+                            WHEN 'judge' THEN 'Judge'
+                            ELSE t.actor
+                        END
+                        || ': ' || t.content,
+                        E'\\n' ORDER BY t.created_at, t.id
+                    ),
+                    E' \\t\\n\\r'
+                ) AS transcript
+            FROM turns t
+            GROUP BY t.debate_id
+        )
+        UPDATE debates d
+        SET
+            turn_count = agg.turn_count,
+            total_completion_tokens = agg.total_completion_tokens,
+            last_turn_id = agg.last_turn_id,
+            transcript = agg.transcript
+        FROM agg
+        WHERE d.id = agg.debate_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("debates", "transcript")
+    op.drop_column("debates", "last_turn_id")
+    op.drop_column("debates", "total_completion_tokens")
+    op.drop_column("debates", "turn_count")
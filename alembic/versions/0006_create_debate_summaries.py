@@ -0,0 +1,55 @@
+"""create debate summaries
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "debate_summaries",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("debate_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("through_round", sa.Integer(), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("model", sa.Text(), nullable=True),
+        sa.Column("usage", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+    op.create_unique_constraint(
+        "uq_debate_summaries_debate_id_through_round",
+        "debate_summaries",
+        ["debate_id", "through_round"],
+    )
+    op.create_foreign_key(
+        "fk_debate_summaries_debate_id_debates",
+        source_table="debate_summaries",
+        referent_table="debates",
+        local_cols=["debate_id"],
+        remote_cols=["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "fk_debate_summaries_debate_id_debates", "debate_summaries", type_="foreignkey"
+    )
+    op.drop_constraint(
+        "uq_debate_summaries_debate_id_through_round", "debate_summaries", type_="unique"
+    )
+    op.drop_table("debate_summaries")
@@ -0,0 +1,29 @@
+"""add debate driver lease
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("debates", sa.Column("lease_owner", sa.Text(), nullable=True))
+    op.add_column(
+        "debates", sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("debates", "lease_expires_at")
+    op.drop_column("debates", "lease_owner")
@@ -0,0 +1,43 @@
+"""add debate list indexes
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_debates_updated_at_id", "debates", ["updated_at", "id"])
+    op.create_index(
+        "ix_debates_status_updated_at_id", "debates", ["status", "updated_at", "id"]
+    )
+    op.create_index(
+        "ix_debates_stop_reason_updated_at_id",
+        "debates",
+        ["stop_reason", "updated_at", "id"],
+        postgresql_where=sa.text("stop_reason IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_debates_topic_prefix",
+        "debates",
+        ["topic"],
+        postgresql_ops={"topic": "text_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_debates_topic_prefix", table_name="debates")
+    op.drop_index("ix_debates_stop_reason_updated_at_id", table_name="debates")
+    op.drop_index("ix_debates_status_updated_at_id", table_name="debates")
+    op.drop_index("ix_debates_updated_at_id", table_name="debates")
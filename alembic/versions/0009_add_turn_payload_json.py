@@ -0,0 +1,25 @@
+"""add pre-encoded turn payload
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("turns", sa.Column("payload_json", sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("turns", "payload_json")
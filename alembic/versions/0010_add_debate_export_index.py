@@ -0,0 +1,23 @@
+"""add debate export index
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_debates_created_at_id", "debates", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_debates_created_at_id", table_name="debates")
@@ -0,0 +1,55 @@
+"""create debate round verdicts
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "debate_round_verdicts",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("debate_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("round", sa.Integer(), nullable=False),
+        sa.Column("verdict", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("model", sa.Text(), nullable=True),
+        sa.Column("usage", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+    op.create_unique_constraint(
+        "uq_debate_round_verdicts_debate_id_round",
+        "debate_round_verdicts",
+        ["debate_id", "round"],
+    )
+    op.create_foreign_key(
+        "fk_debate_round_verdicts_debate_id_debates",
+        source_table="debate_round_verdicts",
+        referent_table="debates",
+        local_cols=["debate_id"],
+        remote_cols=["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "fk_debate_round_verdicts_debate_id_debates", "debate_round_verdicts", type_="foreignkey"
+    )
+    op.drop_constraint(
+        "uq_debate_round_verdicts_debate_id_round", "debate_round_verdicts", type_="unique"
+    )
+    op.drop_table("debate_round_verdicts")
@@ -0,0 +1,29 @@
+"""add debate version for optimistic concurrency
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Postgres 11+ keeps a constant default in the catalog, so this does not rewrite the table.
+    op.add_column(
+        "debates",
+        sa.Column("version", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("debates", "version")
@@ -0,0 +1,30 @@
+"""add partial index on in-flight debates
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_debates_in_flight_updated_at",
+        "debates",
+        ["status", "updated_at"],
+        postgresql_where=sa.text("status IN ('running', 'stopping')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_debates_in_flight_updated_at", table_name="debates")
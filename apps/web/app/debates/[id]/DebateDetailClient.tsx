@@ -14,16 +14,26 @@ import { toast } from "sonner";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Separator } from "@/components/ui/separator";
-import type { Debate, Turn } from "@/lib/api";
+import type { Debate, Turn, TurnDelta } from "@/lib/api";
 import { fetchJson, getApiBaseUrl } from "@/lib/api";
 import { useI18n } from "@/lib/i18n";
 
+type DraftTurn = { round: number; actor: string; content: string };
+
+function isSameStep(
+  draft: DraftTurn | null,
+  step: { round: number; actor: string },
+): draft is DraftTurn {
+  return draft?.round === step.round && draft?.actor === step.actor;
+}
+
 export default function DebateDetailClient({ debateId }: { debateId: string }) {
   const apiBaseUrl = useMemo(getApiBaseUrl, []);
   const { language, t } = useI18n();
 
   const [debate, setDebate] = useState<Debate | null>(null);
   const [turns, setTurns] = useState<Turn[]>([]);
+  const [draft, setDraft] = useState<DraftTurn | null>(null);
   const [error, setError] = useState<string | null>(null);
   const [followingLatest, setFollowingLatest] = useState(true);
   const eventSourceRef = useRef<EventSource | null>(null);
@@ -118,8 +128,21 @@ export default function DebateDetailClient({ debateId }: { debateId: string }) {
     const es = new EventSource(url);
     eventSourceRef.current = es;
 
+    es.addEventListener("turn_delta", (evt) => {
+      const data = JSON.parse((evt as MessageEvent).data) as TurnDelta;
+      setDraft((current) => {
+        const base = isSameStep(current, data) ? current.content : "";
+        return {
+          round: data.round,
+          actor: data.actor,
+          content: base.slice(0, data.offset) + data.delta,
+        };
+      });
+    });
+
     es.addEventListener("turn", (evt) => {
       const data = JSON.parse((evt as MessageEvent).data) as Turn;
+      setDraft((current) => (isSameStep(current, data) ? null : current));
       setTurns((current) => {
         if (current.some((t) => t.id === data.id)) return current;
         lastSeenTurnIdRef.current = data.id;
@@ -151,7 +174,7 @@ export default function DebateDetailClient({ debateId }: { debateId: string }) {
   useEffect(() => {
     if (!followingLatest) return;
     scrollToLatest("auto");
-  }, [followingLatest, scrollToLatest, turns.length]);
+  }, [followingLatest, scrollToLatest, turns.length, draft?.content]);
 
   const handleTranscriptScroll = useCallback(() => {
     const el = transcriptScrollRef.current;
@@ -257,7 +280,7 @@ export default function DebateDetailClient({ debateId }: { debateId: string }) {
           onScroll={handleTranscriptScroll}
           className="scrollbar-none min-h-0 flex-1 overflow-auto pt-4"
         >
-          {turns.length === 0 ? (
+          {turns.length === 0 && !draft ? (
             <div className="text-sm text-muted-foreground">
               {t("noTurnsYet")}
             </div>
@@ -290,6 +313,28 @@ export default function DebateDetailClient({ debateId }: { debateId: string }) {
                     </div>,
                   );
                 }
+                if (draft) {
+                  if (lastRound !== draft.round) {
+                    out.push(
+                      <div
+                        key={`round-${draft.round}`}
+                        className="pt-1 text-base font-medium text-muted-foreground"
+                      >
+                        {t("roundLabel", { n: draft.round })}
+                      </div>,
+                    );
+                  }
+                  out.push(
+                    <div key="draft" className="flex items-baseline gap-3">
+                      <div className="w-10 shrink-0 text-base font-semibold leading-7 text-foreground">
+                        {actorPrefix(draft.actor)}
+                      </div>
+                      <div className="min-w-0 flex-1 whitespace-pre-wrap text-base leading-7 text-muted-foreground">
+                        {draft.content}
+                      </div>
+                    </div>,
+                  );
+                }
                 return out;
               })()}
               <div ref={transcriptEndRef} />
@@ -12,7 +12,7 @@ import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Input } from "@/components/ui/input";
 import { Separator } from "@/components/ui/separator";
-import type { DebateListItem } from "@/lib/api";
+import type { DebateListItem, DebateListPage } from "@/lib/api";
 import { useI18n } from "@/lib/i18n";
 import { deleteDebate, fetchJson, getApiBaseUrl } from "@/lib/api";
 
@@ -41,10 +41,10 @@ export function DebatesSidebar({
   const refresh = useCallback(async (): Promise<void> => {
     setLoading(true);
     try {
-      const items = await fetchJson<DebateListItem[]>(
+      const page = await fetchJson<DebateListPage>(
         `${apiBaseUrl}/debates?limit=50`,
       );
-      setDebates(items);
+      setDebates(page.items);
       setLoadedOnce(true);
     } finally {
       setLoading(false);
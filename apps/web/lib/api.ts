@@ -24,6 +24,11 @@ export type DebateListItem = {
   updated_at: string;
 };
 
+export type DebateListPage = {
+  items: DebateListItem[];
+  next_cursor: string | null;
+};
+
 export type Turn = {
   id: string;
   debate_id: string;
@@ -36,6 +41,14 @@ export type Turn = {
   created_at: string;
 };
 
+export type TurnDelta = {
+  debate_id: string;
+  round: number;
+  actor: string;
+  offset: number;
+  delta: string;
+};
+
 export type DebateDetailResponse = {
   debate: Debate;
   turns: Turn[];
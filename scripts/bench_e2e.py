@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any
+import uuid
+
+import httpx
+import psycopg
+import redis
+
+_ACTIVE_STATUSES = ("running", "stopping")
+_PG_COUNTERS = (
+    "xact_commit",
+    "xact_rollback",
+    "tup_returned",
+    "tup_fetched",
+    "tup_inserted",
+    "tup_updated",
+)
+
+
+def _libpq_url(database_url: str) -> str:
+    return database_url.replace("postgresql+psycopg://", "postgresql://", 1)
+
+
+def _percentiles(values: list[float]) -> dict[str, float | None]:
+    if not values:
+        return {"mean": None, "p50": None, "p95": None, "max": None}
+    ordered = sorted(values)
+
+    def pick(pct: float) -> float:
+        return round(ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))], 1)
+
+    return {
+        "mean": round(sum(ordered) / len(ordered), 1),
+        "p50": pick(50),
+        "p95": pick(95),
+        "max": round(ordered[-1], 1),
+    }
+
+
+@contextmanager
+def _process(name: str, cmd: list[str], env: dict[str, str], log_dir: Path) -> Iterator[None]:
+    with (log_dir / f"{name}.log").open("wb") as log:
+        proc = subprocess.Popen(cmd, env=env, stdout=log, stderr=subprocess.STDOUT)
+        try:
+            yield
+        finally:
+            proc.terminate()
+            try:
+                proc.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+
+def _wait_http(url: str, *, timeout_seconds: float) -> None:
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        try:
+            httpx.get(url, timeout=2.0, trust_env=False)
+            return
+        except httpx.HTTPError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"{url} did not come up within {timeout_seconds:.0f}s") from None
+            time.sleep(0.2)
+
+
+def _pg_counters(conn: psycopg.Connection[Any]) -> dict[str, int]:
+    row = conn.execute(
+        f"SELECT {', '.join(_PG_COUNTERS)} FROM pg_stat_database WHERE datname = current_database()"
+    ).fetchone()
+    counters = dict(zip(_PG_COUNTERS, row or (), strict=False))
+    try:
+        statements = conn.execute(
+            "SELECT sum(calls) FROM pg_stat_statements "
+            "WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())"
+        ).fetchone()
+        counters["statements"] = int(statements[0] or 0) if statements else 0
+    except psycopg.Error:
+        conn.rollback()
+    return {key: int(value) for key, value in counters.items()}
+
+
+class _QueueSampler:
+    """Sample the Celery queue length in Redis while the benchmark runs."""
+
+    def __init__(self, redis_url: str, queue: str, *, interval_seconds: float = 0.25) -> None:
+        self._redis = redis.Redis.from_url(redis_url)
+        self._queue = queue
+        self._interval = interval_seconds
+        self._stop = threading.Event()
+        self.samples: list[int] = []
+        self._thread = threading.Thread(target=self._run, name="queue-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.samples.append(int(self._redis.llen(self._queue)))
+            except redis.RedisError:
+                pass
+
+    def __enter__(self) -> _QueueSampler:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def _run_debates(
+    api: str, *, prefix: str, count: int, settings: dict[str, Any], timeout_seconds: float
+) -> float:
+    """Create and start `count` debates in one batch; return the wall time until none is active."""
+
+    debates = [{"topic": f"{prefix} #{i}", "settings": settings} for i in range(count)]
+    with httpx.Client(timeout=60.0, trust_env=False) as client:
+        started = time.perf_counter()
+        r = client.post(f"{api}/debates:batch", json={"debates": debates, "start": True})
+        r.raise_for_status()
+        deadline = time.monotonic() + timeout_seconds
+        while time.monotonic() < deadline:
+            listing = client.get(
+                f"{api}/debates",
+                params={"topic_prefix": prefix, "status": list(_ACTIVE_STATUSES), "limit": 1},
+            )
+            listing.raise_for_status()
+            if not listing.json()["items"]:
+                break
+            time.sleep(0.2)
+        else:
+            raise RuntimeError(f"Debates still active after {timeout_seconds:.0f}s")
+        return time.perf_counter() - started
+
+
+def _step_metrics(conn: psycopg.Connection[Any], prefix: str) -> dict[str, Any]:
+    """
+    Per-step timings from the persisted turns of this run's debates.
+
+    A step's orchestration overhead is the time between two consecutive turns of a debate minus
+    the LLM call of the later one (queueing, claim, prompt building, persist, publish). Start lag
+    is the time from the batch insert to the first LLM call of each debate.
+    """
+
+    debates = conn.execute(
+        "SELECT id, status, stop_reason, created_at FROM debates WHERE topic LIKE %s",
+        (f"{prefix} #%",),
+    ).fetchall()
+    rows = conn.execute(
+        "SELECT t.debate_id, t.created_at, (t.metadata->>'duration_ms')::float "
+        "FROM turns t JOIN debates d ON d.id = t.debate_id "
+        "WHERE d.topic LIKE %s ORDER BY t.debate_id, t.created_at, t.id",
+        (f"{prefix} #%",),
+    ).fetchall()
+
+    created_at = {row[0]: row[3] for row in debates}
+    llm_ms: list[float] = []
+    overhead_ms: list[float] = []
+    start_lag_ms: list[float] = []
+    previous: tuple[uuid.UUID, datetime] | None = None
+    for debate_id, turn_at, duration_ms in rows:
+        duration_ms = duration_ms or 0.0
+        llm_ms.append(duration_ms)
+        if previous is None or previous[0] != debate_id:
+            start_lag_ms.append(
+                (turn_at - created_at[debate_id]).total_seconds() * 1000 - duration_ms
+            )
+        else:
+            overhead_ms.append((turn_at - previous[1]).total_seconds() * 1000 - duration_ms)
+        previous = (debate_id, turn_at)
+
+    statuses: dict[str, int] = {}
+    for _, status, stop_reason, _ in debates:
+        key = f"{status}:{stop_reason}" if stop_reason else status
+        statuses[key] = statuses.get(key, 0) + 1
+    return {
+        "statuses": statuses,
+        "steps": len(rows),
+        "llm_ms": _percentiles(llm_ms),
+        "step_overhead_ms": _percentiles(overhead_ms),
+        "start_lag_ms": _percentiles(start_lag_ms),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "End-to-end throughput benchmark against local Postgres/Redis (for example "
+            "docker compose -f docker-compose.yml -f docker-compose.host.yml up -d postgres "
+            "redis). Launches the fake DeepSeek server, the API and a Celery worker unless "
+            "--api-url is given."
+        )
+    )
+    parser.add_argument("--debates", type=int, default=20, help="Concurrent debates to run.")
+    parser.add_argument("--max-rounds", type=int, default=3)
+    parser.add_argument(
+        "--settings", default="{}", help="Extra debate settings as JSON (e.g. judge_mode)."
+    )
+    parser.add_argument("--timeout-seconds", type=float, default=600.0)
+    parser.add_argument(
+        "--stats-wait-seconds",
+        type=float,
+        default=10.0,
+        help="Wait before reading pg_stat_database so idle connections have flushed.",
+    )
+    parser.add_argument(
+        "--api-url", default=None, help="Benchmark a running stack instead of launching one."
+    )
+    parser.add_argument("--api-port", type=int, default=8190)
+    parser.add_argument("--fake-port", type=int, default=8191)
+    parser.add_argument("--worker-concurrency", type=int, default=8)
+    parser.add_argument("--worker-pool", choices=["prefork", "threads"], default="prefork")
+    parser.add_argument("--first-token-ms", type=float, default=300.0)
+    parser.add_argument("--first-token-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--token-delay-ms", type=float, default=5.0)
+    parser.add_argument("--completion-tokens", type=int, default=60)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--invalid-judge-rate", type=float, default=0.0)
+    parser.add_argument("--json", action="store_true", help="Print one JSON result object.")
+    parser.add_argument("--output", type=Path, default=None, help="Also write the JSON here.")
+    args = parser.parse_args()
+
+    database_url = os.environ["DATABASE_URL"]
+    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    settings = {
+        "max_rounds": args.max_rounds,
+        "output_language": "en",
+        **json.loads(args.settings),
+    }
+    log_dir = Path(tempfile.mkdtemp(prefix="llm-debate-bench-"))
+    fake_url = f"http://127.0.0.1:{args.fake_port}"
+
+    with ExitStack() as stack, psycopg.connect(_libpq_url(database_url), autocommit=True) as conn:
+        api = (args.api_url or "").rstrip("/")
+        if not api:
+            api = f"http://127.0.0.1:{args.api_port}"
+            env = {**os.environ, "DEEPSEEK_BASE_URL": fake_url}
+            env.setdefault("DEEPSEEK_API_KEY", "bench")
+            fake_cmd = [
+                sys.executable,
+                str(Path(__file__).with_name("fake_deepseek.py")),
+                "--port",
+                str(args.fake_port),
+                "--first-token-ms",
+                str(args.first_token_ms),
+                "--first-token-jitter-ms",
+                str(args.first_token_jitter_ms),
+                "--token-delay-ms",
+                str(args.token_delay_ms),
+                "--completion-tokens",
+                str(args.completion_tokens),
+                "--error-rate",
+                str(args.error_rate),
+                "--throttle-rate",
+                str(args.throttle_rate),
+                "--invalid-judge-rate",
+                str(args.invalid_judge_rate),
+            ]
+            stack.enter_context(_process("fake_deepseek", fake_cmd, env, log_dir))
+            api_cmd = [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "llm_debate.api.main:app",
+                "--port",
+                str(args.api_port),
+                "--log-level",
+                "warning",
+            ]
+            stack.enter_context(_process("api", api_cmd, env, log_dir))
+            worker_cmd = [
+                sys.executable,
+                "-m",
+                "celery",
+                "-A",
+                "llm_debate.worker.celery_app",
+                "worker",
+                "--loglevel",
+                "warning",
+                "--concurrency",
+                str(args.worker_concurrency),
+                "--pool",
+                args.worker_pool,
+                "--without-gossip",
+                "--without-mingle",
+            ]
+            stack.enter_context(_process("worker", worker_cmd, env, log_dir))
+            _wait_http(f"{fake_url}/stats", timeout_seconds=30)
+            _wait_http(f"{api}/debates?limit=1", timeout_seconds=30)
+            # The worker has no HTTP endpoint; give it a moment to connect to the broker.
+            time.sleep(3)
+
+        before = _pg_counters(conn)
+        with _QueueSampler(redis_url, "celery") as sampler:
+            wall_seconds = _run_debates(
+                api,
+                prefix=prefix,
+                count=args.debates,
+                settings=settings,
+                timeout_seconds=args.timeout_seconds,
+            )
+        # Idle backends flush their pg_stat counters lazily (up to ~10s later).
+        time.sleep(args.stats_wait_seconds)
+        after = _pg_counters(conn)
+
+        steps = _step_metrics(conn, prefix)
+        db = {key: after[key] - before.get(key, 0) for key in after}
+        per_step = max(1, steps["steps"])
+        db["transactions_per_step"] = round(
+            (db["xact_commit"] + db["xact_rollback"]) / per_step, 2
+        )
+        if "statements" in db:
+            db["statements_per_step"] = round(db["statements"] / per_step, 2)
+        fake_stats: dict[str, int] | None = None
+        if not args.api_url:
+            fake_stats = httpx.get(f"{fake_url}/stats", trust_env=False).json()
+
+    result: dict[str, Any] = {
+        "run": prefix,
+        "config": {**vars(args), "settings": settings, "output": str(args.output or "")},
+        "debates": args.debates,
+        "wall_seconds": round(wall_seconds, 3),
+        "steps_per_second": round(steps["steps"] / wall_seconds, 2) if wall_seconds else None,
+        **steps,
+        "queue_depth": {
+            "max": max(sampler.samples, default=0),
+            "mean": round(sum(sampler.samples) / len(sampler.samples), 1)
+            if sampler.samples
+            else 0,
+        },
+        "db": db,
+        "fake_server": fake_stats,
+        "logs": str(log_dir),
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(result, indent=2, default=str) + "\n")
+    if args.json:
+        print(json.dumps(result, default=str))
+        return 0
+
+    print(
+        f"{args.debates} debates, {steps['steps']} steps in {result['wall_seconds']}s "
+        f"-> {result['steps_per_second']} steps/s  statuses={steps['statuses']}"
+    )
+    for key in ("llm_ms", "step_overhead_ms", "start_lag_ms"):
+        stats = steps[key]
+        print(f"{key:>17}: mean={stats['mean']} p50={stats['p50']} p95={stats['p95']}")
+    print(f"      queue_depth: max={result['queue_depth']['max']} mean={result['queue_depth']['mean']}")
+    print(f"               db: {db}")
+    if fake_stats is not None:
+        print(f"      fake_server: {fake_stats}")
+    print(f"             logs: {log_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main())
+    except Exception as exc:
+        print(f"bench_e2e failed: {exc}", file=sys.stderr)
+        raise
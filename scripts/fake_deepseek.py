@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter, deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+import json
+import random
+import time
+from typing import Any
+import uuid
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+import uvicorn
+
+_WORDS = (
+    "evidence suggests the trade-off depends on incentives, measurement, and the edge cases "
+    "that the opposing argument has not yet addressed in concrete terms"
+).split()
+
+
+@dataclass(frozen=True)
+class FakeConfig:
+    first_token_ms: float
+    token_delay_ms: float
+    completion_tokens: int
+    rpm: int = 0
+    judge_no_new: bool = False
+    # Mean of an exponential tail added to `first_token_ms`, like a real API's latency spread.
+    first_token_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    invalid_judge_rate: float = 0.0
+    seed: int | None = None
+
+
+def _completion_text(n_tokens: int) -> str:
+    return " ".join(_WORDS[i % len(_WORDS)] for i in range(n_tokens))
+
+
+def _judge_text(*, no_new: bool = False) -> str:
+    return json.dumps(
+        {
+            "summary": "Both sides argued; A engaged more directly with rebuttals.",
+            "score_a": 7,
+            "score_b": 6,
+            "winner": "a",
+            "no_new_substantive_arguments": no_new,
+        }
+    )
+
+
+class PrefixCache:
+    """
+    Approximate DeepSeek context caching: prompts are cached in 64-token (~256 char) blocks and a
+    request hits every leading block that an earlier request already sent.
+    """
+
+    block_chars = 256
+
+    def __init__(self) -> None:
+        self._seen: set[int] = set()
+
+    def hit_chars(self, prompt: str) -> int:
+        hit = 0
+        for end in range(self.block_chars, len(prompt) + 1, self.block_chars):
+            key = hash(prompt[:end])
+            if key not in self._seen:
+                self._seen.add(key)
+            elif hit == end - self.block_chars:
+                hit = end
+        return hit
+
+
+class RequestWindow:
+    """Sliding one-minute request window per model, like a provider-side RPM limit."""
+
+    def __init__(self, rpm: int) -> None:
+        self._rpm = rpm
+        self._seen: dict[str, deque[float]] = {}
+
+    def retry_after(self, model: str) -> float | None:
+        if self._rpm <= 0:
+            return None
+        now = time.monotonic()
+        window = self._seen.setdefault(model, deque())
+        while window and now - window[0] >= 60:
+            window.popleft()
+        if len(window) >= self._rpm:
+            return 60 - (now - window[0])
+        window.append(now)
+        return None
+
+
+def _prompt_text(body: dict[str, Any]) -> str:
+    return "".join(
+        f"<{m.get('role')}>{m.get('content') or ''}" for m in body.get("messages", [])
+    )
+
+
+def _usage(body: dict[str, Any], completion_tokens: int, cache: PrefixCache) -> dict[str, Any]:
+    prompt = _prompt_text(body)
+    prompt_tokens = max(1, len(prompt) // 4)
+    hit_tokens = min(prompt_tokens, cache.hit_chars(prompt) // 4)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "prompt_cache_hit_tokens": hit_tokens,
+        "prompt_cache_miss_tokens": prompt_tokens - hit_tokens,
+    }
+
+
+def create_app(config: FakeConfig) -> FastAPI:
+    """OpenAI-compatible stand-in for the DeepSeek chat completions endpoint."""
+
+    app = FastAPI(title="fake-deepseek")
+    cache = PrefixCache()
+    window = RequestWindow(config.rpm)
+    rng = random.Random(config.seed)
+    stats: Counter[str] = Counter()
+
+    def rate_limited(retry_after: float) -> JSONResponse:
+        stats["throttled"] += 1
+        return JSONResponse(
+            {"error": {"message": "Rate limit reached", "type": "rate_limit_error"}},
+            status_code=429,
+            headers={"Retry-After": f"{retry_after:.0f}"},
+        )
+
+    @app.get("/stats")
+    async def get_stats() -> dict[str, int]:
+        """Request counters since startup (benchmarks read them after a run)."""
+
+        return dict(stats)
+
+    @app.post("/chat/completions", response_model=None)
+    async def chat_completions(request: Request) -> JSONResponse | StreamingResponse:
+        body: dict[str, Any] = await request.json()
+        model = str(body.get("model") or "fake-chat")
+        stats["requests"] += 1
+        retry_after = window.retry_after(model)
+        if retry_after is not None:
+            return rate_limited(retry_after)
+        if rng.random() < config.throttle_rate:
+            return rate_limited(1)
+        if rng.random() < config.error_rate:
+            stats["errors"] += 1
+            return JSONResponse(
+                {"error": {"message": "Injected failure", "type": "server_error"}}, status_code=500
+            )
+        max_tokens = int(body.get("max_tokens") or config.completion_tokens)
+        is_judge = (body.get("response_format") or {}).get("type") == "json_object"
+        n_tokens = min(max_tokens, config.completion_tokens)
+        if is_judge and rng.random() < config.invalid_judge_rate:
+            stats["invalid_judge"] += 1
+            text = "The debate was close; A edged it."
+        elif is_judge:
+            text = _judge_text(no_new=config.judge_no_new)
+        else:
+            text = _completion_text(n_tokens)
+        pieces = [text] if is_judge else [w + " " for w in text.split(" ")]
+        usage = _usage(body, len(pieces), cache)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+        first_token_ms = config.first_token_ms
+        if config.first_token_jitter_ms > 0:
+            first_token_ms += rng.expovariate(1 / config.first_token_jitter_ms)
+        stats["completions"] += 1
+
+        if not body.get("stream"):
+            await asyncio.sleep((first_token_ms + config.token_delay_ms * len(pieces)) / 1000)
+            return JSONResponse(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": created,
+                    "model": model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": text},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": usage,
+                }
+            )
+
+        include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+
+        def chunk(delta: dict[str, Any], finish_reason: str | None) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            return f"data: {json.dumps(payload)}\n\n"
+
+        async def events() -> AsyncIterator[str]:
+            await asyncio.sleep(first_token_ms / 1000)
+            yield chunk({"role": "assistant", "content": ""}, None)
+            for piece in pieces:
+                yield chunk({"content": piece}, None)
+                await asyncio.sleep(config.token_delay_ms / 1000)
+            yield chunk({}, "stop")
+            if include_usage:
+                usage_payload = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [],
+                    "usage": usage,
+                }
+                yield f"data: {json.dumps(usage_payload)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Offline OpenAI-compatible stand-in for DeepSeek (set DEEPSEEK_BASE_URL to it)."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--first-token-ms", type=float, default=300.0)
+    parser.add_argument(
+        "--first-token-jitter-ms",
+        type=float,
+        default=0.0,
+        help="Mean of an exponential latency tail added to --first-token-ms.",
+    )
+    parser.add_argument("--token-delay-ms", type=float, default=20.0)
+    parser.add_argument("--completion-tokens", type=int, default=150)
+    parser.add_argument(
+        "--rpm", type=int, default=0, help="Answer 429 above this many requests/min per model."
+    )
+    parser.add_argument(
+        "--judge-no-new",
+        action="store_true",
+        help="Judge verdicts report no new substantive arguments (exercises early stops).",
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500."
+    )
+    parser.add_argument(
+        "--throttle-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests answered with 429 (Retry-After: 1).",
+    )
+    parser.add_argument(
+        "--invalid-judge-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of judge requests answered with prose instead of JSON.",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed for latency and injection.")
+    args = parser.parse_args()
+
+    config = FakeConfig(
+        first_token_ms=args.first_token_ms,
+        token_delay_ms=args.token_delay_ms,
+        completion_tokens=args.completion_tokens,
+        rpm=args.rpm,
+        judge_no_new=args.judge_no_new,
+        first_token_jitter_ms=args.first_token_jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        invalid_judge_rate=args.invalid_judge_rate,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from typing import BinaryIO
+
+import psycopg
+
+from llm_debate.db.bulk_import import import_ndjson
+from llm_debate.db.engine import create_db_engine
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Bulk-load debates and turns from `GET /debates/export` NDJSON via COPY."
+    )
+    parser.add_argument("path", help="NDJSON file to import, or - for stdin.")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    raw = create_db_engine().raw_connection()
+    try:
+        conn = raw.driver_connection
+        if not isinstance(conn, psycopg.Connection):
+            raise RuntimeError("DATABASE_URL must use the psycopg driver")
+        source: BinaryIO = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+        with source:
+            stats = import_ndjson(conn, source)
+        raw.commit()
+    finally:
+        raw.close()
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "rows": stats.rows,
+        "debates_inserted": stats.debates_inserted,
+        "turns_inserted": stats.turns_inserted,
+        "seconds": round(elapsed, 2),
+        "turns_per_second": round(stats.turns_inserted / elapsed) if elapsed > 0 else None,
+    }
+    if args.json:
+        print(json.dumps(report))
+    else:
+        for key, value in report.items():
+            print(f"{key}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main())
+    except Exception as exc:
+        print(f"import_debates failed: {exc}", file=sys.stderr)
+        raise
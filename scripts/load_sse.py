@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+import json
+import os
+import sys
+import time
+
+import httpx
+
+
+@dataclass
+class ClientStats:
+    connected: bool = False
+    turns: int = 0
+    latencies_ms: list[float] = field(default_factory=list)
+    error: str | None = None
+
+
+def _api_base_url() -> str:
+    raw = os.getenv("API_BASE_URL", "http://localhost:8000").rstrip("/")
+    return raw
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _run_client(
+    client: httpx.AsyncClient,
+    url: str,
+    stats: ClientStats,
+    *,
+    max_turns: int,
+    deadline: float,
+) -> None:
+    try:
+        async with client.stream("GET", url) as r:
+            r.raise_for_status()
+            stats.connected = True
+            event: dict[str, str] = {}
+            async for line in r.aiter_lines():
+                if time.time() > deadline:
+                    return
+                if line == "":
+                    if event.get("event") == "turn" and "data" in event:
+                        data = json.loads(event["data"])
+                        created_at = datetime.fromisoformat(str(data["created_at"]))
+                        stats.latencies_ms.append((time.time() - created_at.timestamp()) * 1000)
+                        stats.turns += 1
+                        if stats.turns >= max_turns:
+                            return
+                    event = {}
+                    continue
+                if line.startswith("event:"):
+                    event["event"] = line[len("event:") :].strip()
+                elif line.startswith("data:"):
+                    event["data"] = line[len("data:") :].strip()
+    except (httpx.HTTPError, ValueError, KeyError) as exc:
+        stats.error = repr(exc)
+
+
+async def _main_async(args: argparse.Namespace) -> dict[str, object]:
+    api = _api_base_url()
+    limits = httpx.Limits(max_connections=args.clients + 10, max_keepalive_connections=args.clients)
+    timeout = httpx.Timeout(args.timeout_seconds, connect=30.0)
+
+    async with httpx.AsyncClient(limits=limits, timeout=timeout, trust_env=False) as client:
+        debate_id = args.debate_id
+        if debate_id is None:
+            create = await client.post(f"{api}/debates", json={"topic": args.topic})
+            create.raise_for_status()
+            debate_id = create.json()["id"]
+
+        # Connect every viewer first so delivery latency covers live fan-out, not catch-up.
+        url = f"{api}/debates/{debate_id}/events"
+        deadline = time.time() + args.timeout_seconds
+        stats = [ClientStats() for _ in range(args.clients)]
+        tasks = [
+            asyncio.create_task(
+                _run_client(client, url, s, max_turns=args.turns, deadline=deadline)
+            )
+            for s in stats
+        ]
+        await asyncio.sleep(args.connect_grace_seconds)
+
+        if args.debate_id is None:
+            start = await client.post(f"{api}/debates/{debate_id}/start")
+            start.raise_for_status()
+
+        await asyncio.wait(tasks, timeout=args.timeout_seconds)
+        for task in tasks:
+            task.cancel()
+
+    latencies = [latency for s in stats for latency in s.latencies_ms]
+    return {
+        "debate_id": debate_id,
+        "clients": args.clients,
+        "connected": sum(1 for s in stats if s.connected),
+        "errors": sum(1 for s in stats if s.error is not None),
+        "turn_events": len(latencies),
+        "latency_ms_p50": _percentile(latencies, 50),
+        "latency_ms_p99": _percentile(latencies, 99),
+        "latency_ms_max": max(latencies) if latencies else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="SSE fan-out load test (requires API + worker running)."
+    )
+    parser.add_argument("--clients", type=int, default=200, help="Concurrent SSE viewers.")
+    parser.add_argument("--turns", type=int, default=3, help="Turns each viewer waits for.")
+    parser.add_argument(
+        "--debate-id", default=None, help="Watch an already running debate instead of starting one."
+    )
+    parser.add_argument("--topic", default="Is remote work better than office work?")
+    parser.add_argument("--timeout-seconds", type=float, default=180.0)
+    parser.add_argument("--connect-grace-seconds", type=float, default=2.0)
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    args = parser.parse_args()
+
+    report = asyncio.run(_main_async(args))
+    if args.json:
+        print(json.dumps(report))
+    else:
+        for key, value in report.items():
+            print(f"{key}: {value}")
+    return 0 if report["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main())
+    except Exception as exc:
+        print(f"load_sse failed: {exc}", file=sys.stderr)
+        raise
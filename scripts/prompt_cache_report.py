@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import Any
+
+import httpx
+
+from llm_debate.runtime.steps import prompt_cache_hit_ratio
+
+
+def _api_base_url() -> str:
+    raw = os.getenv("API_BASE_URL", "http://localhost:8000").rstrip("/")
+    return raw
+
+
+def _debate_report(payload: dict[str, Any]) -> dict[str, Any]:
+    debate = payload["debate"]
+    metadata = [turn.get("metadata") or {} for turn in payload.get("turns", [])]
+    reported = [
+        meta
+        for meta in metadata
+        if isinstance(meta.get("prompt_cache_hit_tokens"), int)
+        and isinstance(meta.get("prompt_cache_miss_tokens"), int)
+    ]
+    ratio = prompt_cache_hit_ratio(reported)
+    return {
+        "debate_id": debate["id"],
+        "prompt_version": (debate.get("settings") or {}).get("prompt_version"),
+        "turns": len(metadata),
+        "turns_with_cache_usage": len(reported),
+        "prompt_cache_hit_tokens": sum(m["prompt_cache_hit_tokens"] for m in reported),
+        "prompt_cache_miss_tokens": sum(m["prompt_cache_miss_tokens"] for m in reported),
+        "cache_hit_ratio": round(ratio, 4) if ratio is not None else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Report DeepSeek prompt cache hit ratio per debate (requires API running)."
+    )
+    parser.add_argument(
+        "--debate-id",
+        action="append",
+        default=None,
+        help="Debate to report on (repeatable). Defaults to the most recently updated debates.",
+    )
+    parser.add_argument("--limit", type=int, default=10, help="Debates to report without --debate-id.")
+    parser.add_argument("--json", action="store_true", help="Print one JSON object per debate.")
+    args = parser.parse_args()
+
+    api = _api_base_url()
+    with httpx.Client(timeout=30.0, trust_env=False) as client:
+        debate_ids: list[str] = args.debate_id or []
+        if not debate_ids:
+            listing = client.get(f"{api}/debates", params={"limit": args.limit})
+            listing.raise_for_status()
+            debate_ids = [str(item["id"]) for item in listing.json()["items"]]
+
+        reports: list[dict[str, Any]] = []
+        for debate_id in debate_ids:
+            r = client.get(f"{api}/debates/{debate_id}")
+            r.raise_for_status()
+            reports.append(_debate_report(r.json()))
+
+    for report in reports:
+        if args.json:
+            print(json.dumps(report))
+            continue
+        ratio = report["cache_hit_ratio"]
+        ratio_text = f"{ratio:.1%}" if ratio is not None else "n/a"
+        print(
+            f"{report['debate_id']}  prompt_version={report['prompt_version']}  "
+            f"turns={report['turns']}  hit={report['prompt_cache_hit_tokens']}  "
+            f"miss={report['prompt_cache_miss_tokens']}  hit_ratio={ratio_text}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main())
+    except Exception as exc:
+        print(f"prompt_cache_report failed: {exc}", file=sys.stderr)
+        raise
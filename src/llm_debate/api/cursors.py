@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import base64
+from datetime import datetime
+import json
+import uuid
+
+
+def encode_list_cursor(updated_at: datetime, debate_id: uuid.UUID) -> str:
+    """Encode the (updated_at, id) keyset position of the last listed debate as an opaque token."""
+
+    raw = json.dumps({"u": updated_at.isoformat(), "i": str(debate_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_list_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a token from `encode_list_cursor`, raising ValueError when it is malformed."""
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        updated_at = datetime.fromisoformat(payload["u"])
+        debate_id = uuid.UUID(payload["i"])
+    except (KeyError, TypeError, UnicodeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if updated_at.tzinfo is None:
+        raise ValueError("Invalid cursor")
+    return updated_at, debate_id
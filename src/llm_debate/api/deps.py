@@ -2,12 +2,21 @@ from __future__ import annotations
 
 from collections.abc import Generator
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
 
-from llm_debate.db.engine import create_db_engine, create_sessionmaker, session_scope
+from llm_debate.db.engine import (
+    create_async_db_engine,
+    create_async_sessionmaker,
+    create_db_engine,
+    create_sessionmaker,
+    session_scope,
+)
 
 _ENGINE = create_db_engine()
 _SESSIONMAKER: sessionmaker[Session] = create_sessionmaker(_ENGINE)
+_ASYNC_ENGINE = create_async_db_engine()
+_ASYNC_SESSIONMAKER: async_sessionmaker[AsyncSession] = create_async_sessionmaker(_ASYNC_ENGINE)
 
 
 def get_sessionmaker() -> sessionmaker[Session]:
@@ -16,6 +25,12 @@ def get_sessionmaker() -> sessionmaker[Session]:
     return _SESSIONMAKER
 
 
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Return the process-wide async SQLAlchemy sessionmaker (used by streaming endpoints)."""
+
+    return _ASYNC_SESSIONMAKER
+
+
 def get_db() -> Generator[Session, None, None]:
     """Provide a SQLAlchemy session with commit/rollback semantics."""
 
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+import csv
+import io
+from typing import Any, Literal
+
+import orjson
+
+ExportFormat = Literal["ndjson", "csv"]
+
+# One export row per turn, carrying the debate it belongs to; debates without turns export one row
+# with empty turn columns. `scripts/import_debates.py` loads the NDJSON form back.
+EXPORT_COLUMNS = (
+    "debate_id",
+    "topic",
+    "status",
+    "stop_reason",
+    "settings",
+    "debate_created_at",
+    "round",
+    "actor",
+    "content",
+    "model",
+    "usage",
+    "metadata",
+    "turn_created_at",
+)
+
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def ndjson_chunk(rows: Sequence[Mapping[Any, Any]]) -> bytes:
+    """Encode rows as newline-delimited JSON."""
+
+    return b"".join(orjson.dumps(dict(row), option=orjson.OPT_APPEND_NEWLINE) for row in rows)
+
+
+def csv_header() -> bytes:
+    return csv_chunk([dict(zip(EXPORT_COLUMNS, EXPORT_COLUMNS, strict=True))])
+
+
+def csv_chunk(rows: Sequence[Mapping[Any, Any]]) -> bytes:
+    """Encode rows as CSV lines in `EXPORT_COLUMNS` order; JSON columns are written as JSON."""
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_csv_value(row[column]) for column in EXPORT_COLUMNS])
+    return buffer.getvalue().encode("utf-8")
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, dict | list):
+        return orjson.dumps(value).decode("utf-8")
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from llm_debate.api.routes.debates import router as debates_router
+from llm_debate.core.metrics import render_metrics
+from llm_debate.core.tracing import TraceRequestsMiddleware, configure_tracing, tracing_enabled
 
-app = FastAPI(title="llm-debate API")
+configure_tracing("llm-debate-api")
+
+app = FastAPI(title="llm-debate API", default_response_class=ORJSONResponse)
+if tracing_enabled():
+    app.add_middleware(TraceRequestsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
@@ -14,3 +21,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 app.include_router(debates_router, prefix="/debates", tags=["debates"])
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -1,30 +1,53 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
-import json
-import time
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
 import uuid
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from celery import group
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
-from sqlalchemy import and_, or_, select
+import orjson
+from sqlalchemy import Row, and_, case, insert, or_, select, tuple_
 from sqlalchemy.orm import Session
-
-from llm_debate.api.deps import get_db, get_sessionmaker
+from sqlalchemy.orm.exc import StaleDataError
+
+from llm_debate.api.cursors import decode_list_cursor, encode_list_cursor
+from llm_debate.api.deps import get_async_sessionmaker, get_db
+from llm_debate.api.export import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    csv_chunk,
+    csv_header,
+    ndjson_chunk,
+)
 from llm_debate.api.schemas import (
+    DebateBatchCreate,
+    DebateBatchOut,
     DebateCreate,
     DebateListItem,
+    DebateListPage,
     DebateOut,
     DebateWithTurns,
     StartResumeResponse,
-    TurnOut,
+    TurnField,
 )
+from llm_debate.core.metrics import SSE_ACTIVE_STREAMS
 from llm_debate.core.settings import load_settings
 from llm_debate.core.time import utcnow
+from llm_debate.db.debate_writes import build_set_status_unless_finished_stmt
 from llm_debate.db.models import Debate, Turn
+from llm_debate.events.bus import get_event_bus
+from llm_debate.events.sse import (
+    SSE_HEARTBEAT,
+    get_turn_frame_cache,
+    sse_frame,
+    sse_frame_from_json,
+)
 from llm_debate.runtime.cursor import completed_rounds_from_cursor
 from llm_debate.runtime.status import is_terminal
+from llm_debate.runtime.turns import TurnOut, encode_turn
 from llm_debate.worker.tasks import advance_debate
 
 router = APIRouter()
@@ -42,47 +65,163 @@ def _default_settings() -> dict[str, Any]:
         "max_total_output_tokens": settings.debate_max_total_output_tokens,
         "max_tokens_debater": settings.debate_max_tokens_debater,
         "max_tokens_judge": settings.debate_max_tokens_judge,
+        "stream_output": settings.debate_stream_output,
+        "speculative": settings.debate_speculative_steps,
+        "cache_policy": settings.debate_cache_policy,
+        "context_budget_tokens": settings.debate_context_budget_tokens,
+        "no_new_arguments_streak": settings.debate_no_new_arguments_streak,
     }
 
 
-def _turn_out(turn: Turn) -> TurnOut:
-    return TurnOut(
-        id=turn.id,
-        debate_id=turn.debate_id,
-        round=turn.round,
-        actor=turn.actor,
-        content=turn.content,
-        model=turn.model,
-        usage=turn.usage,
-        metadata=turn.meta,
-        created_at=turn.created_at,
+def _replay_columns() -> tuple[Any, ...]:
+    """Columns that rebuild a turn's payload; heavy ones are only read when none was stored."""
+
+    legacy = Turn.payload_json.is_(None)
+    return (
+        Turn.id,
+        Turn.debate_id,
+        Turn.round,
+        Turn.actor,
+        Turn.created_at,
+        Turn.payload_json,
+        case((legacy, Turn.content)).label("content"),
+        case((legacy, Turn.model)).label("model"),
+        case((legacy, Turn.usage)).label("usage"),
+        case((legacy, Turn.meta)).label("metadata"),
+    )
+
+
+def _turn_payload(row: Row[Any]) -> bytes:
+    if row.payload_json is not None:
+        return bytes(row.payload_json)
+    turn = TurnOut(
+        id=row.id,
+        debate_id=row.debate_id,
+        round=row.round,
+        actor=row.actor,
+        content=row.content,
+        model=row.model,
+        usage=row.usage,
+        metadata=row.metadata,
+        created_at=row.created_at,
     )
+    return encode_turn(turn)
 
 
-@router.get("", response_model=list[DebateListItem])
+@router.get("", response_model=DebateListPage)
 def list_debates(
     limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, description="`next_cursor` of the previous page."),
+    status_filter: list[str] | None = Query(default=None, alias="status"),
+    stop_reason: list[str] | None = Query(default=None),
+    topic_prefix: str | None = Query(default=None, min_length=1, max_length=500),
     db: Session = Depends(get_db),
-) -> list[DebateListItem]:
-    debates = list(db.execute(select(Debate).order_by(Debate.updated_at.desc()).limit(limit)).scalars())
-    items: list[DebateListItem] = []
-    for d in debates:
-        completed_rounds = completed_rounds_from_cursor(next_round=int(d.next_round))
-        items.append(
-            DebateListItem(
-                id=d.id,
-                topic=d.topic,
-                status=d.status,
-                next_round=int(d.next_round),
-                next_actor=d.next_actor,
-                stop_reason=d.stop_reason,
-                last_error=d.last_error,
-                completed_rounds=completed_rounds,
-                created_at=d.created_at,
-                updated_at=d.updated_at,
-            )
+) -> DebateListPage:
+    stmt = select(
+        Debate.id,
+        Debate.topic,
+        Debate.status,
+        Debate.next_round,
+        Debate.next_actor,
+        Debate.stop_reason,
+        Debate.last_error,
+        Debate.created_at,
+        Debate.updated_at,
+    )
+    if status_filter:
+        stmt = stmt.where(Debate.status.in_(status_filter))
+    if stop_reason:
+        stmt = stmt.where(Debate.stop_reason.in_(stop_reason))
+    if topic_prefix:
+        stmt = stmt.where(Debate.topic.startswith(topic_prefix, autoescape=True))
+    if cursor is not None:
+        try:
+            after_updated_at, after_id = decode_list_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            ) from exc
+        stmt = stmt.where(tuple_(Debate.updated_at, Debate.id) < (after_updated_at, after_id))
+
+    # Keyset pagination: (updated_at, id) is unique and indexed, so every page is an index range
+    # scan no matter how deep it is. One extra row tells whether another page exists.
+    rows = db.execute(
+        stmt.order_by(Debate.updated_at.desc(), Debate.id.desc()).limit(limit + 1)
+    ).all()
+    page = rows[:limit]
+    items = [
+        DebateListItem(
+            id=r.id,
+            topic=r.topic,
+            status=r.status,
+            next_round=int(r.next_round),
+            next_actor=r.next_actor,
+            stop_reason=r.stop_reason,
+            last_error=r.last_error,
+            completed_rounds=completed_rounds_from_cursor(next_round=int(r.next_round)),
+            created_at=r.created_at,
+            updated_at=r.updated_at,
         )
-    return items
+        for r in page
+    ]
+    next_cursor = (
+        encode_list_cursor(page[-1].updated_at, page[-1].id) if len(rows) > limit else None
+    )
+    return DebateListPage(items=items, next_cursor=next_cursor)
+
+
+_EXPORT_BATCH_SIZE = 1000
+
+
+# Registered before `/{debate_id}` so "export" is not parsed as a debate id.
+@router.get("/export")
+async def export_debates(
+    export_format: ExportFormat = Query(default="ndjson", alias="format"),
+    status_filter: list[str] | None = Query(default=None, alias="status"),
+    created_from: datetime | None = Query(default=None, description="Inclusive lower bound."),
+    created_to: datetime | None = Query(default=None, description="Exclusive upper bound."),
+) -> StreamingResponse:
+    stmt = (
+        select(
+            Debate.id.label("debate_id"),
+            Debate.topic,
+            Debate.status,
+            Debate.stop_reason,
+            Debate.settings,
+            Debate.created_at.label("debate_created_at"),
+            Turn.round,
+            Turn.actor,
+            Turn.content,
+            Turn.model,
+            Turn.usage,
+            Turn.meta.label("metadata"),
+            Turn.created_at.label("turn_created_at"),
+        )
+        .outerjoin(Turn, Turn.debate_id == Debate.id)
+        .order_by(Debate.created_at, Debate.id, Turn.created_at, Turn.id)
+    )
+    if status_filter:
+        stmt = stmt.where(Debate.status.in_(status_filter))
+    if created_from is not None:
+        stmt = stmt.where(Debate.created_at >= created_from)
+    if created_to is not None:
+        stmt = stmt.where(Debate.created_at < created_to)
+    encode = ndjson_chunk if export_format == "ndjson" else csv_chunk
+    sessionmaker = get_async_sessionmaker()
+
+    async def iter_rows() -> AsyncIterator[bytes]:
+        if export_format == "csv":
+            yield csv_header()
+        # A server-side cursor keeps memory flat: one batch of rows is held at a time.
+        async with sessionmaker() as db:
+            result = await db.stream(stmt.execution_options(yield_per=_EXPORT_BATCH_SIZE))
+            async for partition in result.mappings().partitions():
+                yield encode(partition)
+
+    headers = {"Content-Disposition": f'attachment; filename="debates.{export_format}"'}
+    return StreamingResponse(
+        iter_rows(), media_type=EXPORT_MEDIA_TYPES[export_format], headers=headers
+    )
 
 
 @router.post("", response_model=DebateOut, status_code=status.HTTP_201_CREATED)
@@ -103,6 +242,68 @@ def create_debate(payload: DebateCreate, db: Session = Depends(get_db)) -> Debat
     return DebateOut.model_validate(debate, from_attributes=True)
 
 
+@router.post(":batch", response_model=DebateBatchOut, status_code=status.HTTP_201_CREATED)
+def create_debates_batch(
+    payload: DebateBatchCreate,
+    x_ui_language: str | None = Header(default=None, alias="X-UI-Language"),
+    db: Session = Depends(get_db),
+) -> DebateBatchOut:
+    defaults = _default_settings()
+    if payload.start and x_ui_language in {"zh-Hant", "zh-Hans", "en"}:
+        defaults["output_language"] = x_ui_language
+    now = utcnow()
+    rows: list[dict[str, Any]] = []
+    for item in payload.debates:
+        merged_settings = {**defaults, **item.settings.model_dump(exclude_none=True)}
+        if payload.start:
+            merged_settings["started_at"] = now.isoformat()
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "topic": item.topic,
+                "status": "running" if payload.start else "created",
+                "settings": merged_settings,
+                "next_round": 1,
+                "next_actor": "debater_a",
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+
+    # One multi-row INSERT (batched by SQLAlchemy's insertmanyvalues) and a single commit;
+    # commit before enqueueing so workers never see a missing or uncommitted debate.
+    db.execute(insert(Debate), rows)
+    db.commit()
+
+    ids = [row["id"] for row in rows]
+    if payload.start:
+        group(advance_debate.s(str(debate_id)) for debate_id in ids).apply_async()
+    return DebateBatchOut(ids=ids, enqueued=payload.start)
+
+
+def _flush_or_conflict(db: Session) -> None:
+    """Write pending debate changes; a version bumped by a concurrent writer is a 409."""
+
+    try:
+        db.flush()
+    except StaleDataError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Debate was modified concurrently; retry the request",
+        ) from exc
+
+
+def _set_status_unless_finished(
+    db: Session, debate_id: uuid.UUID, values: dict[str, Any]
+) -> None:
+    # One compare-and-set UPDATE: no read-modify-write window for a worker commit to slip into.
+    stmt = build_set_status_unless_finished_stmt(debate_id=debate_id, values=values)
+    if db.execute(stmt).scalar_one_or_none() is not None:
+        return
+    if db.scalar(select(Debate.id).where(Debate.id == debate_id)) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Debate not found")
+
+
 @router.delete("/{debate_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_debate(debate_id: uuid.UUID, db: Session = Depends(get_db)) -> Response:
     debate = db.get(Debate, debate_id)
@@ -110,23 +311,122 @@ def delete_debate(debate_id: uuid.UUID, db: Session = Depends(get_db)) -> Respon
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Debate not found")
 
     db.delete(debate)
+    _flush_or_conflict(db)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@router.get("/{debate_id}", response_model=DebateWithTurns)
-def get_debate(debate_id: uuid.UUID, db: Session = Depends(get_db)) -> DebateWithTurns:
+_TURN_FIELD_COLUMNS: dict[TurnField, Any] = {
+    "content": Turn.content,
+    "model": Turn.model,
+    "usage": Turn.usage,
+    "metadata": Turn.meta,
+}
+
+
+def _parse_turn_fields(raw: str | None) -> list[TurnField]:
+    if raw is None:
+        return list(_TURN_FIELD_COLUMNS)
+    requested = [part.strip() for part in raw.split(",") if part.strip()]
+    unknown = sorted(set(requested) - set(_TURN_FIELD_COLUMNS))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown turn fields: {', '.join(unknown)}",
+        )
+    return [name for name in _TURN_FIELD_COLUMNS if name in requested]
+
+
+@router.get("/{debate_id}", response_model=DebateWithTurns, response_model_exclude_unset=True)
+def get_debate(
+    debate_id: uuid.UUID,
+    after_turn: uuid.UUID | None = Query(default=None, description="Turn id to start after."),
+    limit: int | None = Query(default=None, ge=1, le=1000, description="Max turns to return."),
+    latest: int | None = Query(
+        default=None, ge=1, le=1000, description="Return only the most recent N turns."
+    ),
+    fields: str | None = Query(
+        default=None,
+        description="Comma-separated turn fields to include (content, model, usage, metadata).",
+    ),
+    summary_only: bool = Query(default=False, description="Return the debate without turns."),
+    db: Session = Depends(get_db),
+) -> DebateWithTurns | Response:
+    if latest is not None and (after_turn is not None or limit is not None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="latest cannot be combined with after_turn or limit",
+        )
+    turn_fields = _parse_turn_fields(fields)
+
     debate = db.get(Debate, debate_id)
     if debate is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Debate not found")
+    debate_out = DebateOut.model_validate(debate, from_attributes=True)
+    turn_count = int(debate.turn_count)
+    if summary_only:
+        return DebateWithTurns(
+            debate=debate_out, turns=[], turn_count=turn_count, next_after_turn=None
+        )
 
-    turns = list(
-        db.execute(
-            select(Turn).where(Turn.debate_id == debate_id).order_by(Turn.created_at, Turn.id)
-        ).scalars()
-    )
+    if fields is None:
+        # Whole turns are spliced into the response from their stored payloads.
+        stmt = select(*_replay_columns())
+    else:
+        # Select only the requested columns: content/usage/metadata dominate row size.
+        stmt = select(
+            Turn.id,
+            Turn.debate_id,
+            Turn.round,
+            Turn.actor,
+            Turn.created_at,
+            *(_TURN_FIELD_COLUMNS[name].label(name) for name in turn_fields),
+        )
+    stmt = stmt.where(Turn.debate_id == debate_id)
+    if after_turn is not None:
+        anchor = db.execute(
+            select(Turn.created_at).where(Turn.id == after_turn, Turn.debate_id == debate_id)
+        ).scalar_one_or_none()
+        if anchor is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Unknown after_turn"
+            )
+        stmt = stmt.where(tuple_(Turn.created_at, Turn.id) > (anchor, after_turn))
+
+    if latest is not None:
+        rows = list(
+            db.execute(
+                stmt.order_by(Turn.created_at.desc(), Turn.id.desc()).limit(latest)
+            ).all()
+        )
+        rows.reverse()
+        has_more = False
+    else:
+        stmt = stmt.order_by(Turn.created_at, Turn.id)
+        rows = list(db.execute(stmt if limit is None else stmt.limit(limit + 1)).all())
+        has_more = limit is not None and len(rows) > limit
+        rows = rows[:limit]
+
+    next_after_turn = rows[-1].id if has_more else None
+    if fields is None:
+        body = b"".join(
+            [
+                b'{"debate":',
+                orjson.dumps(debate_out.model_dump(mode="json")),
+                b',"turns":[',
+                b",".join(_turn_payload(row) for row in rows),
+                b'],"turn_count":',
+                orjson.dumps(turn_count),
+                b',"next_after_turn":',
+                orjson.dumps(str(next_after_turn) if next_after_turn is not None else None),
+                b"}",
+            ]
+        )
+        return Response(content=body, media_type="application/json")
     return DebateWithTurns(
-        debate=DebateOut.model_validate(debate, from_attributes=True),
-        turns=[_turn_out(t) for t in turns],
+        debate=debate_out,
+        turns=[TurnOut(**row._mapping) for row in rows],
+        turn_count=turn_count,
+        next_after_turn=next_after_turn,
     )
 
 
@@ -151,7 +451,7 @@ def start_debate(
     debate.settings = next_settings
     debate.updated_at = utcnow()
     db.add(debate)
-    db.flush()
+    _flush_or_conflict(db)
     advance_debate.delay(str(debate.id))
     return StartResumeResponse(enqueued=True)
 
@@ -178,39 +478,24 @@ def resume_debate(
     debate.settings = next_settings
     debate.updated_at = utcnow()
     db.add(debate)
-    db.flush()
+    _flush_or_conflict(db)
     advance_debate.delay(str(debate.id))
     return StartResumeResponse(enqueued=True)
 
 
 @router.post("/{debate_id}/stop", status_code=status.HTTP_204_NO_CONTENT)
 def stop_debate(debate_id: uuid.UUID, db: Session = Depends(get_db)) -> Response:
-    debate = db.get(Debate, debate_id)
-    if debate is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Debate not found")
-
-    if debate.status in {"completed", "failed", "canceled"}:
-        return Response(status_code=status.HTTP_204_NO_CONTENT)
-
-    debate.status = "stopping"
-    debate.updated_at = utcnow()
-    db.add(debate)
+    _set_status_unless_finished(db, debate_id, {"status": "stopping", "updated_at": utcnow()})
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.post("/{debate_id}/cancel", status_code=status.HTTP_204_NO_CONTENT)
 def cancel_debate(debate_id: uuid.UUID, db: Session = Depends(get_db)) -> Response:
-    debate = db.get(Debate, debate_id)
-    if debate is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Debate not found")
-
-    if debate.status in {"completed", "failed", "canceled"}:
-        return Response(status_code=status.HTTP_204_NO_CONTENT)
-
-    debate.status = "canceled"
-    debate.stop_reason = "canceled"
-    debate.updated_at = utcnow()
-    db.add(debate)
+    _set_status_unless_finished(
+        db,
+        debate_id,
+        {"status": "canceled", "stop_reason": "canceled", "updated_at": utcnow()},
+    )
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -238,74 +523,94 @@ def retry_debate(
     debate.settings = next_settings
     debate.updated_at = utcnow()
     db.add(debate)
-    db.flush()
+    _flush_or_conflict(db)
     advance_debate.delay(str(debate.id))
     return StartResumeResponse(enqueued=True)
 
 
-def _sse_format(event: str, data: dict[str, Any], event_id: str | None) -> str:
-    body = ""
-    if event_id is not None:
-        body += f"id: {event_id}\n"
-    body += f"event: {event}\n"
-    body += f"data: {json.dumps(data, separators=(',', ':'))}\n\n"
-    return body
+_REPLAY_BATCH_SIZE = 100
 
 
 @router.get("/{debate_id}/events")
-def stream_debate_events(
+async def stream_debate_events(
+    request: Request,
     debate_id: uuid.UUID,
     last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
     after: str | None = Query(default=None, description="Turn id to start after"),
 ) -> StreamingResponse:
     start_after = after or last_event_id
-    sessionmaker = get_sessionmaker()
-
-    def iter_events() -> Iterator[bytes]:
-        last_seen_created_at = None
-        last_seen_turn_id: uuid.UUID | None = None
-        with sessionmaker() as db:
-            debate = db.get(Debate, debate_id)
-            if debate is None:
-                payload = _sse_format("error", {"detail": "Debate not found"}, None)
-                yield payload.encode("utf-8")
-                return
-
-            if start_after is not None:
-                try:
-                    turn = db.get(Turn, uuid.UUID(start_after))
-                except ValueError:
-                    turn = None
-                if turn is not None and turn.debate_id == debate_id:
-                    last_seen_created_at = turn.created_at
-                    last_seen_turn_id = turn.id
-
-        while True:
-            with sessionmaker() as db:
+    sessionmaker = get_async_sessionmaker()
+    heartbeat_seconds = load_settings().sse_heartbeat_seconds
+    frames = get_turn_frame_cache()
+
+    async def iter_events() -> AsyncIterator[bytes]:
+        # Subscribe before the catch-up query so turns committed in between are not lost;
+        # duplicates are filtered by turn id below.
+        subscription = get_event_bus().subscribe(debate_id)
+        SSE_ACTIVE_STREAMS.inc()
+        try:
+            delivered: set[str] = set()
+            async with sessionmaker() as db:
+                found = await db.scalar(select(Debate.id).where(Debate.id == debate_id))
+                if found is None:
+                    yield sse_frame("error", {"detail": "Debate not found"}, None)
+                    return
+
+                # Replay stored payloads straight off a server-side cursor. Only turns written
+                # before `payload_json` existed read their columns and get encoded here.
                 query = (
-                    select(Turn)
+                    select(*_replay_columns())
                     .where(Turn.debate_id == debate_id)
                     .order_by(Turn.created_at, Turn.id)
+                    .execution_options(yield_per=_REPLAY_BATCH_SIZE)
                 )
-                if last_seen_created_at is not None and last_seen_turn_id is not None:
-                    query = query.where(
-                        or_(
-                            Turn.created_at > last_seen_created_at,
-                            and_(
-                                Turn.created_at == last_seen_created_at,
-                                Turn.id > last_seen_turn_id,
-                            ),
+                if start_after is not None:
+                    try:
+                        after_id: uuid.UUID | None = uuid.UUID(start_after)
+                    except ValueError:
+                        after_id = None
+                    after_created_at = None
+                    if after_id is not None:
+                        after_created_at = await db.scalar(
+                            select(Turn.created_at).where(
+                                Turn.id == after_id, Turn.debate_id == debate_id
+                            )
+                        )
+                    if after_created_at is not None:
+                        query = query.where(
+                            or_(
+                                Turn.created_at > after_created_at,
+                                and_(Turn.created_at == after_created_at, Turn.id > after_id),
+                            )
                         )
-                    )
-                new_turns = list(db.execute(query).scalars())
-
-                for t in new_turns:
-                    last_seen_created_at = t.created_at
-                    last_seen_turn_id = t.id
-                    turn_payload = _turn_out(t).model_dump(mode="json")
-                    yield _sse_format("turn", turn_payload, str(t.id)).encode("utf-8")
 
-            time.sleep(1.0)
+                async for row in await db.stream(query):
+                    turn_id = str(row.id)
+                    delivered.add(turn_id)
+                    if row.payload_json is not None:
+                        yield sse_frame_from_json("turn", row.payload_json, turn_id)
+                        continue
+                    frame = frames.get(turn_id)
+                    if frame is None:
+                        frame = sse_frame_from_json("turn", _turn_payload(row), turn_id)
+                        frames.put(turn_id, frame)
+                    yield frame
+
+            while True:
+                message = await subscription.get(timeout=heartbeat_seconds)
+                if message is None:
+                    if await request.is_disconnected():
+                        return
+                    yield SSE_HEARTBEAT
+                    continue
+                if message.event_id is not None and message.event_id in delivered:
+                    continue
+                if message.event == "turn" and message.event_id is not None:
+                    frames.put(message.event_id, message.frame)
+                yield message.frame
+        finally:
+            SSE_ACTIVE_STREAMS.dec()
+            subscription.close()
 
     headers = {"Cache-Control": "no-cache", "Connection": "keep-alive"}
     return StreamingResponse(iter_events(), media_type="text/event-stream", headers=headers)
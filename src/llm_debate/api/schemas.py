@@ -6,11 +6,21 @@ import uuid
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from llm_debate.runtime.turns import TurnOut
+
 DebaterSide = Literal["pro", "con"]
-JudgeMode = Literal["end"]
+JudgeMode = Literal["end", "panel", "per_round"]
+CachePolicy = Literal["off", "read_write", "refresh"]
 OutputLanguage = Literal["zh-Hant", "zh-Hans", "en"]
 
 
+class JudgePanelistIn(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    model: str | None = Field(default=None, min_length=1)
+    temperature: float | None = Field(default=None, ge=0, le=2)
+
+
 class DebateSettingsIn(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -35,7 +45,52 @@ class DebateSettingsIn(BaseModel):
     model_debater: str | None = Field(default=None, min_length=1)
     model_judge: str | None = Field(default=None, min_length=1)
     judge_mode: JudgeMode | None = Field(
-        default=None, description='Judge scheduling mode (default "end").'
+        default=None,
+        description=(
+            'Judge scheduling mode: "end" (default), "panel" (concurrent final judges) or '
+            '"per_round" (also judge each round and stop once debaters run dry).'
+        ),
+    )
+    judge_panel: list[JudgePanelistIn] | None = Field(
+        default=None,
+        min_length=1,
+        max_length=9,
+        description=(
+            'Judges for "panel" mode (defaults to copies of the judge model at spread '
+            "temperatures)."
+        ),
+    )
+    no_new_arguments_streak: int | None = Field(
+        default=None,
+        ge=1,
+        le=100,
+        description='"per_round" mode: stop after this many consecutive rounds with nothing new.',
+    )
+    stream_output: bool | None = Field(
+        default=None, description="Stream debater output over SSE as `turn_delta` events."
+    )
+    speculative: bool | None = Field(
+        default=None,
+        description=(
+            "Start the next step's LLM call before this turn is persisted (tokens are wasted "
+            "when a stop or cancel discards it)."
+        ),
+    )
+    cache_policy: CachePolicy | None = Field(
+        default=None,
+        description=(
+            'LLM response cache: "off" (default), "read_write" (reuse identical requests) or '
+            '"refresh" (call the API and overwrite cached responses).'
+        ),
+    )
+    context_budget_tokens: int | None = Field(
+        default=None,
+        ge=0,
+        le=1_000_000,
+        description=(
+            "Transcript token budget before older rounds are summarized (0, the default, "
+            "disables)."
+        ),
     )
 
 
@@ -44,6 +99,16 @@ class DebateCreate(BaseModel):
     settings: DebateSettingsIn = Field(default_factory=DebateSettingsIn)
 
 
+class DebateBatchCreate(BaseModel):
+    debates: list[DebateCreate] = Field(min_length=1, max_length=5000)
+    start: bool = Field(default=False, description="Start every created debate immediately.")
+
+
+class DebateBatchOut(BaseModel):
+    ids: list[uuid.UUID]
+    enqueued: bool
+
+
 class DebateOut(BaseModel):
     id: uuid.UUID
     topic: str
@@ -70,21 +135,25 @@ class DebateListItem(BaseModel):
     updated_at: datetime
 
 
-class TurnOut(BaseModel):
-    id: uuid.UUID
-    debate_id: uuid.UUID
-    round: int
-    actor: str
-    content: str
-    model: str | None
-    usage: dict[str, Any]
-    metadata: dict[str, Any]
-    created_at: datetime
+class DebateListPage(BaseModel):
+    items: list[DebateListItem]
+    next_cursor: str | None = Field(
+        default=None, description="Pass as `cursor` to fetch the next page; null on the last page."
+    )
+
+
+# Turn fields that `GET /debates/{id}?fields=` can leave out; the rest are always returned.
+TurnField = Literal["content", "model", "usage", "metadata"]
 
 
 class DebateWithTurns(BaseModel):
     debate: DebateOut
     turns: list[TurnOut]
+    turn_count: int | None = None
+    next_after_turn: uuid.UUID | None = Field(
+        default=None,
+        description="Pass as `after_turn` to fetch the next page; null when no turns remain.",
+    )
 
 
 class StartResumeResponse(BaseModel):
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+
+# Prefork Celery children (and multi-worker uvicorn) each hold their own samples. Setting
+# PROMETHEUS_MULTIPROC_DIR to an empty directory makes every process write there and the
+# exporters below aggregate across processes.
+_MULTIPROCESS_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+_FAST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_LLM_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0)
+
+STEP_PHASE_SECONDS = Histogram(
+    "llm_debate_step_phase_seconds",
+    "Time spent in each phase of a debate step that reached the LLM call.",
+    ["phase"],
+    buckets=(*_FAST_BUCKETS, 30.0, 60.0, 120.0),
+)
+STEP_OUTCOMES = Counter(
+    "llm_debate_step_outcomes",
+    "Debate step attempts by outcome (continue, done, conflict).",
+    ["outcome"],
+)
+TASK_QUEUE_LAG_SECONDS = Histogram(
+    "llm_debate_task_queue_lag_seconds",
+    "Delay between publishing an advance_debate task (or its ETA) and a worker starting it.",
+    buckets=(*_FAST_BUCKETS, 30.0, 60.0),
+)
+DEBATE_VERSION_CONFLICTS = Counter(
+    "llm_debate_debate_version_conflicts",
+    "Versioned debate writes that lost to a concurrent writer, by step phase.",
+    ["phase"],
+)
+STALLED_DEBATES_RECOVERED = Counter(
+    "llm_debate_stalled_debates_recovered",
+    "Stalled debates recovered by the reaper (requeued running, finalized stopping).",
+    ["action"],
+)
+
+LLM_REQUEST_SECONDS = Histogram(
+    "llm_debate_llm_request_seconds",
+    "Latency of one chat completion attempt.",
+    ["model", "outcome"],
+    buckets=_LLM_BUCKETS,
+)
+LLM_TOKENS = Counter(
+    "llm_debate_llm_tokens",
+    "Tokens reported by the provider.",
+    ["model", "kind"],
+)
+LLM_RETRIES = Counter(
+    "llm_debate_llm_retries",
+    "Chat completion attempts retried in-process after a transient error.",
+    ["model", "error"],
+)
+
+SSE_ACTIVE_STREAMS = Gauge(
+    "llm_debate_sse_active_streams",
+    "Open debate event streams.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "llm_debate_db_pool_checkout_seconds",
+    "Time to check a connection out of the SQLAlchemy pool (includes connecting).",
+    ["pool"],
+    buckets=_FAST_BUCKETS,
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "llm_debate_db_pool_checked_out",
+    "Connections currently checked out of the SQLAlchemy pool.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+
+def _registry() -> CollectorRegistry:
+    if os.environ.get(_MULTIPROCESS_ENV):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+        return registry
+    return REGISTRY
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Return the Prometheus text exposition of this process (or all processes) and its type."""
+
+    return generate_latest(_registry()), CONTENT_TYPE_LATEST
+
+
+def start_metrics_server(port: int) -> None:
+    """Serve `/metrics` on `port` from a background thread (for processes without an API)."""
+
+    start_http_server(port, registry=_registry())
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop a finished process's live gauges in multiprocess mode."""
+
+    if os.environ.get(_MULTIPROCESS_ENV):
+        multiprocess.mark_process_dead(pid)  # type: ignore[no-untyped-call]
@@ -26,6 +26,75 @@ class Settings(BaseSettings):
     debate_max_total_output_tokens: int = 8000
     debate_max_tokens_debater: int = 600
     debate_max_tokens_judge: int = 400
+    # Output cap of the lightweight judge run after each round in `judge_mode="per_round"`.
+    debate_max_tokens_round_judge: int = 150
+    # Judges asked concurrently when `judge_mode` is "panel" and no `judge_panel` is given.
+    debate_judge_panel_size: int = 3
+    # Consecutive stale rounds (per the round judge) that end a `judge_mode="per_round"` debate.
+    debate_no_new_arguments_streak: int = 2
+    debate_stream_output: bool = True
+    # Start the predictable next step's LLM call as soon as a debater turn is generated.
+    debate_speculative_steps: bool = False
+    debate_cache_policy: Literal["off", "read_write", "refresh"] = "off"
+    # Estimated prompt tokens of transcript kept verbatim before older rounds are summarized.
+    # 0 (default) disables compaction.
+    debate_context_budget_tokens: int = 0
+    debate_max_tokens_summary: int = 500
+
+    # LLM HTTP pool and per-process concurrency caps (0 disables a cap).
+    llm_max_connections: int = 100
+    llm_max_keepalive_connections: int = 50
+    llm_keepalive_expiry_seconds: float = 60.0
+    llm_request_timeout_seconds: float = 600.0
+    llm_max_concurrency: int = 200
+    llm_max_concurrency_per_model: int = 100
+
+    # Shared per-model token buckets consulted before every LLM call (0 disables a limit).
+    llm_rate_limit_rpm: int = 0
+    llm_rate_limit_tpm: int = 0
+    llm_rate_limit_backend: Literal["redis", "memory"] = "redis"
+    llm_default_retry_after_seconds: float = 5.0
+    llm_rate_limit_jitter_seconds: float = 1.0
+
+    # Response cache for debates whose `cache_policy` is not "off"; `max_bytes` bounds the
+    # in-memory backend (size Redis with `maxmemory`).
+    llm_response_cache_backend: Literal["redis", "memory"] = "redis"
+    llm_response_cache_ttl_seconds: int = 7 * 24 * 60 * 60
+    llm_response_cache_max_bytes: int = 256 * 1024 * 1024
+
+    # "async": run LLM calls on a shared event loop and use Celery's threads pool so one process
+    # drives `worker_async_concurrency` debate steps at once.
+    worker_execution_mode: Literal["prefork", "async"] = "prefork"
+    worker_async_concurrency: int = 200
+    # "driver": a worker leases a debate and loops through its steps in-process instead of
+    # enqueueing one task per step; leases are renewed by a heartbeat and handed off after
+    # `driver_max_seconds` or on shutdown.
+    worker_step_mode: Literal["task", "driver"] = "task"
+    driver_lease_seconds: float = 60.0
+    driver_heartbeat_seconds: float = 15.0
+    driver_max_seconds: float = 300.0
+    # Celery beat sweep for debates left running/stopping with no step in flight (0 disables it).
+    # A running debate is re-enqueued and a stopping one finalized as stopped once it has not been
+    # written for the status's threshold; keep the running one above the slowest step.
+    reaper_interval_seconds: float = 60.0
+    reaper_running_stall_seconds: float = 900.0
+    reaper_stopping_stall_seconds: float = 300.0
+    reaper_batch_size: int = 500
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    # Port of the Celery worker's Prometheus exporter (0 disables it; the API serves /metrics).
+    worker_metrics_port: int = 0
+
+    event_bus_backend: Literal["redis", "memory"] = "redis"
+    sse_heartbeat_seconds: float = 15.0
+    sse_turn_frame_cache_size: int = 2048
+    stream_coalesce_ms: int = 100
+    stream_coalesce_tokens: int = 16
+
+    # OpenTelemetry spans for API requests, debate steps, LLM calls and SQL ("none" disables).
+    tracing_exporter: Literal["none", "otlp", "file"] = "none"
+    tracing_otlp_endpoint: str = "http://localhost:4318/v1/traces"
+    tracing_file_path: str = "traces.jsonl"
 
     log_level: Literal["debug", "info", "warning", "error"] = "info"
 
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from opentelemetry import context, trace
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+from opentelemetry.propagate import extract, inject
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SpanExporter
+from opentelemetry.trace import Link, Span, SpanKind, Status, StatusCode
+from sqlalchemy import Engine, event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from llm_debate.core.settings import Settings, load_settings
+
+tracer = trace.get_tracer("llm_debate")
+
+# Set while a debate step runs: tasks it enqueues start their own trace, linked to this one.
+_IN_STEP = context.create_key("llm_debate.in_step")
+_TRACE_HEADERS = ("traceparent", "tracestate")
+_SQL_SPANS = "llm_debate.sql_spans"
+_MAX_STATEMENT_CHARS = 2000
+
+
+def _exporter(settings: Settings) -> SpanExporter | None:
+    if settings.tracing_exporter == "otlp":
+        return OTLPSpanExporter(endpoint=settings.tracing_otlp_endpoint)
+    if settings.tracing_exporter == "file":
+        out = open(settings.tracing_file_path, "a", encoding="utf-8")
+        return ConsoleSpanExporter(out=out, formatter=lambda span: span.to_json(indent=None) + "\n")
+    return None
+
+
+def tracing_enabled() -> bool:
+    return load_settings().tracing_exporter != "none"
+
+
+def configure_tracing(service_name: str) -> None:
+    """Install this process's tracer provider; with TRACING_EXPORTER=none spans stay no-ops."""
+
+    exporter = _exporter(load_settings())
+    if exporter is None:
+        return
+    provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+    # The batch processor restarts its export thread after fork, so prefork children inherit it.
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+
+
+def record_span(name: str, *, start_ns: int, end_ns: int) -> None:
+    """Record an already finished interval as a child of the current span."""
+
+    tracer.start_span(name, start_time=start_ns).end(end_time=end_ns)
+
+
+def inject_task_headers(headers: dict[str, Any]) -> None:
+    """Carry the current trace context in Celery message headers."""
+
+    carrier: dict[str, str] = {}
+    inject(carrier)
+    headers.update(carrier)
+    headers["trace_link_only"] = bool(context.get_value(_IN_STEP))
+
+
+@contextmanager
+def task_span(name: str, request: Any, attributes: dict[str, Any]) -> Iterator[Span]:
+    """
+    Span for one task run, continuing the trace from the message headers.
+
+    A task enqueued by an API request joins the request's trace. One enqueued by a previous step
+    starts a new trace with a link back, so every debate step is a trace of its own.
+    """
+
+    carrier = {key: str(request.get(key)) for key in _TRACE_HEADERS if request.get(key)}
+    parent = extract(carrier)
+    links: list[Link] = []
+    if request.get("trace_link_only"):
+        previous = trace.get_current_span(parent).get_span_context()
+        if previous.is_valid:
+            links.append(Link(previous))
+        parent = context.Context()
+    with tracer.start_as_current_span(
+        name, context=parent, kind=SpanKind.CONSUMER, links=links, attributes=attributes
+    ) as span:
+        token = context.attach(context.set_value(_IN_STEP, True))
+        try:
+            yield span
+        finally:
+            context.detach(token)
+
+
+def trace_engine(engine: Engine) -> None:
+    """Record a client span for every SQL statement `engine` executes."""
+
+    db_system = engine.dialect.name
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn: Any, cursor: Any, statement: str, *_: Any) -> None:
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+        span = tracer.start_span(
+            operation,
+            kind=SpanKind.CLIENT,
+            attributes={
+                "db.system": db_system,
+                "db.statement": statement[:_MAX_STATEMENT_CHARS],
+            },
+        )
+        conn.info.setdefault(_SQL_SPANS, []).append(span)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _end(conn: Any, cursor: Any, *_: Any) -> None:
+        spans = conn.info.get(_SQL_SPANS)
+        if spans:
+            span = spans.pop()
+            if cursor.rowcount is not None and cursor.rowcount >= 0:
+                span.set_attribute("db.rows", cursor.rowcount)
+            span.end()
+
+    @event.listens_for(engine, "handle_error")
+    def _fail(exception_context: Any) -> None:
+        conn = exception_context.connection
+        spans = conn.info.get(_SQL_SPANS) if conn is not None else None
+        if spans:
+            span = spans.pop()
+            span.record_exception(exception_context.original_exception)
+            span.set_status(Status(StatusCode.ERROR))
+            span.end()
+
+
+class TraceRequestsMiddleware:
+    """Server span per HTTP request, continuing an incoming `traceparent` and named by route."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        carrier = {
+            key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]
+        }
+        method = scope["method"]
+        with tracer.start_as_current_span(
+            f"{method} {scope['path']}",
+            context=extract(carrier),
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        ) as span:
+
+            async def send_traced(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_traced)
+            finally:
+                route = scope.get("route")
+                if route is not None and hasattr(route, "path"):
+                    span.update_name(f"{method} {route.path}")
+                    span.set_attribute("http.route", route.path)
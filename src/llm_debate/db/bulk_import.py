@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
+from typing import Any
+import uuid
+
+import orjson
+import psycopg
+
+from llm_debate.runtime.aggregates import aggregate_turns
+from llm_debate.runtime.status import TERMINAL_STATUSES
+
+_AGGREGATE_BATCH_DEBATES = 100
+
+# Statuses an imported debate may keep; anything else (e.g. an archived "running" debate) has no
+# worker behind it and is imported as "stopped" so it can be resumed.
+_RESTING_STATUSES = sorted(TERMINAL_STATUSES | {"created", "stopped", "failed"})
+
+_CREATE_STAGING = """
+CREATE TEMP TABLE import_rows (
+    debate_id uuid NOT NULL,
+    topic text,
+    status text,
+    stop_reason text,
+    settings jsonb,
+    debate_created_at timestamptz,
+    turn_id uuid,
+    round int,
+    actor text,
+    content text,
+    model text,
+    usage jsonb,
+    metadata jsonb,
+    turn_created_at timestamptz
+) ON COMMIT DROP
+"""
+
+# Debates this run inserted; only they receive turns and recomputed aggregates.
+_CREATE_INSERTED = "CREATE TEMP TABLE import_debates (debate_id uuid PRIMARY KEY) ON COMMIT DROP"
+
+_INSERT_DEBATES = """
+WITH inserted AS (
+INSERT INTO debates (
+    id, topic, status, stop_reason, settings, next_round, next_actor,
+    turn_count, total_completion_tokens, transcript, created_at, updated_at
+)
+SELECT DISTINCT ON (debate_id)
+    debate_id,
+    COALESCE(topic, ''),
+    CASE WHEN status = ANY(%(resting)s) THEN status ELSE 'stopped' END,
+    stop_reason,
+    COALESCE(settings, '{}'::jsonb),
+    1,
+    'debater_a',
+    0,
+    0,
+    '',
+    COALESCE(debate_created_at, now()),
+    COALESCE(debate_created_at, now())
+FROM import_rows
+ORDER BY debate_id
+ON CONFLICT (id) DO NOTHING
+RETURNING id
+)
+INSERT INTO import_debates SELECT id FROM inserted
+"""
+
+_INSERT_TURNS = """
+INSERT INTO turns (id, debate_id, round, actor, content, model, usage, metadata, created_at)
+SELECT
+    turn_id,
+    debate_id,
+    round,
+    actor,
+    COALESCE(content, ''),
+    model,
+    COALESCE(usage, '{}'::jsonb),
+    COALESCE(metadata, '{}'::jsonb),
+    COALESCE(turn_created_at, debate_created_at, now())
+FROM import_rows
+JOIN import_debates USING (debate_id)
+WHERE round IS NOT NULL
+ON CONFLICT (debate_id, round, actor) DO NOTHING
+"""
+
+_SELECT_TURNS = """
+SELECT debate_id, id, round, actor, content, usage
+FROM turns
+WHERE debate_id = ANY(%s)
+ORDER BY debate_id, created_at, id
+"""
+
+_CREATE_AGGREGATES = """
+CREATE TEMP TABLE import_aggregates (
+    debate_id uuid,
+    next_round int,
+    next_actor text,
+    turn_count int,
+    total_completion_tokens bigint,
+    last_turn_id uuid,
+    transcript text
+) ON COMMIT DROP
+"""
+
+_COPY_AGGREGATES = """
+COPY import_aggregates (
+    debate_id, next_round, next_actor, turn_count, total_completion_tokens, last_turn_id, transcript
+) FROM STDIN
+"""
+
+_APPLY_AGGREGATES = """
+UPDATE debates AS d
+SET next_round = a.next_round,
+    next_actor = a.next_actor,
+    turn_count = a.turn_count,
+    total_completion_tokens = a.total_completion_tokens,
+    last_turn_id = a.last_turn_id,
+    transcript = a.transcript
+FROM import_aggregates AS a
+WHERE d.id = a.debate_id
+"""
+
+
+@dataclass(frozen=True)
+class ImportStats:
+    rows: int
+    debates_inserted: int
+    turns_inserted: int
+
+
+def import_ndjson(conn: psycopg.Connection[Any], lines: Iterable[bytes]) -> ImportStats:
+    """
+    Load debates and turns from `GET /debates/export` NDJSON in the caller's transaction.
+
+    Rows are staged with COPY and inserted set-wise. Debates that already exist are left
+    untouched, turns included, so a live debate is never changed under its worker. Each inserted
+    debate gets its cursor, aggregates and transcript computed from its turns. The caller commits.
+    """
+
+    with conn.cursor() as cur:
+        cur.execute(_CREATE_STAGING)
+        rows = 0
+        with cur.copy("COPY import_rows FROM STDIN") as copy:
+            for line_number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    copy.write_row(_staging_row(orjson.loads(line)))
+                except (KeyError, TypeError, ValueError) as exc:
+                    raise ValueError(f"Invalid export row on line {line_number}: {exc}") from exc
+                rows += 1
+
+        cur.execute(_CREATE_INSERTED)
+        cur.execute(_INSERT_DEBATES, {"resting": _RESTING_STATUSES})
+        debates_inserted = cur.rowcount
+        cur.execute(_INSERT_TURNS)
+        turns_inserted = cur.rowcount
+
+        cur.execute(_CREATE_AGGREGATES)
+        cur.execute("SELECT debate_id FROM import_debates ORDER BY debate_id")
+        debate_ids = [row[0] for row in cur.fetchall()]
+        for start in range(0, len(debate_ids), _AGGREGATE_BATCH_DEBATES):
+            _stage_aggregates(cur, debate_ids[start : start + _AGGREGATE_BATCH_DEBATES])
+        cur.execute(_APPLY_AGGREGATES)
+    return ImportStats(rows=rows, debates_inserted=debates_inserted, turns_inserted=turns_inserted)
+
+
+def _staging_row(row: Any) -> tuple[Any, ...]:
+    if not isinstance(row, dict):
+        raise ValueError("expected a JSON object")
+    has_turn = row.get("round") is not None
+    return (
+        uuid.UUID(str(row["debate_id"])),
+        row.get("topic"),
+        row.get("status"),
+        row.get("stop_reason"),
+        _json_or_none(row.get("settings")),
+        row.get("debate_created_at"),
+        uuid.uuid4() if has_turn else None,
+        row.get("round"),
+        row.get("actor"),
+        row.get("content"),
+        row.get("model"),
+        _json_or_none(row.get("usage")),
+        _json_or_none(row.get("metadata")),
+        row.get("turn_created_at"),
+    )
+
+
+def _json_or_none(value: Any) -> str | None:
+    return None if value is None else orjson.dumps(value).decode("utf-8")
+
+
+def _stage_aggregates(cur: psycopg.Cursor[Any], debate_ids: list[uuid.UUID]) -> None:
+    # One bounded batch of debates at a time: the index on (debate_id, created_at) keeps each
+    # ordered read small, unlike a single sort over every imported turn.
+    cur.execute(_SELECT_TURNS, (debate_ids,))
+    records = []
+    for debate_id, turns in groupby(cur.fetchall(), key=itemgetter(0)):
+        aggregates = aggregate_turns([turn[1:] for turn in turns])
+        records.append(
+            (
+                debate_id,
+                aggregates.next_round,
+                aggregates.next_actor,
+                aggregates.turn_count,
+                aggregates.total_completion_tokens,
+                aggregates.last_turn_id,
+                aggregates.transcript,
+            )
+        )
+    with cur.copy(_COPY_AGGREGATES) as copy:
+        for record in records:
+            copy.write_row(record)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+import uuid
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.sql.dml import Update
+
+from llm_debate.db.models import IN_FLIGHT_PREDICATE, Debate
+
+# Statuses a stop or cancel request no longer changes.
+FINISHED_STATUSES = ("completed", "failed", "canceled")
+
+
+def build_set_status_unless_finished_stmt(
+    *, debate_id: uuid.UUID, values: dict[str, Any]
+) -> Update:
+    """
+    Build a single-statement UPDATE that applies `values` unless the debate has finished.
+
+    It bumps `version`, so a worker holding an older read of the row fails its versioned write and
+    re-reads instead of overwriting the new status. Returns the debate id when the row changed.
+    """
+
+    return (
+        update(Debate)
+        .where(Debate.id == debate_id, Debate.status.not_in(FINISHED_STATUSES))
+        .values(**values, version=Debate.version + 1)
+        .returning(Debate.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def build_reap_stalled_stmt(
+    *, status: str, stalled_seconds: float, limit: int, values: dict[str, Any]
+) -> Update:
+    """
+    Build an UPDATE that applies `values` to up to `limit` debates stuck in `status`.
+
+    A debate is stalled when it has not been written for `stalled_seconds` (database clock) and no
+    driver holds a live lease on it. The candidates come from the partial in-flight index, oldest
+    first, skipping rows another sweep has locked. `updated_at` and `version` are bumped, so a
+    reaped debate is not picked again until it stalls again. Returns the ids of the changed rows.
+    """
+
+    now = func.now()
+    stalled = (
+        select(Debate.id)
+        .where(
+            # Repeats the index predicate verbatim so even a generic plan can use the index.
+            IN_FLIGHT_PREDICATE,
+            Debate.status == status,
+            Debate.updated_at < now - timedelta(seconds=stalled_seconds),
+            or_(Debate.lease_expires_at.is_(None), Debate.lease_expires_at < now),
+        )
+        .order_by(Debate.updated_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return (
+        update(Debate)
+        .where(Debate.id.in_(stalled), Debate.status == status)
+        .values(**values, updated_at=now, version=Debate.version + 1)
+        .returning(Debate.id)
+        .execution_options(synchronize_session=False)
+    )
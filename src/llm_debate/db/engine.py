@@ -2,22 +2,115 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 from contextlib import contextmanager
+import time
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    Pool,
+    PoolProxiedConnection,
+    QueuePool,
+)
 
+from llm_debate.core.metrics import DB_POOL_CHECKED_OUT, DB_POOL_CHECKOUT_SECONDS
 from llm_debate.core.settings import load_settings
+from llm_debate.core.tracing import trace_engine, tracing_enabled
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool that reports how long checkouts wait (see `core.metrics`)."""
+
+    metrics_label = "sync"
+
+    def connect(self) -> PoolProxiedConnection:
+        # No pool event fires before a checkout starts waiting, so time the public entry point.
+        started_at = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.labels(self.metrics_label).observe(
+                time.perf_counter() - started_at
+            )
+
+
+class MeteredAsyncQueuePool(MeteredQueuePool, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+_CHECKED_OUT_KEY = "llm_debate_checked_out"
+
+
+def meter_checked_out(pool: Pool, label: str) -> None:
+    """
+    Track connections checked out of `pool` from its events (see `core.metrics`).
+
+    A connection leaves the count once, whichever of checkin, detach or invalidate comes first.
+    Listeners stay with the pool across `Engine.dispose`.
+    """
+
+    gauge = DB_POOL_CHECKED_OUT.labels(label)
+
+    def on_checkout(
+        _dbapi_connection: object, record: ConnectionPoolEntry, _proxy: PoolProxiedConnection
+    ) -> None:
+        record.info[_CHECKED_OUT_KEY] = True
+        gauge.inc()
+
+    def on_release(_dbapi_connection: object, record: ConnectionPoolEntry, *_: object) -> None:
+        if record.info.pop(_CHECKED_OUT_KEY, False):
+            gauge.dec()
+
+    event.listen(pool, "checkout", on_checkout)
+    for identifier in ("checkin", "detach", "invalidate"):
+        event.listen(pool, identifier, on_release)
 
 
 def create_db_engine() -> Engine:
     settings = load_settings()
-    return create_engine(str(settings.database_url), pool_pre_ping=True)
+    engine = create_engine(
+        str(settings.database_url),
+        poolclass=MeteredQueuePool,
+        pool_pre_ping=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+    )
+    meter_checked_out(engine.pool, MeteredQueuePool.metrics_label)
+    if tracing_enabled():
+        trace_engine(engine)
+    return engine
+
+
+def create_async_db_engine() -> AsyncEngine:
+    settings = load_settings()
+    engine = create_async_engine(
+        str(settings.database_url),
+        poolclass=MeteredAsyncQueuePool,
+        pool_pre_ping=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+    )
+    meter_checked_out(engine.sync_engine.pool, MeteredAsyncQueuePool.metrics_label)
+    if tracing_enabled():
+        trace_engine(engine.sync_engine)
+    return engine
 
 
 def create_sessionmaker(engine: Engine) -> sessionmaker[Session]:
     return sessionmaker(bind=engine, expire_on_commit=False)
 
 
+def create_async_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=engine, expire_on_commit=False)
+
+
 @contextmanager
 def session_scope(factory: sessionmaker[Session]) -> Iterator[Session]:
     session = factory()
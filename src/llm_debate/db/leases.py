@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from datetime import timedelta
+import uuid
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.sql.dml import Update
+
+from llm_debate.db.models import Debate
+
+
+def build_acquire_lease_stmt(
+    *, debate_id: uuid.UUID, owner: str, lease_seconds: float
+) -> Update:
+    """
+    Build an UPDATE that takes the debate's driver lease if it is free, expired or already ours.
+
+    Expiry is judged on the database clock so worker clock skew does not matter. The statement
+    returns the debate id when the lease was taken.
+    """
+
+    return (
+        update(Debate)
+        .where(
+            Debate.id == debate_id,
+            or_(
+                Debate.lease_owner.is_(None),
+                Debate.lease_owner == owner,
+                Debate.lease_expires_at < func.now(),
+            ),
+        )
+        .values(lease_owner=owner, lease_expires_at=func.now() + timedelta(seconds=lease_seconds))
+        .returning(Debate.id)
+    )
+
+
+def build_renew_lease_stmt(*, debate_id: uuid.UUID, owner: str, lease_seconds: float) -> Update:
+    """
+    Build an UPDATE that extends a lease we hold.
+
+    The row is claimed with SKIP LOCKED so a heartbeat never waits behind another transaction
+    writing the debate (a step persisting its turn, an API stop); no row back means "lost or
+    busy", which callers tell apart with a plain read. It leaves `version` alone, so renewals never
+    conflict with the driver's own versioned step writes.
+    """
+
+    unlocked = (
+        select(Debate.id)
+        .where(Debate.id == debate_id)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    return (
+        update(Debate)
+        .where(and_(Debate.id == unlocked, Debate.lease_owner == owner))
+        .values(lease_expires_at=func.now() + timedelta(seconds=lease_seconds))
+        .returning(Debate.id)
+    )
+
+
+def build_release_lease_stmt(*, debate_id: uuid.UUID, owner: str) -> Update:
+    return (
+        update(Debate)
+        .where(Debate.id == debate_id, Debate.lease_owner == owner)
+        .values(lease_owner=None, lease_expires_at=None)
+    )
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, ClassVar
 import uuid
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, Text, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from llm_debate.core.time import utcnow
 from llm_debate.db.base import Base
 
+# Debates a worker still owes a step; predicate of the partial index the stalled-debate sweep uses.
+IN_FLIGHT_PREDICATE = text("status IN ('running', 'stopping')")
+
 
 class Debate(Base):
     __tablename__ = "debates"
@@ -22,6 +35,19 @@ class Debate(Base):
     next_actor: Mapped[str] = mapped_column(Text(), nullable=False, default="debater_a")
     stop_reason: Mapped[str | None] = mapped_column(Text(), nullable=True)
     last_error: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    turn_count: Mapped[int] = mapped_column(Integer(), nullable=False, default=0)
+    total_completion_tokens: Mapped[int] = mapped_column(BigInteger(), nullable=False, default=0)
+    last_turn_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    # Formatted transcript of all persisted turns, appended once per step (see
+    # `runtime.prompts.append_transcript`). Deferred so list/detail reads do not fetch it.
+    transcript: Mapped[str] = mapped_column(Text(), nullable=False, default="", deferred=True)
+    # Driver lease (WORKER_STEP_MODE=driver): the worker looping through this debate's steps.
+    lease_owner: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    lease_expires_at: Mapped[Any | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Optimistic concurrency: every ORM UPDATE of a debate is `... WHERE version = :seen` and bumps
+    # it, raising StaleDataError when another writer got there first (see `__mapper_args__`).
+    # Core UPDATEs that change status or the step cursor bump it themselves.
+    version: Mapped[int] = mapped_column(Integer(), nullable=False, server_default=text("0"))
     created_at: Mapped[Any] = mapped_column(DateTime(timezone=True), nullable=False, default=utcnow)
     updated_at: Mapped[Any] = mapped_column(DateTime(timezone=True), nullable=False, default=utcnow)
 
@@ -31,6 +57,31 @@ class Debate(Base):
         order_by="Turn.created_at",
     )
 
+    # Keyset pagination of the debate list on (updated_at, id), optionally filtered by status,
+    # stop reason or topic prefix; (created_at, id) orders and range-filters the export.
+    __table_args__ = (
+        Index("ix_debates_created_at_id", "created_at", "id"),
+        Index("ix_debates_updated_at_id", "updated_at", "id"),
+        Index("ix_debates_status_updated_at_id", "status", "updated_at", "id"),
+        Index(
+            "ix_debates_stop_reason_updated_at_id",
+            "stop_reason",
+            "updated_at",
+            "id",
+            postgresql_where=text("stop_reason IS NOT NULL"),
+        ),
+        Index("ix_debates_topic_prefix", "topic", postgresql_ops={"topic": "text_pattern_ops"}),
+        # Small and hot: only debates a worker still owes a step, for the stalled-debate sweep.
+        Index(
+            "ix_debates_in_flight_updated_at",
+            "status",
+            "updated_at",
+            postgresql_where=IN_FLIGHT_PREDICATE,
+        ),
+    )
+    # SQLAlchemy's typing declares `__mapper_args__` on instances; it is class-level config.
+    __mapper_args__: ClassVar[dict[str, Any]] = {"version_id_col": version}  # type: ignore[misc]
+
 
 class Turn(Base):
     __tablename__ = "turns"
@@ -49,6 +100,9 @@ class Turn(Base):
     usage: Mapped[dict[str, Any]] = mapped_column(JSONB(), nullable=False, default=dict)
     meta: Mapped[dict[str, Any]] = mapped_column("metadata", JSONB(), nullable=False, default=dict)
     created_at: Mapped[Any] = mapped_column(DateTime(timezone=True), nullable=False, default=utcnow)
+    # The turn's JSON exactly as sent in `turn` SSE events, encoded once at insert time so replays
+    # stream stored bytes. NULL for bulk-imported turns and those written before the column existed.
+    payload_json: Mapped[bytes | None] = mapped_column(LargeBinary(), nullable=True, deferred=True)
 
     debate: Mapped[Debate] = relationship(back_populates="turns")
 
@@ -57,3 +111,49 @@ class Turn(Base):
         Index("ix_turns_debate_id_round_actor", "debate_id", "round", "actor"),
         UniqueConstraint("debate_id", "round", "actor", name="uq_turns_debate_id_round_actor"),
     )
+
+
+# Rolling summary of every turn up to `through_round`; written once per round when the
+# transcript outgrows the context budget (see `runtime.prompts.compact_transcript`).
+class DebateSummary(Base):
+    __tablename__ = "debate_summaries"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    debate_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("debates.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    through_round: Mapped[int] = mapped_column(Integer(), nullable=False)
+    content: Mapped[str] = mapped_column(Text(), nullable=False)
+    model: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    usage: Mapped[dict[str, Any]] = mapped_column(JSONB(), nullable=False, default=dict)
+    created_at: Mapped[Any] = mapped_column(DateTime(timezone=True), nullable=False, default=utcnow)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "debate_id", "through_round", name="uq_debate_summaries_debate_id_through_round"
+        ),
+    )
+
+
+# Verdict on the debate through `round`, written once per round in `judge_mode="per_round"` to
+# stop stale debates early (see `runtime.steps.should_stop_for_no_new_arguments`).
+class DebateRoundVerdict(Base):
+    __tablename__ = "debate_round_verdicts"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    debate_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("debates.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    round: Mapped[int] = mapped_column(Integer(), nullable=False)
+    verdict: Mapped[dict[str, Any]] = mapped_column(JSONB(), nullable=False)
+    model: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    usage: Mapped[dict[str, Any]] = mapped_column(JSONB(), nullable=False, default=dict)
+    created_at: Mapped[Any] = mapped_column(DateTime(timezone=True), nullable=False, default=utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("debate_id", "round", name="uq_debate_round_verdicts_debate_id_round"),
+    )
@@ -7,7 +7,7 @@ from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.sql.dml import Insert
 from sqlalchemy.sql.schema import Table
 
-from llm_debate.db.models import Turn
+from llm_debate.db.models import DebateRoundVerdict, DebateSummary, Turn
 
 
 def build_insert_turn_idempotent_stmt(*, turn_id: uuid.UUID | None = None, values: dict[str, Any]) -> Insert:
@@ -27,3 +27,29 @@ def build_insert_turn_idempotent_stmt(*, turn_id: uuid.UUID | None = None, value
         .on_conflict_do_nothing(index_elements=["debate_id", "round", "actor"])
         .returning(Turn.id)
     )
+
+
+def build_insert_summary_idempotent_stmt(*, values: dict[str, Any]) -> Insert:
+    """
+    Build a Postgres INSERT for a DebateSummary that is idempotent for (debate_id, through_round).
+
+    The first summary written for a round wins; later writers get no row back and should read it.
+    """
+
+    return (
+        pg_insert(cast(Table, DebateSummary.__table__))
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=["debate_id", "through_round"])
+        .returning(DebateSummary.id)
+    )
+
+
+def build_insert_round_verdict_idempotent_stmt(*, values: dict[str, Any]) -> Insert:
+    """Build a Postgres INSERT for a DebateRoundVerdict that is idempotent for (debate_id, round)."""
+
+    return (
+        pg_insert(cast(Table, DebateRoundVerdict.__table__))
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=["debate_id", "round"])
+        .returning(DebateRoundVerdict.id)
+    )
@@ -0,0 +1 @@
+"""Debate event fan-out between the worker and SSE subscribers."""
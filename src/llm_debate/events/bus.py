@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+import logging
+import threading
+from typing import Any, Protocol
+import uuid
+
+import orjson
+import redis
+import redis.asyncio as aioredis
+
+from llm_debate.core.settings import load_settings
+from llm_debate.events.sse import sse_frame
+
+logger = logging.getLogger(__name__)
+
+_CHANNEL_PREFIX = "llm_debate:debate:"
+_CHANNEL_SUFFIX = ":events"
+_SUBSCRIBER_QUEUE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class BusMessage:
+    event: str
+    data: dict[str, Any]
+    event_id: str | None = None
+
+    @cached_property
+    def frame(self) -> bytes:
+        """The SSE frame for this message, encoded once and shared by every local subscriber."""
+
+        return sse_frame(self.event, self.data, self.event_id)
+
+
+def debate_channel(debate_id: uuid.UUID | str) -> str:
+    """Return the pub/sub channel name for a debate."""
+
+    return f"{_CHANNEL_PREFIX}{debate_id}{_CHANNEL_SUFFIX}"
+
+
+def encode_message(message: BusMessage) -> bytes:
+    return orjson.dumps({"event": message.event, "id": message.event_id, "data": message.data})
+
+
+def decode_message(raw: str | bytes) -> BusMessage | None:
+    """Decode a published message, returning None for malformed payloads."""
+
+    try:
+        parsed = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(parsed, dict):
+        return None
+    event = parsed.get("event")
+    data = parsed.get("data")
+    event_id = parsed.get("id")
+    if not isinstance(event, str) or not isinstance(data, dict):
+        return None
+    return BusMessage(event=event, data=data, event_id=str(event_id) if event_id is not None else None)
+
+
+class Subscription:
+    """
+    A local subscriber queue for one debate channel.
+
+    Subscriptions are bound to the running event loop they were created in; messages may be
+    dispatched from any thread.
+    """
+
+    def __init__(self, fanout: _Fanout, channel: str) -> None:
+        self._fanout = fanout
+        self._channel = channel
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[BusMessage] = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        fanout.add(channel, self)
+
+    async def get(self, timeout: float) -> BusMessage | None:
+        """Wait up to `timeout` seconds for the next message."""
+
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self._fanout.remove(self._channel, self)
+
+    def deliver(self, message: BusMessage) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._put, message)
+        except RuntimeError:
+            # The owning loop is closed; the subscriber is gone.
+            self.close()
+
+    def _put(self, message: BusMessage) -> None:
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # A stalled client falls back to Last-Event-ID catch-up when it reconnects.
+            logger.warning("Dropping event for slow subscriber on %s", self._channel)
+
+
+class _Fanout:
+    """Thread-safe in-process dispatch from a channel to its local subscribers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, set[Subscription]] = {}
+
+    def add(self, channel: str, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(subscription)
+
+    def remove(self, channel: str, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[channel]
+
+    def dispatch(self, channel: str, message: BusMessage) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            subscription.deliver(message)
+
+
+class EventBus(Protocol):
+    def publish(self, debate_id: uuid.UUID | str, message: BusMessage) -> None: ...
+
+    def subscribe(self, debate_id: uuid.UUID | str) -> Subscription:
+        """Subscribe to a debate channel; must be called from within a running event loop."""
+        ...
+
+
+class InMemoryEventBus:
+    """Process-local event bus (tests and single-process development)."""
+
+    def __init__(self) -> None:
+        self._fanout = _Fanout()
+
+    def publish(self, debate_id: uuid.UUID | str, message: BusMessage) -> None:
+        self._fanout.dispatch(debate_channel(debate_id), message)
+
+    def subscribe(self, debate_id: uuid.UUID | str) -> Subscription:
+        return Subscription(self._fanout, debate_channel(debate_id))
+
+
+class RedisEventBus:
+    """
+    Redis pub/sub event bus.
+
+    Publishing is synchronous (worker side). Each subscribing process runs a single asyncio
+    listener holding one pattern subscription that covers every debate channel and multiplexes
+    incoming messages to its local subscribers, so Redis connections do not grow with viewers.
+    """
+
+    def __init__(self, url: str) -> None:
+        self._url = url
+        self._redis = redis.Redis.from_url(url)
+        self._fanout = _Fanout()
+        self._listener: asyncio.Task[None] | None = None
+
+    def publish(self, debate_id: uuid.UUID | str, message: BusMessage) -> None:
+        self._redis.publish(debate_channel(debate_id), encode_message(message))
+
+    def subscribe(self, debate_id: uuid.UUID | str) -> Subscription:
+        subscription = Subscription(self._fanout, debate_channel(debate_id))
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+        return subscription
+
+    async def _listen(self) -> None:
+        pattern = f"{_CHANNEL_PREFIX}*{_CHANNEL_SUFFIX}"
+        client = aioredis.Redis.from_url(self._url)
+        while True:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(pattern)
+                while True:
+                    raw = await pubsub.get_message(timeout=1.0)
+                    if raw is None or raw.get("type") != "pmessage":
+                        continue
+                    message = decode_message(raw["data"])
+                    if message is None:
+                        continue
+                    channel = raw["channel"]
+                    if isinstance(channel, bytes):
+                        channel = channel.decode("utf-8")
+                    self._fanout.dispatch(str(channel), message)
+            except redis.RedisError:
+                logger.warning("Event bus listener disconnected; reconnecting", exc_info=True)
+                await asyncio.sleep(1.0)
+            finally:
+                await pubsub.aclose()  # type: ignore[attr-defined]
+
+
+@lru_cache(maxsize=1)
+def get_event_bus() -> EventBus:
+    """Return the process-wide event bus configured by `event_bus_backend`."""
+
+    settings = load_settings()
+    if settings.event_bus_backend == "memory":
+        return InMemoryEventBus()
+    return RedisEventBus(str(settings.redis_url))
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import time
+
+
+class DeltaCoalescer:
+    """
+    Batch streamed text fragments into fewer, larger deltas.
+
+    A batch is flushed once `interval_ms` has elapsed since the previous flush or once
+    `max_fragments` fragments are pending. `flush` receives the character offset of the batch
+    within the full text, so a consumer can apply deltas idempotently.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[int, str], None],
+        *,
+        interval_ms: int,
+        max_fragments: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._flush = flush
+        self._interval_seconds = max(0, interval_ms) / 1000
+        self._max_fragments = max(1, max_fragments)
+        self._clock = clock
+        self._pending: list[str] = []
+        self._offset = 0
+        self._last_flush = clock()
+
+    def push(self, fragment: str) -> None:
+        if not fragment:
+            return
+        self._pending.append(fragment)
+        if (
+            len(self._pending) >= self._max_fragments
+            or self._clock() - self._last_flush >= self._interval_seconds
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        self._pending.clear()
+        self._flush(self._offset, text)
+        self._offset += len(text)
+        self._last_flush = self._clock()
+
+    def reset(self) -> None:
+        """Drop pending text and restart offsets (for example when a request is retried)."""
+
+        self._pending.clear()
+        self._offset = 0
+        self._last_flush = self._clock()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import lru_cache
+import threading
+from typing import Any
+
+import orjson
+
+from llm_debate.core.settings import load_settings
+
+SSE_HEARTBEAT = b": keep-alive\n\n"
+
+
+def sse_frame(event: str, data: dict[str, Any], event_id: str | None) -> bytes:
+    """Encode one Server-Sent Events frame."""
+
+    return sse_frame_from_json(event, orjson.dumps(data), event_id)
+
+
+def sse_frame_from_json(event: str, payload: bytes, event_id: str | None) -> bytes:
+    """Wrap an already-encoded single-line JSON payload in a Server-Sent Events frame."""
+
+    head = b"" if event_id is None else b"id: " + event_id.encode("utf-8") + b"\n"
+    return head + b"event: " + event.encode("utf-8") + b"\ndata: " + payload + b"\n\n"
+
+
+class FrameCache:
+    """
+    Bounded LRU of encoded SSE frames for immutable events, keyed by event id.
+
+    Persisted turns never change, so their frame is encoded once per process and the same bytes
+    are reused for every subscriber and every reconnect catch-up.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._frames: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+            return frame
+
+    def put(self, key: str, frame: bytes) -> None:
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._frames[key] = frame
+            self._frames.move_to_end(key)
+            while len(self._frames) > self._maxsize:
+                self._frames.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def get_turn_frame_cache() -> FrameCache:
+    """Return the process-wide cache of encoded `turn` frames."""
+
+    return FrameCache(load_settings().sse_turn_frame_cache_size)
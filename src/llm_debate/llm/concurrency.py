@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+import threading
+
+
+class ConcurrencyLimiter:
+    """
+    Cap in-flight LLM requests in this process, globally and per model (for threaded callers).
+
+    A limit of 0 disables that cap.
+    """
+
+    def __init__(self, *, max_in_flight: int, max_in_flight_per_model: int) -> None:
+        self._global = threading.BoundedSemaphore(max_in_flight) if max_in_flight > 0 else None
+        self._per_model_limit = max_in_flight_per_model
+        self._per_model: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _model_semaphore(self, model: str) -> threading.BoundedSemaphore | None:
+        if self._per_model_limit <= 0:
+            return None
+        with self._lock:
+            semaphore = self._per_model.get(model)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self._per_model_limit)
+                self._per_model[model] = semaphore
+            return semaphore
+
+    @contextmanager
+    def slot(self, model: str) -> Iterator[None]:
+        per_model = self._model_semaphore(model)
+        if per_model is not None:
+            per_model.acquire()
+        try:
+            if self._global is not None:
+                self._global.acquire()
+            try:
+                yield
+            finally:
+                if self._global is not None:
+                    self._global.release()
+        finally:
+            if per_model is not None:
+                per_model.release()
+
+
+class AsyncConcurrencyLimiter:
+    """
+    Cap in-flight LLM requests on one event loop, globally and per model.
+
+    A limit of 0 disables that cap. The per-model semaphore is taken first so a saturated model
+    does not hold global slots that other models could use.
+    """
+
+    def __init__(self, *, max_in_flight: int, max_in_flight_per_model: int) -> None:
+        self._global = asyncio.Semaphore(max_in_flight) if max_in_flight > 0 else None
+        self._per_model_limit = max_in_flight_per_model
+        self._per_model: dict[str, asyncio.Semaphore] = {}
+
+    def _model_semaphore(self, model: str) -> asyncio.Semaphore | None:
+        if self._per_model_limit <= 0:
+            return None
+        semaphore = self._per_model.get(model)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._per_model_limit)
+            self._per_model[model] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def slot(self, model: str) -> AsyncIterator[None]:
+        per_model = self._model_semaphore(model)
+        if per_model is not None:
+            await per_model.acquire()
+        try:
+            if self._global is not None:
+                await self._global.acquire()
+            try:
+                yield
+            finally:
+                if self._global is not None:
+                    self._global.release()
+        finally:
+            if per_model is not None:
+                per_model.release()
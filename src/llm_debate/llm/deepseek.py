@@ -1,13 +1,47 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterable, Iterable
 from dataclasses import dataclass
+import importlib.util
 import json
-from typing import Any, cast
+import logging
+import queue
+import threading
+import time
+from typing import Any, Protocol, cast
 
-from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, OpenAI, RateLimitError
+from opentelemetry.trace import SpanKind
+import orjson
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
-from llm_debate.core.settings import load_settings
+from llm_debate.core.metrics import LLM_REQUEST_SECONDS, LLM_RETRIES, LLM_TOKENS
+from llm_debate.core.settings import Settings, load_settings
+from llm_debate.core.tracing import tracer
+from llm_debate.llm.concurrency import AsyncConcurrencyLimiter, ConcurrencyLimiter
+from llm_debate.llm.rate_limit import (
+    RateLimitedError,
+    RateLimiter,
+    get_rate_limiter,
+    retry_after_seconds,
+)
+from llm_debate.llm.response_cache import (
+    CachePolicy,
+    ResponseCache,
+    get_response_cache,
+    response_cache_key,
+)
+from llm_debate.runtime.prompts import estimate_tokens
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -28,14 +62,184 @@ def _usage_to_dict(usage: Any) -> dict[str, Any]:
     return {}
 
 
+class DeltaSink(Protocol):
+    """Receiver for streamed content fragments (see `llm_debate.events.coalesce.DeltaCoalescer`)."""
+
+    def push(self, fragment: str) -> None: ...
+
+    def flush(self) -> None: ...
+
+    def reset(self) -> None: ...
+
+
+class _StreamAccumulator:
+    def __init__(self, sink: DeltaSink) -> None:
+        self._sink = sink
+        self._parts: list[str] = []
+        self._model: str | None = None
+        self._usage: Any = None
+        self._metadata: dict[str, Any] = {}
+
+    def feed(self, chunk: Any) -> None:
+        self._model = getattr(chunk, "model", None) or self._model
+        chunk_usage = getattr(chunk, "usage", None)
+        if chunk_usage is not None:
+            self._usage = chunk_usage
+        choices = getattr(chunk, "choices", None) or []
+        if not choices:
+            return
+        delta = choices[0].delta
+        if getattr(delta, "reasoning_content", None):
+            self._metadata["has_reasoning_content"] = True
+        fragment = getattr(delta, "content", None)
+        if fragment:
+            self._parts.append(fragment)
+            self._sink.push(fragment)
+
+    def result(self) -> ChatResult:
+        self._sink.flush()
+        self._metadata["streamed"] = True
+        return ChatResult(
+            content="".join(self._parts),
+            model=self._model,
+            usage=_usage_to_dict(self._usage),
+            metadata=self._metadata,
+        )
+
+
+def collect_stream(chunks: Iterable[Any], sink: DeltaSink) -> ChatResult:
+    """
+    Accumulate an OpenAI-compatible chat completion stream into a ChatResult.
+
+    Content fragments are forwarded to `sink` as they arrive. Reasoning content is never
+    forwarded; its presence is only recorded in metadata.
+    """
+
+    accumulator = _StreamAccumulator(sink)
+    for chunk in chunks:
+        accumulator.feed(chunk)
+    return accumulator.result()
+
+
+async def acollect_stream(chunks: AsyncIterable[Any], sink: DeltaSink) -> ChatResult:
+    """Async counterpart of `collect_stream`."""
+
+    accumulator = _StreamAccumulator(sink)
+    async for chunk in chunks:
+        accumulator.feed(chunk)
+    return accumulator.result()
+
+
+def _message_result(response: Any) -> ChatResult:
+    message = response.choices[0].message
+    metadata: dict[str, Any] = {}
+    if getattr(message, "reasoning_content", None):
+        metadata["has_reasoning_content"] = True
+    return ChatResult(
+        content=message.content or "",
+        model=getattr(response, "model", None),
+        usage=_usage_to_dict(getattr(response, "usage", None)),
+        metadata=metadata,
+    )
+
+
+def _reserve_rate_budget(
+    limiter: RateLimiter | None, model: str, messages: list[dict[str, Any]], max_tokens: int
+) -> int:
+    """Take one request and the worst-case token cost, or raise RateLimitedError without calling."""
+
+    if limiter is None:
+        return 0
+    cost = sum(estimate_tokens(str(m.get("content") or "")) for m in messages) + max_tokens
+    wait = limiter.acquire(model, cost)
+    if wait > 0:
+        raise RateLimitedError(model, wait)
+    return cost
+
+
+def _settle_rate_budget(
+    limiter: RateLimiter | None, model: str, reserved: int, usage: dict[str, Any]
+) -> None:
+    total_tokens = usage.get("total_tokens")
+    if limiter is not None and isinstance(total_tokens, int) and total_tokens < reserved:
+        limiter.refund(model, reserved - total_tokens)
+
+
+def _release_rate_budget(limiter: RateLimiter | None, model: str, reserved: int) -> None:
+    """Give back the tokens of a call that failed every attempt; the request itself stays spent."""
+
+    if limiter is not None and reserved > 0:
+        limiter.refund(model, reserved)
+
+
+def _provider_rate_limited(
+    limiter: RateLimiter | None, model: str, exc: RateLimitError
+) -> RateLimitedError:
+    """Turn a provider 429 into RateLimitedError and hold back every other caller of the model."""
+
+    retry_after = retry_after_seconds(
+        exc.response.headers, default=load_settings().llm_default_retry_after_seconds
+    )
+    if limiter is not None:
+        limiter.block(model, retry_after)
+    return RateLimitedError(model, retry_after)
+
+
+def _record_attempt(
+    model: str, started_at: float, outcome: str, usage: dict[str, Any] | None = None
+) -> None:
+    LLM_REQUEST_SECONDS.labels(model, outcome).observe(time.perf_counter() - started_at)
+    for kind in ("prompt", "completion"):
+        tokens = (usage or {}).get(f"{kind}_tokens")
+        if isinstance(tokens, int):
+            LLM_TOKENS.labels(model, kind).inc(tokens)
+
+
+def _count_retry(retry_state: RetryCallState) -> None:
+    error = retry_state.outcome.exception() if retry_state.outcome is not None else None
+    LLM_RETRIES.labels(str(retry_state.kwargs.get("model")), type(error).__name__).inc()
+
+
+# Rate limits are not retried in-process: callers defer the whole step instead (see
+# `llm_debate.worker.tasks.advance_debate`), so 429s do not turn into synchronized retry waves.
+_retry_transient = retry(
+    retry=retry_if_not_exception_type(RateLimitedError),
+    wait=wait_exponential(min=0.5, max=10),
+    stop=stop_after_attempt(3),
+    before_sleep=_count_retry,
+    reraise=True,
+)
+
+
+class ChatClient(Protocol):
+    def chat_completion(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        max_tokens: int,
+        response_format: dict[str, Any] | None = None,
+        stream_to: DeltaSink | None = None,
+        temperature: float | None = None,
+    ) -> ChatResult: ...
+
+
 class DeepSeekClient:
     """DeepSeek client using the OpenAI-compatible API surface."""
 
     def __init__(self) -> None:
         settings = load_settings()
-        self._client = OpenAI(api_key=settings.deepseek_api_key, base_url=settings.deepseek_base_url)
+        # Retries are ours (tenacity for transient errors, task deferral for 429s); the SDK's
+        # built-in retries would sleep through Retry-After inside a worker slot.
+        self._client = OpenAI(
+            api_key=settings.deepseek_api_key, base_url=settings.deepseek_base_url, max_retries=0
+        )
+        self._limiter = ConcurrencyLimiter(
+            max_in_flight=settings.llm_max_concurrency,
+            max_in_flight_per_model=settings.llm_max_concurrency_per_model,
+        )
+        self._rate_limiter = get_rate_limiter()
 
-    @retry(wait=wait_exponential(min=0.5, max=10), stop=stop_after_attempt(3))
     def chat_completion(
         self,
         *,
@@ -43,32 +247,455 @@ class DeepSeekClient:
         messages: list[dict[str, Any]],
         max_tokens: int,
         response_format: dict[str, Any] | None = None,
+        stream_to: DeltaSink | None = None,
+        temperature: float | None = None,
+    ) -> ChatResult:
+        """
+        Run a chat completion.
+
+        When `stream_to` is given the request is streamed and content fragments are pushed to it
+        as they arrive; the sink is reset at the start of every attempt so retries restart cleanly.
+        The rate budget is reserved once per call, not per retried attempt.
+        """
+
+        extra: dict[str, Any] = {}
+        if response_format is not None:
+            extra["response_format"] = response_format
+        if temperature is not None:
+            extra["temperature"] = temperature
+
+        reserved = _reserve_rate_budget(self._rate_limiter, model, messages, max_tokens)
+        try:
+            result = self._attempt(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                stream_to=stream_to,
+                extra=extra,
+            )
+        except Exception:
+            _release_rate_budget(self._rate_limiter, model, reserved)
+            raise
+        _settle_rate_budget(self._rate_limiter, model, reserved, result.usage)
+        return result
+
+    @_retry_transient
+    def _attempt(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        max_tokens: int,
+        stream_to: DeltaSink | None,
+        extra: dict[str, Any],
+    ) -> ChatResult:
+        with self._limiter.slot(model):
+            started_at = time.perf_counter()
+            try:
+                if stream_to is not None:
+                    stream_to.reset()
+                    chunks = self._client.chat.completions.create(
+                        model=model,
+                        messages=cast(Any, messages),
+                        max_tokens=max_tokens,
+                        stream=True,
+                        stream_options={"include_usage": True},
+                        **extra,
+                    )
+                    result = collect_stream(chunks, stream_to)
+                else:
+                    response = self._client.chat.completions.create(
+                        model=model,
+                        messages=cast(Any, messages),
+                        max_tokens=max_tokens,
+                        **extra,
+                    )
+                    result = _message_result(response)
+            except RateLimitError as exc:
+                _record_attempt(model, started_at, "rate_limited")
+                raise _provider_rate_limited(self._rate_limiter, model, exc) from exc
+            except Exception:
+                _record_attempt(model, started_at, "error")
+                raise
+        _record_attempt(model, started_at, "ok", result.usage)
+        return result
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _async_http_client(settings: Settings) -> httpx.AsyncClient:
+    """Shared keep-alive pool; HTTP/2 (one multiplexed connection) when `h2` is installed."""
+
+    return DefaultAsyncHttpxClient(
+        http2=_http2_available(),
+        limits=httpx.Limits(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_keepalive_connections,
+            keepalive_expiry=settings.llm_keepalive_expiry_seconds,
+        ),
+        timeout=httpx.Timeout(settings.llm_request_timeout_seconds, connect=10.0),
+    )
+
+
+class AsyncDeepSeekClient:
+    """DeepSeek client on AsyncOpenAI with a pooled HTTP client and concurrency caps."""
+
+    def __init__(self) -> None:
+        settings = load_settings()
+        self._client = AsyncOpenAI(
+            api_key=settings.deepseek_api_key,
+            base_url=settings.deepseek_base_url,
+            http_client=_async_http_client(settings),
+            max_retries=0,
+        )
+        self._limiter = AsyncConcurrencyLimiter(
+            max_in_flight=settings.llm_max_concurrency,
+            max_in_flight_per_model=settings.llm_max_concurrency_per_model,
+        )
+        self._rate_limiter = get_rate_limiter()
+
+    async def chat_completion(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        max_tokens: int,
+        response_format: dict[str, Any] | None = None,
+        stream_to: DeltaSink | None = None,
+        temperature: float | None = None,
     ) -> ChatResult:
+        """Async counterpart of `DeepSeekClient.chat_completion`."""
+
         extra: dict[str, Any] = {}
         if response_format is not None:
             extra["response_format"] = response_format
+        if temperature is not None:
+            extra["temperature"] = temperature
+
+        # The limiter may do a blocking Redis round trip; keep it off the event loop.
+        reserved = await asyncio.to_thread(
+            _reserve_rate_budget, self._rate_limiter, model, messages, max_tokens
+        )
+        try:
+            result = await self._attempt(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                stream_to=stream_to,
+                extra=extra,
+            )
+        except Exception:
+            await asyncio.to_thread(_release_rate_budget, self._rate_limiter, model, reserved)
+            raise
+        await asyncio.to_thread(
+            _settle_rate_budget, self._rate_limiter, model, reserved, result.usage
+        )
+        return result
+
+    @_retry_transient
+    async def _attempt(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        max_tokens: int,
+        stream_to: DeltaSink | None,
+        extra: dict[str, Any],
+    ) -> ChatResult:
+        async with self._limiter.slot(model):
+            started_at = time.perf_counter()
+            try:
+                if stream_to is not None:
+                    stream_to.reset()
+                    chunks = await self._client.chat.completions.create(
+                        model=model,
+                        messages=cast(Any, messages),
+                        max_tokens=max_tokens,
+                        stream=True,
+                        stream_options={"include_usage": True},
+                        **extra,
+                    )
+                    result = await acollect_stream(chunks, stream_to)
+                else:
+                    response = await self._client.chat.completions.create(
+                        model=model,
+                        messages=cast(Any, messages),
+                        max_tokens=max_tokens,
+                        **extra,
+                    )
+                    result = _message_result(response)
+            except RateLimitError as exc:
+                _record_attempt(model, started_at, "rate_limited")
+                limited = await asyncio.to_thread(
+                    _provider_rate_limited, self._rate_limiter, model, exc
+                )
+                raise limited from exc
+            except Exception:
+                _record_attempt(model, started_at, "error")
+                raise
+        _record_attempt(model, started_at, "ok", result.usage)
+        return result
+
+    async def aclose(self) -> None:
+        await self._client.close()
+
+
+class _SinkRelay:
+    """
+    DeltaSink that queues the calls made on the event loop for the calling thread to replay.
+
+    The real sink may block (the event bus publishes to Redis synchronously), which on the shared
+    loop would stall every other stream in the process.
+    """
+
+    def __init__(self) -> None:
+        self._calls: queue.SimpleQueue[tuple[str, str] | None] = queue.SimpleQueue()
+
+    def push(self, fragment: str) -> None:
+        self._calls.put(("push", fragment))
+
+    def flush(self) -> None:
+        self._calls.put(("flush", ""))
+
+    def reset(self) -> None:
+        self._calls.put(("reset", ""))
+
+    def close(self) -> None:
+        self._calls.put(None)
+
+    def replay(self, sink: DeltaSink) -> None:
+        """Apply the queued calls to `sink` in order until `close`."""
+
+        while (call := self._calls.get()) is not None:
+            method, fragment = call
+            if method == "push":
+                sink.push(fragment)
+            elif method == "flush":
+                sink.flush()
+            else:
+                sink.reset()
+
+
+class SharedLoopDeepSeekClient:
+    """
+    Blocking facade over one AsyncDeepSeekClient running on a background event loop.
+
+    Every calling thread (for example Celery's `threads` pool) shares the loop, its connection
+    pool and its concurrency caps, so hundreds of in-flight steps need only one process.
+    """
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="llm-event-loop", daemon=True
+        )
+        self._thread.start()
+        self._client = asyncio.run_coroutine_threadsafe(self._create(), self._loop).result()
+
+    @staticmethod
+    async def _create() -> AsyncDeepSeekClient:
+        return AsyncDeepSeekClient()
+
+    def chat_completion(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        max_tokens: int,
+        response_format: dict[str, Any] | None = None,
+        stream_to: DeltaSink | None = None,
+        temperature: float | None = None,
+    ) -> ChatResult:
+        # Streamed fragments are pushed to `stream_to` from this (otherwise idle) thread.
+        relay = _SinkRelay() if stream_to is not None else None
+        future = asyncio.run_coroutine_threadsafe(
+            self._client.chat_completion(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                response_format=response_format,
+                stream_to=relay,
+                temperature=temperature,
+            ),
+            self._loop,
+        )
+        if relay is not None and stream_to is not None:
+            future.add_done_callback(lambda _: relay.close())
+            relay.replay(stream_to)
+        return future.result()
+
+    def close(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+def _encode_cached_response(result: ChatResult, *, duration_ms: int) -> bytes:
+    return orjson.dumps(
+        {
+            "content": result.content,
+            "model": result.model,
+            "usage": result.usage,
+            "metadata": result.metadata,
+            "duration_ms": duration_ms,
+        }
+    )
+
+
+def _decode_cached_response(raw: bytes) -> ChatResult | None:
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("content"), str):
+        return None
+    metadata = dict(data.get("metadata") or {})
+    metadata["cache_hit"] = True
+    metadata["cached_duration_ms"] = data.get("duration_ms")
+    return ChatResult(
+        content=data["content"],
+        model=data.get("model"),
+        usage=dict(data.get("usage") or {}),
+        metadata=metadata,
+    )
 
-        response = self._client.chat.completions.create(
+
+class CachingChatClient:
+    """
+    ChatClient that can answer repeated requests from the LLM response cache.
+
+    Each call picks a `cache_policy`; with "off" (the default) it goes straight to `inner`. Hits
+    skip the rate limiter, replay their content to `stream_to` as one fragment, and record
+    `cache_hit` and `cached_duration_ms` (the original call's latency) in metadata. Usage is the
+    original call's, so debate token budgets behave as in the run that filled the cache. Cache
+    errors are logged and treated as misses.
+    """
+
+    def __init__(self, inner: ChatClient, *, cache: ResponseCache | None = None) -> None:
+        self._inner = inner
+        self._cache = cache
+
+    def _response_cache(self) -> ResponseCache:
+        if self._cache is None:
+            self._cache = get_response_cache()
+        return self._cache
+
+    def _lookup(self, key: str) -> ChatResult | None:
+        try:
+            raw = self._response_cache().get(key)
+        except Exception:
+            logger.warning("LLM response cache lookup failed", exc_info=True)
+            return None
+        return _decode_cached_response(raw) if raw is not None else None
+
+    def _store(self, key: str, result: ChatResult, *, duration_ms: int) -> None:
+        if not result.content:
+            return
+        try:
+            self._response_cache().put(
+                key, _encode_cached_response(result, duration_ms=duration_ms)
+            )
+        except Exception:
+            logger.warning("LLM response cache store failed", exc_info=True)
+
+    def chat_completion(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        max_tokens: int,
+        response_format: dict[str, Any] | None = None,
+        stream_to: DeltaSink | None = None,
+        temperature: float | None = None,
+        cache_policy: CachePolicy = "off",
+    ) -> ChatResult:
+        with tracer.start_as_current_span(
+            "chat_completion",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "gen_ai.request.model": model,
+                "gen_ai.request.max_tokens": max_tokens,
+                "llm_debate.cache_policy": cache_policy,
+                "llm_debate.streamed": stream_to is not None,
+            },
+        ) as span:
+            result = self._complete(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                response_format=response_format,
+                stream_to=stream_to,
+                temperature=temperature,
+                cache_policy=cache_policy,
+            )
+            span.set_attribute("llm_debate.cache_hit", result.metadata.get("cache_hit") is True)
+            for key in ("prompt_tokens", "completion_tokens"):
+                tokens = result.usage.get(key)
+                if isinstance(tokens, int):
+                    span.set_attribute(f"gen_ai.usage.{key}", tokens)
+            return result
+
+    def _complete(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        max_tokens: int,
+        response_format: dict[str, Any] | None,
+        stream_to: DeltaSink | None,
+        temperature: float | None,
+        cache_policy: CachePolicy,
+    ) -> ChatResult:
+        if cache_policy == "off":
+            return self._inner.chat_completion(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                response_format=response_format,
+                stream_to=stream_to,
+                temperature=temperature,
+            )
+
+        key = response_cache_key(
             model=model,
-            messages=cast(Any, messages),
+            messages=messages,
             max_tokens=max_tokens,
-            **extra,
+            response_format=response_format,
+            temperature=temperature,
         )
+        if cache_policy == "read_write":
+            cached = self._lookup(key)
+            if cached is not None:
+                if stream_to is not None:
+                    stream_to.reset()
+                    stream_to.push(cached.content)
+                    stream_to.flush()
+                return cached
 
-        message = response.choices[0].message
-        content = message.content or ""
+        started_at = time.perf_counter()
+        result = self._inner.chat_completion(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            response_format=response_format,
+            stream_to=stream_to,
+            temperature=temperature,
+        )
+        self._store(key, result, duration_ms=round((time.perf_counter() - started_at) * 1000))
+        return result
 
-        metadata: dict[str, Any] = {}
-        reasoning_content = getattr(message, "reasoning_content", None)
-        if reasoning_content:
-            metadata["has_reasoning_content"] = True
 
-        return ChatResult(
-            content=content,
-            model=getattr(response, "model", None),
-            usage=_usage_to_dict(getattr(response, "usage", None)),
-            metadata=metadata,
-        )
+def create_chat_client() -> CachingChatClient:
+    """Pick the LLM client for the configured worker execution mode, behind the response cache."""
+
+    inner: ChatClient
+    if load_settings().worker_execution_mode == "async":
+        inner = SharedLoopDeepSeekClient()
+    else:
+        inner = DeepSeekClient()
+    return CachingChatClient(inner)
 
 
 def safe_parse_json_object(text: str) -> dict[str, Any]:
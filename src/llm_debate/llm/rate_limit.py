@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+import threading
+import time
+from typing import Protocol
+
+import redis
+
+from llm_debate.core.settings import load_settings
+
+_KEY_PREFIX = "llm_debate:ratelimit:"
+
+
+class RateLimitedError(Exception):
+    """The model's request or token budget is exhausted; retry after `retry_after` seconds."""
+
+    def __init__(self, model: str, retry_after: float) -> None:
+        super().__init__(f"Rate limited for {model}; retry after {retry_after:.2f}s")
+        self.model = model
+        self.retry_after = retry_after
+
+
+def retry_after_seconds(headers: Mapping[str, str], *, default: float) -> float:
+    """Parse `retry-after-ms` / `Retry-After` (seconds or HTTP date) from a 429 response."""
+
+    raw_ms = headers.get("retry-after-ms")
+    if raw_ms:
+        try:
+            return max(0.0, float(raw_ms) / 1000)
+        except ValueError:
+            pass
+    raw = headers.get("retry-after")
+    if not raw:
+        return default
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return default
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(tz=UTC)).total_seconds())
+
+
+class RateLimiter(Protocol):
+    def acquire(self, model: str, tokens: int) -> float:
+        """Take one request and `tokens` from the model's buckets; return 0 or the wait needed."""
+        ...
+
+    def refund(self, model: str, tokens: int) -> None:
+        """Return over-reserved tokens once actual usage is known."""
+        ...
+
+    def block(self, model: str, seconds: float) -> None:
+        """Hold every caller of `model` back for `seconds` (provider Retry-After)."""
+        ...
+
+
+@dataclass
+class _Bucket:
+    level: float
+    updated_at: float
+
+
+def _refill(bucket: _Bucket, *, capacity: float, per_second: float, now: float) -> None:
+    bucket.level = min(capacity, bucket.level + max(0.0, now - bucket.updated_at) * per_second)
+    bucket.updated_at = now
+
+
+class InMemoryTokenBucketLimiter:
+    """
+    Per-model request and token buckets for a single process.
+
+    Each bucket holds up to one minute of budget and refills continuously. A limit of 0 disables
+    that bucket.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rpm = requests_per_minute
+        self._tpm = tokens_per_minute
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._requests: dict[str, _Bucket] = {}
+        self._tokens: dict[str, _Bucket] = {}
+        self._blocked_until: dict[str, float] = {}
+
+    def _bucket(self, buckets: dict[str, _Bucket], model: str, capacity: int, now: float) -> _Bucket:
+        bucket = buckets.get(model)
+        if bucket is None:
+            bucket = _Bucket(level=float(capacity), updated_at=now)
+            buckets[model] = bucket
+        _refill(bucket, capacity=capacity, per_second=capacity / 60, now=now)
+        return bucket
+
+    def acquire(self, model: str, tokens: int) -> float:
+        with self._lock:
+            now = self._clock()
+            blocked_until = self._blocked_until.get(model, 0.0)
+            if blocked_until > now:
+                return blocked_until - now
+
+            wait = 0.0
+            requests = self._bucket(self._requests, model, self._rpm, now) if self._rpm > 0 else None
+            if requests is not None and requests.level < 1:
+                wait = max(wait, (1 - requests.level) / (self._rpm / 60))
+            cost = min(tokens, self._tpm)
+            budget = self._bucket(self._tokens, model, self._tpm, now) if self._tpm > 0 else None
+            if budget is not None and budget.level < cost:
+                wait = max(wait, (cost - budget.level) / (self._tpm / 60))
+            if wait > 0:
+                return wait
+
+            if requests is not None:
+                requests.level -= 1
+            if budget is not None:
+                budget.level -= cost
+            return 0.0
+
+    def refund(self, model: str, tokens: int) -> None:
+        if self._tpm <= 0 or tokens <= 0:
+            return
+        with self._lock:
+            budget = self._bucket(self._tokens, model, self._tpm, self._clock())
+            budget.level = min(float(self._tpm), budget.level + tokens)
+
+    def block(self, model: str, seconds: float) -> None:
+        with self._lock:
+            until = self._clock() + seconds
+            self._blocked_until[model] = max(self._blocked_until.get(model, 0.0), until)
+
+
+# Same algorithm as InMemoryTokenBucketLimiter, atomically on Redis so every worker process shares
+# one budget per model. Uses the Redis clock so worker clock skew does not matter.
+# KEYS: requests bucket, tokens bucket, blocked-until. ARGV: rpm, tpm, tokens.
+# Returns the wait in seconds as a string (Lua numbers are truncated to integers on return).
+_ACQUIRE_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local rpm = tonumber(ARGV[1])
+local tpm = tonumber(ARGV[2])
+local cost = math.min(tonumber(ARGV[3]), tpm)
+
+local blocked = tonumber(redis.call('GET', KEYS[3]) or '0')
+if blocked > now then
+  return tostring(blocked - now)
+end
+
+local function level(key, capacity)
+  local v = redis.call('HMGET', key, 'level', 'ts')
+  local current = tonumber(v[1]) or capacity
+  local ts = tonumber(v[2]) or now
+  return math.min(capacity, current + math.max(0, now - ts) * capacity / 60)
+end
+
+local wait = 0
+local requests = 0
+local tokens = 0
+if rpm > 0 then
+  requests = level(KEYS[1], rpm)
+  if requests < 1 then
+    wait = math.max(wait, (1 - requests) / (rpm / 60))
+  end
+end
+if tpm > 0 then
+  tokens = level(KEYS[2], tpm)
+  if tokens < cost then
+    wait = math.max(wait, (cost - tokens) / (tpm / 60))
+  end
+end
+if wait > 0 then
+  return tostring(wait)
+end
+
+if rpm > 0 then
+  redis.call('HSET', KEYS[1], 'level', tostring(requests - 1), 'ts', tostring(now))
+  redis.call('EXPIRE', KEYS[1], 120)
+end
+if tpm > 0 then
+  redis.call('HSET', KEYS[2], 'level', tostring(tokens - cost), 'ts', tostring(now))
+  redis.call('EXPIRE', KEYS[2], 120)
+end
+return '0'
+"""
+
+# KEYS: tokens bucket. ARGV: tpm, tokens.
+_REFUND_LUA = """
+local v = redis.call('HMGET', KEYS[1], 'level', 'ts')
+if not v[1] then
+  return 0
+end
+local level = math.min(tonumber(ARGV[1]), tonumber(v[1]) + tonumber(ARGV[2]))
+redis.call('HSET', KEYS[1], 'level', tostring(level))
+return 1
+"""
+
+# KEYS: blocked-until. ARGV: seconds.
+_BLOCK_LUA = """
+local t = redis.call('TIME')
+local until_ts = tonumber(t[1]) + tonumber(t[2]) / 1000000 + tonumber(ARGV[1])
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if until_ts > current then
+  redis.call('SET', KEYS[1], tostring(until_ts), 'PX', math.ceil(tonumber(ARGV[1]) * 1000) + 1000)
+end
+return 1
+"""
+
+
+class RedisTokenBucketLimiter:
+    """Per-model request and token buckets shared by every process through Redis."""
+
+    def __init__(self, url: str, *, requests_per_minute: int, tokens_per_minute: int) -> None:
+        self._redis = redis.Redis.from_url(url)
+        self._rpm = requests_per_minute
+        self._tpm = tokens_per_minute
+        self._acquire = self._redis.register_script(_ACQUIRE_LUA)
+        self._refund = self._redis.register_script(_REFUND_LUA)
+        self._block = self._redis.register_script(_BLOCK_LUA)
+
+    @staticmethod
+    def _keys(model: str) -> list[str]:
+        prefix = f"{_KEY_PREFIX}{model}:"
+        return [f"{prefix}requests", f"{prefix}tokens", f"{prefix}blocked_until"]
+
+    def acquire(self, model: str, tokens: int) -> float:
+        wait = self._acquire(keys=self._keys(model), args=[self._rpm, self._tpm, tokens])
+        return float(wait)
+
+    def refund(self, model: str, tokens: int) -> None:
+        if self._tpm <= 0 or tokens <= 0:
+            return
+        self._refund(keys=self._keys(model)[1:2], args=[self._tpm, tokens])
+
+    def block(self, model: str, seconds: float) -> None:
+        self._block(keys=self._keys(model)[2:], args=[seconds])
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> RateLimiter | None:
+    """Return the process-wide LLM rate limiter, or None when no limit is configured."""
+
+    settings = load_settings()
+    if settings.llm_rate_limit_rpm <= 0 and settings.llm_rate_limit_tpm <= 0:
+        return None
+    if settings.llm_rate_limit_backend == "memory":
+        return InMemoryTokenBucketLimiter(
+            requests_per_minute=settings.llm_rate_limit_rpm,
+            tokens_per_minute=settings.llm_rate_limit_tpm,
+        )
+    return RedisTokenBucketLimiter(
+        str(settings.redis_url),
+        requests_per_minute=settings.llm_rate_limit_rpm,
+        tokens_per_minute=settings.llm_rate_limit_tpm,
+    )
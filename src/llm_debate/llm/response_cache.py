@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+import hashlib
+import threading
+import time
+from typing import Any, Literal, Protocol
+
+import orjson
+import redis
+
+from llm_debate.core.settings import load_settings
+
+# "read_write" answers repeated requests from the cache and stores misses; "refresh" skips
+# lookups but stores fresh responses.
+CachePolicy = Literal["off", "read_write", "refresh"]
+
+_KEY_PREFIX = "llm_debate:llm_cache:"
+
+
+def response_cache_key(
+    *,
+    model: str,
+    messages: list[dict[str, Any]],
+    max_tokens: int,
+    response_format: dict[str, Any] | None,
+    temperature: float | None,
+) -> str:
+    """Hash everything that shapes an LLM response into a stable cache key."""
+
+    request = {
+        "model": model,
+        "messages": messages,
+        "max_tokens": max_tokens,
+        "response_format": response_format,
+        "temperature": temperature,
+    }
+    return hashlib.sha256(orjson.dumps(request, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+class ResponseCache(Protocol):
+    def get(self, key: str) -> bytes | None: ...
+
+    def put(self, key: str, value: bytes) -> None: ...
+
+
+class InMemoryResponseCache:
+    """
+    Per-process LRU of encoded responses, bounded by total size and entry age.
+
+    Entries older than `ttl_seconds` are dropped on read; the least recently used entries are
+    evicted once the stored bytes exceed `max_bytes`.
+    """
+
+    def __init__(
+        self, *, max_bytes: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._size -= len(value)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: bytes) -> None:
+        if len(value) > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous[1])
+            self._entries[key] = (self._clock() + self._ttl, value)
+            self._size += len(value)
+            while self._size > self._max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+
+class RedisResponseCache:
+    """
+    Encoded responses shared by every process through Redis, expiring after `ttl_seconds`.
+
+    Size is bounded by the Redis server's `maxmemory` (use a `volatile-lru` eviction policy).
+    """
+
+    def __init__(self, url: str, *, ttl_seconds: int) -> None:
+        self._redis = redis.Redis.from_url(url)
+        self._ttl = ttl_seconds
+
+    def get(self, key: str) -> bytes | None:
+        value = self._redis.get(f"{_KEY_PREFIX}{key}")
+        return value if isinstance(value, bytes) else None
+
+    def put(self, key: str, value: bytes) -> None:
+        self._redis.set(f"{_KEY_PREFIX}{key}", value, ex=self._ttl)
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide LLM response cache."""
+
+    settings = load_settings()
+    if settings.llm_response_cache_backend == "memory":
+        return InMemoryResponseCache(
+            max_bytes=settings.llm_response_cache_max_bytes,
+            ttl_seconds=settings.llm_response_cache_ttl_seconds,
+        )
+    return RedisResponseCache(
+        str(settings.redis_url), ttl_seconds=settings.llm_response_cache_ttl_seconds
+    )
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+import uuid
+
+from llm_debate.runtime.cursor import Actor, cursor_from_last_turn
+from llm_debate.runtime.prompts import format_transcript
+from llm_debate.runtime.steps import sum_completion_tokens
+
+# (id, round, actor, content, usage) of a persisted turn.
+TurnRecord = tuple[uuid.UUID, int, str, str, dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class DebateAggregates:
+    next_round: int
+    next_actor: Actor
+    turn_count: int
+    total_completion_tokens: int
+    last_turn_id: uuid.UUID | None
+    transcript: str
+
+
+def aggregate_turns(turns: Sequence[TurnRecord]) -> DebateAggregates:
+    """Recompute a debate's cursor, running aggregates and transcript from its ordered turns."""
+
+    last = turns[-1] if turns else None
+    next_round, next_actor = cursor_from_last_turn(
+        last_round=last[1] if last is not None else None,
+        last_actor=last[2] if last is not None else None,
+    )
+    return DebateAggregates(
+        next_round=next_round,
+        next_actor=next_actor,
+        turn_count=len(turns),
+        total_completion_tokens=sum_completion_tokens([t[4] for t in turns]),
+        last_turn_id=last[0] if last is not None else None,
+        transcript=format_transcript([(t[1], t[2], t[3]) for t in turns]),
+    )
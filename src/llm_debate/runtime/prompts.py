@@ -41,8 +41,12 @@ def _normalize_prompt_version(version: str) -> str:
 
 @lru_cache(maxsize=32)
 def _load_template(*, version: str, name: str) -> str:
+    """Read a template; sets only ship the templates they change and take the rest from v1."""
+
     v = _normalize_prompt_version(version)
     path = files("llm_debate.prompts") / v / name
+    if not path.is_file():
+        path = files("llm_debate.prompts") / "v1" / name
     return path.read_text(encoding="utf-8")
 
 
@@ -95,16 +99,207 @@ def user_prompt(
     )
 
 
+def _has_template(*, version: str, name: str) -> bool:
+    v = _normalize_prompt_version(version)
+    return (files("llm_debate.prompts") / v / name).is_file()
+
+
+def prompt_messages(
+    topic: str,
+    transcript: str,
+    actor: Actor,
+    round_number: int,
+    *,
+    debater_a_side: Side,
+    language: OutputLanguage,
+    prompt_version: str = "v1",
+) -> list[dict[str, str]]:
+    """
+    Build the chat messages for one debate step.
+
+    Template sets that ship a `context_system.txt` (v2 and later) use a prefix-cache friendly
+    layout: an actor-agnostic system message with the topic and append-only transcript first,
+    then the actor's system prompt and per-step instructions last. Every step of the debate,
+    whichever actor takes it, therefore shares the prompt up to the newest turn, which
+    DeepSeek bills and serves as cache hits.
+    """
+
+    messages: list[dict[str, str]] = []
+    if _has_template(version=prompt_version, name="context_system.txt"):
+        context = _load_template(version=prompt_version, name="context_system.txt").format(
+            topic=topic,
+            transcript=transcript,
+            language_rule=_language_instruction(language),
+        )
+        messages.append({"role": "system", "content": context})
+    messages.append(
+        {
+            "role": "system",
+            "content": system_prompt(
+                actor,
+                debater_a_side=debater_a_side,
+                language=language,
+                prompt_version=prompt_version,
+            ),
+        }
+    )
+    messages.append(
+        {
+            "role": "user",
+            "content": user_prompt(
+                topic,
+                transcript,
+                actor,
+                round_number,
+                debater_a_side=debater_a_side,
+                language=language,
+                prompt_version=prompt_version,
+            ),
+        }
+    )
+    return messages
+
+
+def round_judge_messages(
+    topic: str,
+    transcript: str,
+    round_number: int,
+    *,
+    language: OutputLanguage,
+    prompt_version: str = "v1",
+) -> list[dict[str, str]]:
+    """Build the chat messages for the lightweight `per_round` judge."""
+
+    language_rule = _language_instruction(language)
+    system = _load_template(version=prompt_version, name="round_judge_system.txt")
+    user = _load_template(version=prompt_version, name="round_judge_user.txt")
+    return [
+        {"role": "system", "content": system.format(language_rule=language_rule)},
+        {
+            "role": "user",
+            "content": user.format(
+                topic=topic,
+                transcript=transcript,
+                round_number=round_number,
+                language_rule=language_rule,
+            ),
+        },
+    ]
+
+
+def format_transcript_line(round_number: int, actor: str, content: str) -> str:
+    if actor == "debater_a":
+        label = "A"
+    elif actor == "debater_b":
+        label = "B"
+    elif actor == "judge":
+        label = "Judge"
+    else:
+        label = actor
+    return f"Round {round_number} - {label}: {content}"
+
+
 def format_transcript(turns: list[tuple[int, str, str]]) -> str:
-    lines: list[str] = []
-    for round_number, actor, content in turns:
-        if actor == "debater_a":
-            label = "A"
-        elif actor == "debater_b":
-            label = "B"
-        elif actor == "judge":
-            label = "Judge"
-        else:
-            label = actor
-        lines.append(f"Round {round_number} - {label}: {content}")
+    lines = [format_transcript_line(r, actor, content) for r, actor, content in turns]
     return "\n".join(lines).strip()
+
+
+def append_transcript(transcript: str, round_number: int, actor: str, content: str) -> str:
+    """
+    Append one turn to an already formatted transcript.
+
+    Equivalent to re-running `format_transcript` over all turns, without revisiting them.
+    """
+
+    line = format_transcript_line(round_number, actor, content)
+    if not transcript:
+        return line.strip()
+    return f"{transcript}\n{line}".strip()
+
+
+_CJK_RE = re.compile(r"[\u3000-\u303f\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uff00-\uffef]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheaply estimate the token count of `text`.
+
+    Roughly 4 characters per token for Latin text and 0.6 tokens per CJK character, which is
+    close enough to pick a compaction window without calling a tokenizer.
+    """
+
+    cjk = len(_CJK_RE.findall(text))
+    other = len(text) - cjk
+    return int(cjk * 0.6 + other / 4 + 0.999)
+
+
+def verbatim_window_start(
+    turns: list[tuple[int, str, str]],
+    *,
+    budget_tokens: int,
+    min_turns: int = 2,
+) -> int:
+    """
+    Return the index of the first turn to keep verbatim.
+
+    Walks back from the newest turn while the turns fit in `budget_tokens` (always keeping at
+    least `min_turns`), then widens the window to the start of its oldest round so that older
+    context is summarized in whole rounds only.
+    """
+
+    if not turns:
+        return 0
+
+    start = len(turns)
+    used = 0
+    while start > 0:
+        cost = estimate_tokens(format_transcript_line(*turns[start - 1]))
+        if len(turns) - start >= min_turns and used + cost > budget_tokens:
+            break
+        used += cost
+        start -= 1
+
+    while 0 < start < len(turns) and turns[start - 1][0] == turns[start][0]:
+        start -= 1
+    return start
+
+
+def compact_transcript(
+    summary: str | None,
+    summary_through_round: int,
+    recent_turns: list[tuple[int, str, str]],
+) -> str:
+    """Render a rolling summary of rounds 1..`summary_through_round` followed by recent turns."""
+
+    recent = format_transcript(recent_turns)
+    if not summary or summary_through_round < 1:
+        return recent
+    if summary_through_round == 1:
+        header = "Summary of round 1:"
+    else:
+        header = f"Summary of rounds 1-{summary_through_round}:"
+    return f"{header}\n{summary.strip()}\n\nRecent turns:\n{recent}".strip()
+
+
+def summary_system_prompt(*, language: OutputLanguage, prompt_version: str = "v1") -> str:
+    return _load_template(version=prompt_version, name="summary_system.txt").format(
+        language_rule=_language_instruction(language),
+    )
+
+
+def summary_user_prompt(
+    topic: str,
+    previous_summary: str | None,
+    new_turns: str,
+    *,
+    through_round: int,
+    language: OutputLanguage,
+    prompt_version: str = "v1",
+) -> str:
+    return _load_template(version=prompt_version, name="summary_user.txt").format(
+        topic=topic,
+        previous_summary=previous_summary.strip() if previous_summary else "(none)",
+        new_turns=new_turns,
+        through_round=through_round,
+        language_rule=_language_instruction(language),
+    )
@@ -60,15 +60,68 @@ def should_stop_for_rounds(*, settings: dict[str, Any], completed_rounds: int) -
     return completed_rounds >= max_rounds
 
 
+def completion_tokens_from_usage(usage: dict[str, Any]) -> int:
+    completion_tokens = usage.get("completion_tokens")
+    if isinstance(completion_tokens, int):
+        return completion_tokens
+    return 0
+
+
 def sum_completion_tokens(usages: list[dict[str, Any]]) -> int:
-    total = 0
+    return sum(completion_tokens_from_usage(usage) for usage in usages)
+
+
+def sum_usage(usages: list[dict[str, Any]]) -> dict[str, int]:
+    """Add up the integer counters of several usage payloads (nested details are dropped)."""
+
+    total: dict[str, int] = {}
     for usage in usages:
-        completion_tokens = usage.get("completion_tokens")
-        if isinstance(completion_tokens, int):
-            total += completion_tokens
+        for key, value in usage.items():
+            if isinstance(value, int) and not isinstance(value, bool):
+                total[key] = total.get(key, 0) + value
     return total
 
 
+def prompt_cache_tokens_from_usage(usage: dict[str, Any]) -> dict[str, int]:
+    """
+    Extract DeepSeek prompt cache counters from a usage payload.
+
+    Falls back to the OpenAI-style `prompt_tokens_details.cached_tokens` when the DeepSeek
+    fields are missing. Returns an empty dict when the provider reports neither.
+    """
+
+    hit = usage.get("prompt_cache_hit_tokens")
+    miss = usage.get("prompt_cache_miss_tokens")
+    if isinstance(hit, int) and isinstance(miss, int):
+        return {"prompt_cache_hit_tokens": hit, "prompt_cache_miss_tokens": miss}
+
+    details = usage.get("prompt_tokens_details")
+    prompt_tokens = usage.get("prompt_tokens")
+    cached = details.get("cached_tokens") if isinstance(details, dict) else None
+    if isinstance(cached, int) and isinstance(prompt_tokens, int):
+        return {
+            "prompt_cache_hit_tokens": cached,
+            "prompt_cache_miss_tokens": max(0, prompt_tokens - cached),
+        }
+    return {}
+
+
+def prompt_cache_hit_ratio(turn_metadata: list[dict[str, Any]]) -> float | None:
+    """Share of prompt tokens served from the prompt cache across turns, or None if unreported."""
+
+    hit = 0
+    total = 0
+    for meta in turn_metadata:
+        turn_hit = meta.get("prompt_cache_hit_tokens")
+        turn_miss = meta.get("prompt_cache_miss_tokens")
+        if isinstance(turn_hit, int) and isinstance(turn_miss, int):
+            hit += turn_hit
+            total += turn_hit + turn_miss
+    if total == 0:
+        return None
+    return hit / total
+
+
 def should_stop_for_token_budget(*, settings: dict[str, Any], total_completion_tokens: int) -> bool:
     max_total_output_tokens = int(settings.get("max_total_output_tokens", 8000))
     return total_completion_tokens >= max_total_output_tokens
@@ -82,3 +135,62 @@ def judge_no_new_streak(judge_turn_metadata: list[dict[str, Any]]) -> int:
         else:
             break
     return streak
+
+
+def should_stop_for_no_new_arguments(
+    *,
+    settings: dict[str, Any],
+    next_actor: str,
+    completed_rounds: int,
+    round_verdicts: dict[int, dict[str, Any]],
+) -> bool:
+    """
+    Stop a `judge_mode="per_round"` debate once the last rounds added nothing new.
+
+    Only checked at a round boundary (debater A is next), so the debate never ends mid-round.
+    Round N is judged while debater A opens round N+1, so the streak ends at the latest judged
+    round: `completed_rounds` if its verdict is in, else the one before. `round_verdicts` maps
+    judged rounds to their verdicts; a round without one breaks the streak, so a failed round
+    judge never stops a debate on its own.
+    """
+
+    if settings.get("judge_mode") != "per_round" or next_actor != "debater_a":
+        return False
+    threshold = int(settings.get("no_new_arguments_streak", 2))
+    judged_through = completed_rounds if completed_rounds in round_verdicts else completed_rounds - 1
+    if threshold < 1 or judged_through < threshold:
+        return False
+    judged = [round_verdicts.get(r, {}) for r in range(1, judged_through + 1)]
+    return judge_no_new_streak(judged) >= threshold
+
+
+def speculative_next_step(
+    *,
+    settings: dict[str, Any],
+    actor: Actor,
+    step_round: int,
+    created_at: datetime,
+    total_completion_tokens: int,
+) -> NextStep | None:
+    """
+    Predict the step after a debater turn so it can start before that turn is persisted.
+
+    Mirrors the stop checks made when the next step is claimed, with `total_completion_tokens`
+    already counting the new turn. Returns None when the next step must not start early: in
+    `judge_mode="per_round"`, debater A's opening turn also launches the round judge.
+    """
+
+    completed_rounds = step_round if actor == "debater_b" else step_round - 1
+    if (
+        should_stop_for_rounds(settings=settings, completed_rounds=completed_rounds)
+        or should_stop_for_runtime(settings=settings, created_at=created_at)
+        or should_stop_for_token_budget(
+            settings=settings, total_completion_tokens=total_completion_tokens
+        )
+    ):
+        return NextStep(round=max(1, completed_rounds), actor="judge")
+    if actor == "debater_a":
+        return NextStep(round=step_round, actor="debater_b")
+    if settings.get("judge_mode") == "per_round":
+        return None
+    return NextStep(round=step_round + 1, actor="debater_a")
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+import uuid
+
+import orjson
+from pydantic import BaseModel
+
+
+class TurnOut(BaseModel):
+    """A turn as the API returns it, the worker stores it and SSE subscribers receive it."""
+
+    id: uuid.UUID
+    debate_id: uuid.UUID
+    round: int
+    actor: str
+    content: str | None = None
+    model: str | None = None
+    usage: dict[str, Any] | None = None
+    metadata: dict[str, Any] | None = None
+    created_at: datetime
+
+
+def encode_turn(turn: TurnOut) -> bytes:
+    """Serialize `turn` to the JSON payload stored in `turns.payload_json`."""
+
+    return orjson.dumps(turn.model_dump(mode="json"))
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Sequence
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+# Temperatures a default judge panel is spread across, so its judges sample different verdicts.
+_PANEL_TEMPERATURE_RANGE = (0.2, 1.0)
+
+
+class JudgeVerdict(BaseModel):
+    summary: str = Field(min_length=1)
+    score_a: int = Field(ge=0, le=10)
+    score_b: int = Field(ge=0, le=10)
+    winner: Literal["a", "b", "tie"]
+    no_new_substantive_arguments: bool
+
+
+def default_panel_temperatures(size: int) -> list[float | None]:
+    """
+    Temperatures for a panel of `size` copies of the judge model, evenly spread over the range.
+
+    Identical copies at the provider's default temperature would mostly repeat one verdict. A
+    single judge keeps the default.
+    """
+
+    if size <= 1:
+        return [None]
+    low, high = _PANEL_TEMPERATURE_RANGE
+    step = (high - low) / (size - 1)
+    return [round(low + i * step, 2) for i in range(size)]
+
+
+def aggregate_verdicts(verdicts: Sequence[JudgeVerdict]) -> JudgeVerdict:
+    """
+    Combine a judge panel's verdicts into one.
+
+    Scores are averaged (rounded). The winner is the strict majority vote; without one, the higher
+    mean score wins and equal means are a tie. `no_new_substantive_arguments` needs a strict
+    majority. The summary comes from the first judge that agrees with the combined winner.
+    """
+
+    if not verdicts:
+        raise ValueError("No verdicts to aggregate")
+
+    mean_a = sum(v.score_a for v in verdicts) / len(verdicts)
+    mean_b = sum(v.score_b for v in verdicts) / len(verdicts)
+    top, top_votes = Counter(v.winner for v in verdicts).most_common(1)[0]
+    winner: Literal["a", "b", "tie"]
+    if top_votes * 2 > len(verdicts):
+        winner = top
+    elif mean_a != mean_b:
+        winner = "a" if mean_a > mean_b else "b"
+    else:
+        winner = "tie"
+    summary = next((v.summary for v in verdicts if v.winner == winner), verdicts[0].summary)
+    stale_votes = sum(1 for v in verdicts if v.no_new_substantive_arguments)
+    return JudgeVerdict(
+        summary=summary,
+        score_a=round(mean_a),
+        score_b=round(mean_b),
+        winner=winner,
+        no_new_substantive_arguments=stale_votes * 2 > len(verdicts),
+    )
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import os
+import time
+from typing import Any
+
 from celery import Celery
+from celery.signals import before_task_publish, worker_init, worker_process_shutdown
 
+from llm_debate.core.metrics import mark_process_dead, start_metrics_server
 from llm_debate.core.settings import load_settings
+from llm_debate.core.tracing import configure_tracing, inject_task_headers
 
 settings = load_settings()
 
@@ -21,3 +28,43 @@ celery_app.conf.update(
     enable_utc=True,
 )
 
+if settings.reaper_interval_seconds > 0:
+    # Run by `celery beat` (or a worker started with `-B`); see `reap_stalled_debates`.
+    celery_app.conf.beat_schedule = {
+        "reap-stalled-debates": {
+            "task": "llm_debate.worker.tasks.reap_stalled_debates",
+            "schedule": settings.reaper_interval_seconds,
+            # A sweep that waited longer than an interval is superseded by the next one.
+            "options": {"expires": settings.reaper_interval_seconds},
+        }
+    }
+
+if settings.worker_execution_mode == "async":
+    # Steps spend almost all their time awaiting the LLM on the shared event loop (see
+    # `llm_debate.llm.deepseek.SharedLoopDeepSeekClient`), so threads are cheap slots.
+    celery_app.conf.update(
+        worker_pool="threads",
+        worker_concurrency=settings.worker_async_concurrency,
+    )
+
+
+def _stamp_headers(headers: dict[str, Any] | None = None, **_: Any) -> None:
+    # Read back by the task for queue lag (`llm_debate_task_queue_lag_seconds`) and tracing.
+    if headers is not None:
+        headers["published_at"] = time.time()
+        inject_task_headers(headers)
+
+
+def _on_worker_init(**_: Any) -> None:
+    configure_tracing("llm-debate-worker")
+    if settings.worker_metrics_port > 0:
+        start_metrics_server(settings.worker_metrics_port)
+
+
+def _on_worker_process_shutdown(pid: int | None = None, **_: Any) -> None:
+    mark_process_dead(pid or os.getpid())
+
+
+before_task_publish.connect(_stamp_headers, weak=False)
+worker_init.connect(_on_worker_init, weak=False)
+worker_process_shutdown.connect(_on_worker_process_shutdown, weak=False)
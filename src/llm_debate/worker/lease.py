@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from llm_debate.db.engine import session_scope
+from llm_debate.db.leases import (
+    build_acquire_lease_stmt,
+    build_release_lease_stmt,
+    build_renew_lease_stmt,
+)
+from llm_debate.db.models import Debate
+
+logger = logging.getLogger(__name__)
+
+
+def lease_owner_id() -> str:
+    """Identify this driver (host, process and thread) in `debates.lease_owner`."""
+
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def acquire_lease(
+    factory: sessionmaker[Session], debate_id: uuid.UUID, owner: str, *, lease_seconds: float
+) -> bool:
+    with session_scope(factory) as db:
+        stmt = build_acquire_lease_stmt(
+            debate_id=debate_id, owner=owner, lease_seconds=lease_seconds
+        )
+        return db.execute(stmt).scalar_one_or_none() is not None
+
+
+def release_lease(factory: sessionmaker[Session], debate_id: uuid.UUID, owner: str) -> None:
+    with session_scope(factory) as db:
+        db.execute(build_release_lease_stmt(debate_id=debate_id, owner=owner))
+
+
+class LeaseHeartbeat:
+    """
+    Renew a driver lease from a background thread until stopped.
+
+    `lost` is set once the lease turns out to belong to someone else (it expired and was taken
+    over); the driver must stop stepping the debate at its next step boundary.
+    """
+
+    def __init__(
+        self,
+        factory: sessionmaker[Session],
+        debate_id: uuid.UUID,
+        owner: str,
+        *,
+        lease_seconds: float,
+        interval_seconds: float,
+    ) -> None:
+        self._factory = factory
+        self._debate_id = debate_id
+        self._owner = owner
+        self._lease_seconds = lease_seconds
+        self._interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self.lost = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"lease-heartbeat-{debate_id}", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def renew(self) -> bool:
+        """Extend the lease; False only when it is no longer ours."""
+
+        with session_scope(self._factory) as db:
+            stmt = build_renew_lease_stmt(
+                debate_id=self._debate_id, owner=self._owner, lease_seconds=self._lease_seconds
+            )
+            if db.execute(stmt).scalar_one_or_none() is not None:
+                return True
+            # Nothing renewed: either the row is locked by our own step right now (retry on the
+            # next beat) or the lease moved to another driver.
+            current = db.execute(
+                select(Debate.lease_owner).where(Debate.id == self._debate_id)
+            ).scalar_one_or_none()
+            return current == self._owner
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_seconds):
+            try:
+                if not self.renew():
+                    self.lost.set()
+                    return
+            except Exception:
+                logger.warning("Lease renewal failed for debate %s", self._debate_id, exc_info=True)
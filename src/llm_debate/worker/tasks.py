@@ -1,48 +1,382 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+import logging
+import random
+import threading
 import time
 from typing import Any, Literal
 import uuid
 
-from pydantic import BaseModel, Field, ValidationError
+from celery.signals import worker_shutting_down
+from opentelemetry import trace
+from pydantic import ValidationError
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy.orm.exc import StaleDataError
 
-from llm_debate.core.settings import load_settings
+from llm_debate.core.metrics import (
+    DEBATE_VERSION_CONFLICTS,
+    STALLED_DEBATES_RECOVERED,
+    STEP_OUTCOMES,
+    STEP_PHASE_SECONDS,
+    TASK_QUEUE_LAG_SECONDS,
+)
+from llm_debate.core.settings import Settings, load_settings
 from llm_debate.core.time import utcnow
+from llm_debate.core.tracing import record_span, task_span
+from llm_debate.db.debate_writes import build_reap_stalled_stmt
 from llm_debate.db.engine import create_db_engine, create_sessionmaker, session_scope
-from llm_debate.db.models import Debate, Turn
-from llm_debate.db.turn_writes import build_insert_turn_idempotent_stmt
-from llm_debate.llm.deepseek import DeepSeekClient, safe_parse_json_object
+from llm_debate.db.models import Debate, DebateRoundVerdict, DebateSummary, Turn
+from llm_debate.db.turn_writes import (
+    build_insert_round_verdict_idempotent_stmt,
+    build_insert_summary_idempotent_stmt,
+    build_insert_turn_idempotent_stmt,
+)
+from llm_debate.events.bus import BusMessage, get_event_bus
+from llm_debate.events.coalesce import DeltaCoalescer
+from llm_debate.llm.deepseek import ChatResult, create_chat_client, safe_parse_json_object
+from llm_debate.llm.rate_limit import RateLimitedError
+from llm_debate.llm.response_cache import CachePolicy
+from llm_debate.runtime.aggregates import aggregate_turns
 from llm_debate.runtime.cursor import cursor_after_step, cursor_from_last_turn
 from llm_debate.runtime.model_select import select_model_for_actor
 from llm_debate.runtime.prompts import (
     OutputLanguage,
     Side,
+    append_transcript,
+    compact_transcript,
+    estimate_tokens,
     format_transcript,
-    system_prompt,
-    user_prompt,
+    prompt_messages,
+    round_judge_messages,
+    summary_system_prompt,
+    summary_user_prompt,
+    verbatim_window_start,
 )
 from llm_debate.runtime.status import Actor, status_after_persisted_step
 from llm_debate.runtime.steps import (
+    completion_tokens_from_usage,
+    prompt_cache_tokens_from_usage,
+    should_stop_for_no_new_arguments,
     should_stop_for_rounds,
     should_stop_for_runtime,
     should_stop_for_token_budget,
-    sum_completion_tokens,
+    speculative_next_step,
+    sum_usage,
+)
+from llm_debate.runtime.turns import TurnOut, encode_turn
+from llm_debate.runtime.verdicts import (
+    JudgeVerdict,
+    aggregate_verdicts,
+    default_panel_temperatures,
 )
 from llm_debate.worker.celery_app import celery_app
+from llm_debate.worker.lease import (
+    LeaseHeartbeat,
+    acquire_lease,
+    lease_owner_id,
+    release_lease,
+)
+
+logger = logging.getLogger(__name__)
 
 _ENGINE = create_db_engine()
 _SESSIONMAKER = create_sessionmaker(_ENGINE)
-_CLIENT = DeepSeekClient()
+_CLIENT = create_chat_client()
+
+StepOutcome = Literal["continue", "done", "conflict"]
+
+# Versioned persists retried in-process before the step is re-enqueued.
+_PERSIST_ATTEMPTS = 3
+
+# Set on warm shutdown; drivers hand their debate back to the queue at the next step boundary.
+_SHUTTING_DOWN = threading.Event()
+
+
+def _on_worker_shutting_down(**_: Any) -> None:
+    _SHUTTING_DOWN.set()
+
+
+worker_shutting_down.connect(_on_worker_shutting_down, weak=False)
+
+# Rounds loaded when choosing the verbatim window; older rounds are always summarized.
+_MAX_VERBATIM_ROUNDS = 6
+
+
+def _parse_verdict(content: str) -> JudgeVerdict | None:
+    try:
+        return JudgeVerdict.model_validate(safe_parse_json_object(content))
+    except (ValueError, ValidationError):
+        return None
+
+
+@dataclass(frozen=True)
+class _Panelist:
+    model: str
+    temperature: float | None
+
+
+def _judge_panel(debate_settings: dict[str, Any], settings: Settings) -> list[_Panelist]:
+    judge_model = select_model_for_actor(
+        actor="judge", debate_settings=debate_settings, defaults=settings
+    )
+    configured = debate_settings.get("judge_panel")
+    if isinstance(configured, list) and configured:
+        return [
+            _Panelist(
+                model=str(member.get("model") or judge_model),
+                temperature=member.get("temperature"),
+            )
+            for member in configured
+        ]
+    return [
+        _Panelist(model=judge_model, temperature=temperature)
+        for temperature in default_panel_temperatures(max(1, settings.debate_judge_panel_size))
+    ]
+
+
+def _run_judge_panel(
+    panel: list[_Panelist], *, messages: list[dict[str, Any]], max_tokens: int
+) -> ChatResult:
+    """
+    Ask every panelist concurrently and fold the valid verdicts into one judge result.
+
+    Wall-clock is the slowest judge, not the sum. Per-judge verdicts land in
+    `metadata["judge_panel"]`; invalid ones and failed calls are recorded but not counted. Only
+    when every judge call fails is the error raised (a rate limit first, so the step is deferred).
+    """
+
+    def ask(panelist: _Panelist) -> tuple[ChatResult, int]:
+        started_at = time.perf_counter()
+        result = _CLIENT.chat_completion(
+            model=panelist.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+            temperature=panelist.temperature,
+        )
+        return result, round((time.perf_counter() - started_at) * 1000)
+
+    # Each thread runs in a copy of the caller's context so its LLM spans join the step's trace.
+    with ThreadPoolExecutor(max_workers=len(panel), thread_name_prefix="judge-panel") as pool:
+        calls = [pool.submit(contextvars.copy_context().run, ask, p) for p in panel]
+        outcomes: list[tuple[ChatResult, int] | Exception] = []
+        for panelist, call in zip(panel, calls, strict=True):
+            try:
+                outcomes.append(call.result())
+            except Exception as exc:
+                logger.warning("Judge panelist %s failed", panelist.model, exc_info=True)
+                outcomes.append(exc)
+
+    failures = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+    if len(failures) == len(outcomes):
+        raise next((e for e in failures if isinstance(e, RateLimitedError)), failures[0])
+
+    verdicts: list[JudgeVerdict] = []
+    entries: list[dict[str, Any]] = []
+    usages: list[dict[str, Any]] = []
+    for panelist, outcome in zip(panel, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            entries.append(
+                {
+                    "model": panelist.model,
+                    "temperature": panelist.temperature,
+                    "valid": False,
+                    "error": repr(outcome),
+                }
+            )
+            continue
+        result, duration_ms = outcome
+        usages.append(result.usage)
+        entry: dict[str, Any] = {
+            "model": result.model or panelist.model,
+            "temperature": panelist.temperature,
+            "duration_ms": duration_ms,
+            "usage": result.usage,
+        }
+        verdict = _parse_verdict(result.content.strip())
+        entry["valid"] = verdict is not None
+        if verdict is not None:
+            verdicts.append(verdict)
+            entry.update(verdict.model_dump())
+        entries.append(entry)
+
+    models = dict.fromkeys(str(entry["model"]) for entry in entries)
+    return ChatResult(
+        # An empty content falls through to the usual invalid-verdict handling.
+        content=aggregate_verdicts(verdicts).model_dump_json() if verdicts else "",
+        model=",".join(models),
+        usage=sum_usage(usages),
+        metadata={"judge_panel": entries, "judge_panel_valid": len(verdicts)},
+    )
+
+
+def _cache_policy(debate_settings: dict[str, Any]) -> CachePolicy:
+    policy = debate_settings.get("cache_policy")
+    return policy if policy in {"read_write", "refresh"} else "off"
+
+
+def _prompt_options(debate_settings: dict[str, Any]) -> tuple[Side, OutputLanguage, str]:
+    """Return the debate's (debater A side, output language, prompt version)."""
+
+    raw_side = str(debate_settings.get("debater_a_side") or "pro").strip().lower()
+    debater_a_side: Side = "con" if raw_side == "con" else "pro"
+    output_language_raw = str(debate_settings.get("output_language") or "").strip()
+    output_language: OutputLanguage = output_language_raw if output_language_raw else "zh-Hant"  # type: ignore[assignment]
+    if output_language not in {"zh-Hant", "zh-Hans", "en"}:
+        output_language = "zh-Hant"
+    prompt_version = str(debate_settings.get("prompt_version") or "v1").strip() or "v1"
+    return debater_a_side, output_language, prompt_version
+
+
+def _step_messages(
+    actor: Actor, step_round: int, *, topic: str, transcript: str, debate_settings: dict[str, Any]
+) -> list[dict[str, str]]:
+    debater_a_side, output_language, prompt_version = _prompt_options(debate_settings)
+    return prompt_messages(
+        topic,
+        transcript,
+        actor,
+        step_round,
+        debater_a_side=debater_a_side,
+        language=output_language,
+        prompt_version=prompt_version,
+    )
+
+
+def _step_max_tokens(actor: Actor, debate_settings: dict[str, Any], settings: Settings) -> int:
+    if actor == "judge":
+        return int(debate_settings.get("max_tokens_judge") or settings.debate_max_tokens_judge)
+    return int(debate_settings.get("max_tokens_debater") or settings.debate_max_tokens_debater)
+
 
+def _call_step(
+    actor: Actor,
+    step_round: int,
+    *,
+    topic: str,
+    transcript: str,
+    debate_settings: dict[str, Any],
+    settings: Settings,
+    stream_to: DeltaCoalescer | None = None,
+) -> tuple[ChatResult, int]:
+    """Ask the LLM for one step's turn; returns the result and its duration in milliseconds."""
 
-class JudgeVerdict(BaseModel):
-    summary: str = Field(min_length=1)
-    score_a: int = Field(ge=0, le=10)
-    score_b: int = Field(ge=0, le=10)
-    winner: Literal["a", "b", "tie"]
-    no_new_substantive_arguments: bool
+    messages = _step_messages(
+        actor, step_round, topic=topic, transcript=transcript, debate_settings=debate_settings
+    )
+    max_tokens = _step_max_tokens(actor, debate_settings, settings)
+    started_at = time.perf_counter()
+    if actor == "judge" and debate_settings.get("judge_mode") == "panel":
+        result = _run_judge_panel(
+            _judge_panel(debate_settings, settings), messages=messages, max_tokens=max_tokens
+        )
+    else:
+        result = _CLIENT.chat_completion(
+            model=select_model_for_actor(
+                actor=actor, debate_settings=debate_settings, defaults=settings
+            ),
+            messages=messages,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"} if actor == "judge" else None,
+            stream_to=stream_to,
+            cache_policy=_cache_policy(debate_settings),
+        )
+    return result, round((time.perf_counter() - started_at) * 1000)
+
+
+@dataclass(frozen=True)
+class _Speculation:
+    """A step whose LLM call started before the previous turn was persisted."""
+
+    round: int
+    actor: Actor
+    prompt_transcript: str
+    call: Future[tuple[ChatResult, int]]
+
+
+# Speculated next steps of debates advanced by this process, consumed by their next step.
+_SPECULATIONS: dict[uuid.UUID, _Speculation] = {}
+
+
+@lru_cache(maxsize=1)
+def _speculation_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(thread_name_prefix="speculative-step")
+
+
+@lru_cache(maxsize=1)
+def _round_judge_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(thread_name_prefix="round-judge")
+
+
+def _speculate_next_step(
+    debate_uuid: uuid.UUID,
+    *,
+    actor: Actor,
+    step_round: int,
+    content: str,
+    transcript: str,
+    compaction: _CompactionPlan | None,
+    summary: str | None,
+    topic: str,
+    debate_settings: dict[str, Any],
+    settings: Settings,
+    created_at: Any,
+    total_completion_tokens: int,
+) -> None:
+    """
+    Start the LLM call of the step that follows this debater turn (`settings.speculative`).
+
+    The next step uses the result only if it finds the same round, actor and prompt transcript;
+    otherwise the call's tokens are wasted. Speculated turns are not streamed. Over the context
+    budget, the next step is speculated only while it can reuse this step's summary.
+    """
+
+    step = speculative_next_step(
+        settings=debate_settings,
+        actor=actor,
+        step_round=step_round,
+        created_at=created_at,
+        total_completion_tokens=total_completion_tokens,
+    )
+    if step is None:
+        return
+    next_transcript = append_transcript(transcript, step_round, actor, content)
+    prompt_transcript: str | None = next_transcript
+    context_budget = int(debate_settings.get("context_budget_tokens") or 0)
+    if context_budget > 0 and estimate_tokens(next_transcript) > context_budget:
+        prompt_transcript = _compacted_with_turn(
+            compaction,
+            summary,
+            (step_round, actor, content),
+            # The cursor the next step is claimed at (a judge step sits one round ahead).
+            next_round=step.round + 1 if step.actor == "judge" else step.round,
+            budget_tokens=context_budget,
+        )
+    if prompt_transcript is None:
+        # That step must summarize more rounds first.
+        return
+    _SPECULATIONS[debate_uuid] = _Speculation(
+        round=step.round,
+        actor=step.actor,
+        prompt_transcript=prompt_transcript,
+        call=_speculation_pool().submit(
+            contextvars.copy_context().run,
+            _call_step,
+            step.actor,
+            step.round,
+            topic=topic,
+            transcript=prompt_transcript,
+            debate_settings=debate_settings,
+            settings=settings,
+        ),
+    )
 
 
 def _render_judge_content(verdict: JudgeVerdict, *, language: OutputLanguage) -> str:
@@ -69,56 +403,460 @@ def _ensure_uuid(text: str) -> uuid.UUID:
     return uuid.UUID(text)
 
 
-def _lock_debate(db: Session, debate_id: uuid.UUID) -> Debate | None:
-    stmt = select(Debate).where(Debate.id == debate_id).with_for_update(skip_locked=True)
+def _load_debate(
+    db: Session, debate_id: uuid.UUID, *, with_transcript: bool = False
+) -> Debate | None:
+    """Read the debate without locking it; its writes are checked against `Debate.version`."""
+
+    stmt = select(Debate).where(Debate.id == debate_id)
+    if with_transcript:
+        stmt = stmt.options(undefer(Debate.transcript))
     return db.execute(stmt).scalar_one_or_none()
 
 
+def _observe_phase(phase: str, since: float) -> float:
+    now = time.perf_counter()
+    STEP_PHASE_SECONDS.labels(phase).observe(now - since)
+    end_ns = time.time_ns()
+    record_span(f"step.{phase}", start_ns=end_ns - int((now - since) * 1e9), end_ns=end_ns)
+    return now
+
+
+def _queue_lag_seconds(request: Any) -> float | None:
+    """Seconds between a task becoming due (publish time or ETA) and now, when stamped."""
+
+    published_at = request.get("published_at")
+    if not isinstance(published_at, int | float):
+        return None
+    due = float(published_at)
+    if request.eta:
+        due = max(due, datetime.fromisoformat(str(request.eta)).timestamp())
+    return max(0.0, time.time() - due)
+
+
+def _last_turn_cursor(db: Session, debate_id: uuid.UUID) -> tuple[int, Actor]:
+    last = db.execute(
+        select(Turn.round, Turn.actor)
+        .where(Turn.debate_id == debate_id)
+        .order_by(Turn.created_at.desc(), Turn.id.desc())
+        .limit(1)
+    ).first()
+    return cursor_from_last_turn(
+        last_round=last.round if last is not None else None,
+        last_actor=last.actor if last is not None else None,
+    )
+
+
+def _rebuild_aggregates(db: Session, debate: Debate) -> None:
+    """Recompute the cursor, running aggregates and transcript from the full turn history."""
+
+    rows = db.execute(
+        select(Turn.id, Turn.round, Turn.actor, Turn.content, Turn.usage)
+        .where(Turn.debate_id == debate.id)
+        .order_by(Turn.created_at, Turn.id)
+    ).all()
+    aggregates = aggregate_turns([(r.id, r.round, r.actor, r.content, r.usage) for r in rows])
+    debate.next_round = aggregates.next_round
+    debate.next_actor = aggregates.next_actor
+    debate.turn_count = aggregates.turn_count
+    debate.total_completion_tokens = aggregates.total_completion_tokens
+    debate.last_turn_id = aggregates.last_turn_id
+    debate.transcript = aggregates.transcript
+
+
+@dataclass(frozen=True)
+class _CompactionPlan:
+    through_round: int
+    stored_summary: str | None
+    stored_through_round: int
+    pending_turns: list[tuple[int, str, str]]
+    recent_turns: list[tuple[int, str, str]]
+
+
+def _plan_compaction(
+    db: Session, debate_id: uuid.UUID, *, next_round: int, budget_tokens: int
+) -> _CompactionPlan | None:
+    """
+    Pick the turns to keep verbatim and the rounds the rolling summary must cover.
+
+    Returns None when compaction is disabled (`budget_tokens` is 0) or every loaded round fits in
+    the budget, so the full transcript is used.
+    """
+
+    if budget_tokens <= 0:
+        return None
+    rows = db.execute(
+        select(Turn.round, Turn.actor, Turn.content)
+        .where(Turn.debate_id == debate_id, Turn.round > next_round - _MAX_VERBATIM_ROUNDS)
+        .order_by(Turn.created_at, Turn.id)
+    ).all()
+    turns = [(r.round, r.actor, r.content) for r in rows]
+    start = verbatim_window_start(turns, budget_tokens=budget_tokens)
+    through_round = turns[start][0] - 1 if start < len(turns) else next_round - 1
+    if through_round < 1:
+        return None
+
+    stored = db.execute(
+        select(DebateSummary.through_round, DebateSummary.content)
+        .where(DebateSummary.debate_id == debate_id, DebateSummary.through_round <= through_round)
+        .order_by(DebateSummary.through_round.desc())
+        .limit(1)
+    ).first()
+    stored_through_round = stored.through_round if stored is not None else 0
+
+    pending: list[tuple[int, str, str]] = []
+    if stored_through_round < through_round:
+        pending_rows = db.execute(
+            select(Turn.round, Turn.actor, Turn.content)
+            .where(
+                Turn.debate_id == debate_id,
+                Turn.round > stored_through_round,
+                Turn.round <= through_round,
+            )
+            .order_by(Turn.created_at, Turn.id)
+        ).all()
+        pending = [(r.round, r.actor, r.content) for r in pending_rows]
+
+    return _CompactionPlan(
+        through_round=through_round,
+        stored_summary=stored.content if stored is not None else None,
+        stored_through_round=stored_through_round,
+        pending_turns=pending,
+        recent_turns=turns[start:],
+    )
+
+
+def _compacted_with_turn(
+    compaction: _CompactionPlan | None,
+    summary: str | None,
+    turn: tuple[int, str, str],
+    *,
+    next_round: int,
+    budget_tokens: int,
+) -> str | None:
+    """
+    The compacted transcript a later step builds after `turn`, if it can reuse `summary`.
+
+    That holds while `turn` still fits the verbatim window next to the current recent turns, so
+    the summary need not cover another round. Otherwise returns None.
+    """
+
+    if compaction is None or summary is None:
+        return None
+    recent = [*compaction.recent_turns, turn]
+    if (
+        verbatim_window_start(recent, budget_tokens=budget_tokens) != 0
+        or recent[0][0] <= next_round - _MAX_VERBATIM_ROUNDS
+    ):
+        return None
+    return compact_transcript(summary, compaction.through_round, recent)
+
+
+def _summary_through(
+    plan: _CompactionPlan,
+    *,
+    debate_id: uuid.UUID,
+    topic: str,
+    model: str,
+    max_tokens: int,
+    language: OutputLanguage,
+    prompt_version: str,
+    cache_policy: CachePolicy,
+) -> str:
+    """Return the stored summary for `plan.through_round`, generating and storing it once."""
+
+    if not plan.pending_turns and plan.stored_summary is not None:
+        return plan.stored_summary
+
+    result = _CLIENT.chat_completion(
+        model=model,
+        messages=[
+            {
+                "role": "system",
+                "content": summary_system_prompt(language=language, prompt_version=prompt_version),
+            },
+            {
+                "role": "user",
+                "content": summary_user_prompt(
+                    topic,
+                    plan.stored_summary,
+                    format_transcript(plan.pending_turns),
+                    through_round=plan.through_round,
+                    language=language,
+                    prompt_version=prompt_version,
+                ),
+            },
+        ],
+        max_tokens=max_tokens,
+        cache_policy=cache_policy,
+    )
+
+    with session_scope(_SESSIONMAKER) as db:
+        stmt = build_insert_summary_idempotent_stmt(
+            values={
+                "debate_id": debate_id,
+                "through_round": plan.through_round,
+                "content": result.content.strip(),
+                "model": result.model,
+                "usage": result.usage,
+                "created_at": utcnow(),
+            }
+        )
+        if db.execute(stmt).scalar_one_or_none() is not None:
+            return result.content.strip()
+        # Another worker summarized this round first; reuse its summary so retries and replays
+        # see one consistent history.
+        return db.execute(
+            select(DebateSummary.content).where(
+                DebateSummary.debate_id == debate_id,
+                DebateSummary.through_round == plan.through_round,
+            )
+        ).scalar_one()
+
+
+def _recent_round_verdicts(
+    db: Session, debate_id: uuid.UUID, *, through_round: int, count: int
+) -> dict[int, dict[str, Any]]:
+    rows = db.execute(
+        select(DebateRoundVerdict.round, DebateRoundVerdict.verdict).where(
+            DebateRoundVerdict.debate_id == debate_id,
+            DebateRoundVerdict.round > through_round - count,
+            DebateRoundVerdict.round <= through_round,
+        )
+    ).all()
+    return {r.round: r.verdict for r in rows}
+
+
+def _judge_round(
+    debate_id: uuid.UUID,
+    round_number: int,
+    *,
+    model: str,
+    messages: list[dict[str, Any]],
+    max_tokens: int,
+    cache_policy: CachePolicy,
+) -> None:
+    """Judge the debate through `round_number` and store the verdict; a failure only skips it."""
+
+    try:
+        result = _CLIENT.chat_completion(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+            cache_policy=cache_policy,
+        )
+    except Exception:
+        logger.warning(
+            "Round judge failed for debate %s round %s", debate_id, round_number, exc_info=True
+        )
+        return
+    verdict = _parse_verdict(result.content.strip())
+    if verdict is None:
+        logger.warning("Round judge output was invalid for debate %s round %s", debate_id, round_number)
+        return
+    try:
+        with session_scope(_SESSIONMAKER) as db:
+            stmt = build_insert_round_verdict_idempotent_stmt(
+                values={
+                    "debate_id": debate_id,
+                    "round": round_number,
+                    "verdict": verdict.model_dump(),
+                    "model": result.model,
+                    "usage": result.usage,
+                    "created_at": utcnow(),
+                }
+            )
+            db.execute(stmt)
+    except Exception:
+        # Nobody waits on this call, so log instead of leaving the error in an unread future.
+        logger.warning(
+            "Storing round verdict failed for debate %s round %s",
+            debate_id,
+            round_number,
+            exc_info=True,
+        )
+
+
 def _set_stopped(*, debate: Debate, now: Any) -> None:
     debate.status = "stopped"
     debate.stop_reason = "manual_stop"
     debate.updated_at = now
 
 
-@celery_app.task(bind=True, max_retries=3)  # type: ignore[untyped-decorator]
-def advance_debate(self: Any, debate_id: str) -> None:
-    settings = load_settings()
-    debate_uuid = _ensure_uuid(debate_id)
+def _publish(debate_id: uuid.UUID, message: BusMessage) -> None:
+    """Fan an event out to live subscribers; they catch up from Postgres on failure."""
+
+    try:
+        get_event_bus().publish(debate_id, message)
+    except Exception:
+        logger.warning("Failed to publish %s event for debate %s", message.event, debate_id, exc_info=True)
+
+
+def _publish_turn(turn: TurnOut) -> None:
+    message = BusMessage(event="turn", data=turn.model_dump(mode="json"), event_id=str(turn.id))
+    _publish(turn.debate_id, message)
+
+
+def _delta_publisher(debate_id: uuid.UUID, step_round: int, actor: Actor) -> Callable[[int, str], None]:
+    """Publish coalesced content fragments of an in-flight turn as `turn_delta` events."""
+
+    def publish(offset: int, delta: str) -> None:
+        data = {
+            "debate_id": str(debate_id),
+            "round": step_round,
+            "actor": actor,
+            "offset": offset,
+            "delta": delta,
+        }
+        _publish(debate_id, BusMessage(event="turn_delta", data=data))
+
+    return publish
+
+
+def _persist_step(
+    debate_uuid: uuid.UUID,
+    *,
+    step_round: int,
+    actor: Actor,
+    content: str,
+    result: ChatResult,
+    turn_metadata: dict[str, Any],
+    transcript: str,
+    now: Any,
+) -> tuple[StepOutcome, TurnOut | None]:
+    """
+    Store the step's turn and advance the debate, unless the claimed cursor has moved on.
+
+    Raises StaleDataError when the debate changed after it was read here; nothing is stored then.
+    """
+
+    published_turn: TurnOut | None = None
+    with session_scope(_SESSIONMAKER) as db:
+        debate = _load_debate(db, debate_uuid)
+        if debate is None:
+            return "done", None
+
+        if debate.status == "canceled":
+            return "done", None
 
+        stopping_requested = debate.status == "stopping"
+        if not stopping_requested and debate.status != "running":
+            return "done", None
+
+        if actor == "judge":
+            expected_judge_round = max(1, int(debate.next_round) - 1)
+            if debate.next_actor != "judge" or step_round != expected_judge_round:
+                if stopping_requested:
+                    _set_stopped(debate=debate, now=now)
+                    db.add(debate)
+                    return "done", None
+                # Another worker already persisted this step and carries the debate on.
+                return "done", None
+        else:
+            if int(debate.next_round) != step_round or debate.next_actor != actor:
+                if stopping_requested:
+                    _set_stopped(debate=debate, now=now)
+                    db.add(debate)
+                    return "done", None
+                # Another worker already persisted this step and carries the debate on.
+                return "done", None
+
+        turn_out = TurnOut(
+            id=uuid.uuid4(),
+            debate_id=debate_uuid,
+            round=step_round,
+            actor=actor,
+            content=content,
+            model=result.model,
+            usage=result.usage,
+            metadata=turn_metadata,
+            created_at=now,
+        )
+        stmt = (
+            build_insert_turn_idempotent_stmt(
+                turn_id=turn_out.id,
+                values={
+                    "debate_id": debate_uuid,
+                    "round": step_round,
+                    "actor": actor,
+                    "content": content,
+                    "model": result.model,
+                    "usage": result.usage,
+                    "metadata": turn_metadata,
+                    "created_at": now,
+                    "payload_json": encode_turn(turn_out),
+                },
+            )
+        )
+        inserted_id = db.execute(stmt).scalar_one_or_none()
+
+        if inserted_id is None:
+            _rebuild_aggregates(db, debate)
+        else:
+            next_round, next_actor = cursor_after_step(
+                next_round=int(debate.next_round),
+                next_actor=actor,
+                persisted_actor=actor,
+            )
+            debate.next_round = next_round
+            debate.next_actor = next_actor
+            # The cursor matched and the insert succeeded, so no other turn was persisted
+            # since `transcript` was read: extend the cached aggregates in place.
+            debate.turn_count = int(debate.turn_count) + 1
+            debate.total_completion_tokens = int(
+                debate.total_completion_tokens
+            ) + completion_tokens_from_usage(result.usage)
+            debate.last_turn_id = inserted_id
+            debate.transcript = append_transcript(transcript, step_round, actor, content)
+            published_turn = turn_out
+
+        new_status, new_stop_reason = status_after_persisted_step(
+            actor=actor,
+            stopping_requested=stopping_requested,
+            stop_reason=debate.stop_reason,
+        )
+        debate.status = new_status
+        debate.stop_reason = new_stop_reason
+        debate.last_error = None
+        debate.updated_at = now
+        db.add(debate)
+        outcome: StepOutcome = "continue" if debate.status == "running" else "done"
+    return outcome, published_turn
+
+
+def _advance_once(debate_uuid: uuid.UUID, settings: Settings) -> StepOutcome:
+    """
+    Run one debate step: claim it, call the LLM, persist the turn.
+
+    No row lock is held: both phases read the debate and write it back with a version check.
+    Returns "continue" when another step is due, "done" when there is nothing to do, and
+    "conflict" when concurrent writes kept winning, so the step must be tried again.
+    """
+
+    phase_started_at = time.perf_counter()
+    speculation = _SPECULATIONS.pop(debate_uuid, None)
     try:
         with session_scope(_SESSIONMAKER) as db:
-            debate = _lock_debate(db, debate_uuid)
+            debate = _load_debate(db, debate_uuid, with_transcript=True)
             if debate is None:
-                return
+                return "done"
 
             now = utcnow()
 
             if debate.status == "canceled":
-                return
+                return "done"
 
             if debate.status == "stopping":
                 _set_stopped(debate=debate, now=now)
                 db.add(debate)
-                return
+                return "done"
 
             if debate.status != "running":
-                return
-
-            turns = list(
-                db.execute(
-                    select(Turn)
-                    .where(Turn.debate_id == debate_uuid)
-                    .order_by(Turn.created_at, Turn.id)
-                ).scalars()
-            )
+                return "done"
 
-            last_turn = turns[-1] if turns else None
-            turn_tuples = [(t.round, t.actor, t.content) for t in turns]
             if debate.next_actor not in {"debater_a", "debater_b", "judge"} or debate.next_round < 1:
-                next_round, next_actor = cursor_from_last_turn(
-                    last_round=last_turn.round if last_turn is not None else None,
-                    last_actor=last_turn.actor if last_turn is not None else None,
-                )
+                next_round, next_actor = _last_turn_cursor(db, debate_uuid)
                 debate.next_round = next_round
                 debate.next_actor = next_actor
 
@@ -138,7 +876,7 @@ def advance_debate(self: Any, debate_id: str) -> None:
                 debate.status = "completed"
                 debate.updated_at = now
                 db.add(debate)
-                return
+                return "done"
 
             if debate.next_actor != "judge":
                 completed_rounds = int(debate.next_round) - 1
@@ -148,13 +886,30 @@ def advance_debate(self: Any, debate_id: str) -> None:
                 elif should_stop_for_runtime(settings=debate.settings, created_at=debate.created_at):
                     debate.stop_reason = "max_runtime_seconds"
                     debate.next_actor = "judge"
-                else:
-                    total_tokens = sum_completion_tokens([t.usage for t in turns])
-                    if should_stop_for_token_budget(
-                        settings=debate.settings, total_completion_tokens=total_tokens
-                    ):
-                        debate.stop_reason = "max_total_output_tokens"
-                        debate.next_actor = "judge"
+                elif should_stop_for_token_budget(
+                    settings=debate.settings,
+                    total_completion_tokens=int(debate.total_completion_tokens),
+                ):
+                    debate.stop_reason = "max_total_output_tokens"
+                    debate.next_actor = "judge"
+                elif (
+                    debate.settings.get("judge_mode") == "per_round"
+                    and debate.next_actor == "debater_a"
+                    and should_stop_for_no_new_arguments(
+                        settings=debate.settings,
+                        next_actor=debate.next_actor,
+                        completed_rounds=completed_rounds,
+                        # One extra round: the last completed one may not be judged yet.
+                        round_verdicts=_recent_round_verdicts(
+                            db,
+                            debate_uuid,
+                            through_round=completed_rounds,
+                            count=int(debate.settings.get("no_new_arguments_streak", 2)) + 1,
+                        ),
+                    )
+                ):
+                    debate.stop_reason = "no_new_arguments"
+                    debate.next_actor = "judge"
                 if debate.next_actor == "judge":
                     debate.updated_at = now
 
@@ -162,179 +917,350 @@ def advance_debate(self: Any, debate_id: str) -> None:
             step_round = judge_round if actor == "judge" else int(debate.next_round)
             topic = debate.topic
             debate_settings = dict(debate.settings)
+            transcript = debate.transcript
+            compaction: _CompactionPlan | None = None
+            context_budget = int(debate_settings.get("context_budget_tokens") or 0)
+            if context_budget > 0 and estimate_tokens(transcript) > context_budget:
+                compaction = _plan_compaction(
+                    db,
+                    debate_uuid,
+                    next_round=int(debate.next_round),
+                    budget_tokens=context_budget,
+                )
+            # "per_round": the round just finished is judged while debater A opens the next one.
+            round_to_judge: int | None = None
+            if (
+                debate_settings.get("judge_mode") == "per_round"
+                and actor == "debater_a"
+                and step_round > 1
+                and db.execute(
+                    select(DebateRoundVerdict.id).where(
+                        DebateRoundVerdict.debate_id == debate_uuid,
+                        DebateRoundVerdict.round == step_round - 1,
+                    )
+                ).scalar_one_or_none()
+                is None
+            ):
+                round_to_judge = step_round - 1
+            created_at = debate.created_at
+            total_completion_tokens = int(debate.total_completion_tokens)
             db.add(debate)
+    except StaleDataError:
+        # A stop/cancel or another worker changed the debate since it was read.
+        DEBATE_VERSION_CONFLICTS.labels("claim").inc()
+        return "conflict"
+    phase_started_at = _observe_phase("claim", phase_started_at)
+    trace.get_current_span().set_attributes(
+        {"llm_debate.round": step_round, "llm_debate.actor": actor}
+    )
 
-        transcript = format_transcript(turn_tuples)
-        raw_side = str(debate_settings.get("debater_a_side") or "pro").strip().lower()
-        debater_a_side: Side = "con" if raw_side == "con" else "pro"
-        output_language_raw = str(debate_settings.get("output_language") or "").strip()
-        output_language: OutputLanguage = output_language_raw if output_language_raw else "zh-Hant"  # type: ignore[assignment]
-        if output_language not in {"zh-Hant", "zh-Hans", "en"}:
-            output_language = "zh-Hant"
-        prompt_version = str(debate_settings.get("prompt_version") or "v1").strip() or "v1"
-        model = select_model_for_actor(actor=actor, debate_settings=debate_settings, defaults=settings)
-        max_tokens_key = "max_tokens_judge" if actor == "judge" else "max_tokens_debater"
-        default_max = (
-            settings.debate_max_tokens_judge if actor == "judge" else settings.debate_max_tokens_debater
+    _, output_language, prompt_version = _prompt_options(debate_settings)
+
+    prompt_transcript = transcript
+    summary: str | None = None
+    if compaction is not None:
+        summary = _summary_through(
+            compaction,
+            debate_id=debate_uuid,
+            topic=topic,
+            model=select_model_for_actor(
+                actor="debater_a", debate_settings=debate_settings, defaults=settings
+            ),
+            max_tokens=settings.debate_max_tokens_summary,
+            language=output_language,
+            prompt_version=prompt_version,
+            cache_policy=_cache_policy(debate_settings),
+        )
+        prompt_transcript = compact_transcript(
+            summary, compaction.through_round, compaction.recent_turns
         )
-        max_tokens = int(debate_settings.get(max_tokens_key) or default_max)
+        phase_started_at = _observe_phase("summary", phase_started_at)
+    if speculation is not None and (
+        speculation.round,
+        speculation.actor,
+        speculation.prompt_transcript,
+    ) != (step_round, actor, prompt_transcript):
+        speculation = None
 
-        messages: list[dict[str, Any]] = [
-            {
-                "role": "system",
-                "content": system_prompt(
-                    actor,
-                    debater_a_side=debater_a_side,
-                    language=output_language,
-                    prompt_version=prompt_version,
-                ),
-            },
-            {
-                "role": "user",
-                "content": user_prompt(
-                    topic,
-                    transcript,
-                    actor,
-                    step_round,
-                    debater_a_side=debater_a_side,
-                    language=output_language,
-                    prompt_version=prompt_version,
-                ),
-            },
-        ]
+    stream_to: DeltaCoalescer | None = None
+    if actor != "judge" and debate_settings.get("stream_output") is True:
+        stream_to = DeltaCoalescer(
+            _delta_publisher(debate_uuid, step_round, actor),
+            interval_ms=settings.stream_coalesce_ms,
+            max_fragments=settings.stream_coalesce_tokens,
+        )
 
-        response_format: dict[str, Any] | None = None
-        if actor == "judge":
-            response_format = {"type": "json_object"}
+    # The round judge runs beside the step without holding it up: a verdict that is not stored yet
+    # only delays the no-new-arguments stop by a round.
+    if round_to_judge is not None:
+        _round_judge_pool().submit(
+            contextvars.copy_context().run,
+            _judge_round,
+            debate_uuid,
+            round_to_judge,
+            model=select_model_for_actor(
+                actor="judge", debate_settings=debate_settings, defaults=settings
+            ),
+            messages=round_judge_messages(
+                topic,
+                prompt_transcript,
+                round_to_judge,
+                language=output_language,
+                prompt_version=prompt_version,
+            ),
+            max_tokens=settings.debate_max_tokens_round_judge,
+            cache_policy=_cache_policy(debate_settings),
+        )
 
-        started_at = time.perf_counter()
-        result = _CLIENT.chat_completion(
-            model=model, messages=messages, max_tokens=max_tokens, response_format=response_format
+    if speculation is not None:
+        result, duration_ms = speculation.call.result()
+    else:
+        result, duration_ms = _call_step(
+            actor,
+            step_round,
+            topic=topic,
+            transcript=prompt_transcript,
+            debate_settings=debate_settings,
+            settings=settings,
+            stream_to=stream_to,
         )
-        duration_ms = round((time.perf_counter() - started_at) * 1000)
 
-        now = utcnow()
-        content = result.content.strip()
-        turn_metadata = dict(result.metadata)
-        turn_metadata["duration_ms"] = duration_ms
+    if actor != "judge" and debate_settings.get("speculative") is True:
+        _speculate_next_step(
+            debate_uuid,
+            actor=actor,
+            step_round=step_round,
+            content=result.content.strip(),
+            transcript=transcript,
+            compaction=compaction,
+            summary=summary,
+            topic=topic,
+            debate_settings=debate_settings,
+            settings=settings,
+            created_at=created_at,
+            total_completion_tokens=total_completion_tokens
+            + completion_tokens_from_usage(result.usage),
+        )
+    phase_started_at = _observe_phase("llm", phase_started_at)
 
-        if actor == "judge":
-            try:
-                verdict_dict = safe_parse_json_object(content)
-                verdict = JudgeVerdict.model_validate(verdict_dict)
-            except (ValueError, ValidationError):
-                verdict = JudgeVerdict(
-                    summary="Judge output was invalid JSON; unable to score reliably.",
-                    score_a=0,
-                    score_b=0,
-                    winner="tie",
-                    no_new_substantive_arguments=False,
-                )
-            turn_metadata.update(verdict.model_dump())
-            content = _render_judge_content(verdict, language=output_language)
+    now = utcnow()
+    content = result.content.strip()
+    turn_metadata = dict(result.metadata)
+    turn_metadata["duration_ms"] = duration_ms
+    if speculation is not None:
+        turn_metadata["speculative"] = True
+    turn_metadata.update(prompt_cache_tokens_from_usage(result.usage))
+    if compaction is not None:
+        turn_metadata["context_summary_through_round"] = compaction.through_round
 
-        should_enqueue = False
-        with session_scope(_SESSIONMAKER) as db:
-            debate = _lock_debate(db, debate_uuid)
-            if debate is None:
-                return
+    if actor == "judge":
+        verdict = _parse_verdict(content)
+        if verdict is None:
+            verdict = JudgeVerdict(
+                summary="Judge output was invalid JSON; unable to score reliably.",
+                score_a=0,
+                score_b=0,
+                winner="tie",
+                no_new_substantive_arguments=False,
+            )
+        turn_metadata.update(verdict.model_dump())
+        content = _render_judge_content(verdict, language=output_language)
 
-            if debate.status == "canceled":
-                return
-
-            stopping_requested = debate.status == "stopping"
-            if not stopping_requested and debate.status != "running":
-                return
-
-            if actor == "judge":
-                expected_judge_round = max(1, int(debate.next_round) - 1)
-                if debate.next_actor != "judge" or step_round != expected_judge_round:
-                    if stopping_requested:
-                        _set_stopped(debate=debate, now=now)
-                        db.add(debate)
-                        return
-                    should_enqueue = True
-                    return
-            else:
-                if int(debate.next_round) != step_round or debate.next_actor != actor:
-                    if stopping_requested:
-                        _set_stopped(debate=debate, now=now)
-                        db.add(debate)
-                        return
-                    should_enqueue = True
-                    return
-
-            stmt = (
-                build_insert_turn_idempotent_stmt(
-                    values={
-                        "debate_id": debate_uuid,
-                        "round": step_round,
-                        "actor": actor,
-                        "content": content,
-                        "model": result.model,
-                        "usage": result.usage,
-                        "metadata": turn_metadata,
-                        "created_at": now,
-                    }
-                )
+    outcome: StepOutcome = "conflict"
+    published_turn: TurnOut | None = None
+    for _ in range(_PERSIST_ATTEMPTS):
+        try:
+            outcome, published_turn = _persist_step(
+                debate_uuid,
+                step_round=step_round,
+                actor=actor,
+                content=content,
+                result=result,
+                turn_metadata=turn_metadata,
+                transcript=transcript,
+                now=now,
             )
-            inserted_id = db.execute(stmt).scalar_one_or_none()
-
-            if inserted_id is None:
-                turns = list(
-                    db.execute(
-                        select(Turn)
-                        .where(Turn.debate_id == debate_uuid)
-                        .order_by(Turn.created_at, Turn.id)
-                    ).scalars()
-                )
-                last_turn = turns[-1] if turns else None
-                next_round, next_actor = cursor_from_last_turn(
-                    last_round=last_turn.round if last_turn is not None else None,
-                    last_actor=last_turn.actor if last_turn is not None else None,
-                )
-                debate.next_round = next_round
-                debate.next_actor = next_actor
+            break
+        except StaleDataError:
+            # Re-read: a stop request is honored, and a step another worker already stored is
+            # left to that worker.
+            DEBATE_VERSION_CONFLICTS.labels("persist").inc()
+    phase_started_at = _observe_phase("persist", phase_started_at)
+
+    if published_turn is not None:
+        _publish_turn(published_turn)
+        _observe_phase("publish", phase_started_at)
+
+    return outcome
+
+
+def _record_step_error(debate_uuid: uuid.UUID, exc: Exception, *, failed: bool) -> bool:
+    """Store a failed step's error (and the failed status); False when the debate was canceled."""
+
+    with session_scope(_SESSIONMAKER) as db:
+        debate = _load_debate(db, debate_uuid)
+        if debate is None:
+            return True
+        if debate.status == "canceled":
+            return False
+        debate.last_error = repr(exc)
+        debate.updated_at = utcnow()
+        if failed:
+            debate.status = "failed"
+            debate.stop_reason = "error"
+        db.add(debate)
+    return True
+
+
+def _drive_debate(debate_uuid: uuid.UUID, settings: Settings) -> None:
+    """
+    Step a debate in-process while holding its lease (WORKER_STEP_MODE=driver).
+
+    Returns immediately if another driver holds a live lease. After `driver_max_seconds`, or when
+    the worker starts shutting down, the debate is handed off: the lease is released and a fresh
+    task is enqueued, so long debates rebalance across workers and shutdowns stay short.
+    """
+
+    owner = lease_owner_id()
+    if not acquire_lease(
+        _SESSIONMAKER, debate_uuid, owner, lease_seconds=settings.driver_lease_seconds
+    ):
+        return
+
+    heartbeat = LeaseHeartbeat(
+        _SESSIONMAKER,
+        debate_uuid,
+        owner,
+        lease_seconds=settings.driver_lease_seconds,
+        interval_seconds=settings.driver_heartbeat_seconds,
+    )
+    heartbeat.start()
+    deadline = time.monotonic() + settings.driver_max_seconds
+    handoff = False
+    try:
+        while not heartbeat.lost.is_set():
+            if _SHUTTING_DOWN.is_set() or time.monotonic() >= deadline:
+                handoff = True
+                break
+            outcome = _advance_once(debate_uuid, settings)
+            STEP_OUTCOMES.labels(outcome).inc()
+            if outcome == "done":
+                break
+    finally:
+        heartbeat.stop()
+        release_lease(_SESSIONMAKER, debate_uuid, owner)
+
+    if handoff:
+        advance_debate.apply_async(args=[str(debate_uuid)])
+
+
+@celery_app.task(bind=True, max_retries=3)  # type: ignore[untyped-decorator]
+def advance_debate(self: Any, debate_id: str) -> None:
+    settings = load_settings()
+    debate_uuid = _ensure_uuid(debate_id)
+    attributes: dict[str, Any] = {"llm_debate.debate_id": debate_id}
+    queue_lag = _queue_lag_seconds(self.request)
+    if queue_lag is not None:
+        TASK_QUEUE_LAG_SECONDS.observe(queue_lag)
+        attributes["llm_debate.queue_lag_ms"] = round(queue_lag * 1000)
+
+    with task_span("advance_debate", self.request, attributes) as span:
+        try:
+            if settings.worker_step_mode == "driver":
+                _drive_debate(debate_uuid, settings)
             else:
-                next_round, next_actor = cursor_after_step(
-                    next_round=int(debate.next_round),
-                    next_actor=actor,
-                    persisted_actor=actor,
-                )
-                debate.next_round = next_round
-                debate.next_actor = next_actor
+                outcome = _advance_once(debate_uuid, settings)
+                STEP_OUTCOMES.labels(outcome).inc()
+                # A speculated next step is already running in this process: commit it here
+                # instead of paying a queue round trip. Like a driver, hand the debate back to the
+                # queue after `driver_max_seconds` or on shutdown.
+                deadline = time.monotonic() + settings.driver_max_seconds
+                while (
+                    outcome == "continue"
+                    and debate_uuid in _SPECULATIONS
+                    and not _SHUTTING_DOWN.is_set()
+                    and time.monotonic() < deadline
+                ):
+                    outcome = _advance_once(debate_uuid, settings)
+                    STEP_OUTCOMES.labels(outcome).inc()
+                # A lost race is retried from a fresh read rather than dropped, so the debate's
+                # only continuation is never lost.
+                if outcome in {"continue", "conflict"}:
+                    advance_debate.apply_async(args=[debate_id], countdown=0.1)
 
-            new_status, new_stop_reason = status_after_persisted_step(
-                actor=actor,
-                stopping_requested=stopping_requested,
-                stop_reason=debate.stop_reason,
+        except RateLimitedError as exc:
+            # Defer the step instead of holding a worker slot or spending a Celery retry. The
+            # jitter spreads deferred steps out so they do not all return at the same instant.
+            countdown = exc.retry_after + random.uniform(
+                0, settings.llm_rate_limit_jitter_seconds
             )
-            debate.status = new_status
-            debate.stop_reason = new_stop_reason
-            debate.last_error = None
-            debate.updated_at = now
-            db.add(debate)
-            should_enqueue = debate.status == "running"
+            logger.info("Deferring debate %s for %.2fs: %s", debate_id, countdown, exc)
+            span.add_event("deferred", {"model": exc.model, "countdown_seconds": countdown})
+            advance_debate.apply_async(args=[debate_id], countdown=countdown)
 
-        if should_enqueue:
-            advance_debate.apply_async(args=[debate_id], countdown=0.1)
+        except Exception as exc:
+            retries = int(getattr(self.request, "retries", 0))
+            for _ in range(_PERSIST_ATTEMPTS):
+                try:
+                    if not _record_step_error(
+                        debate_uuid, exc, failed=retries >= int(self.max_retries)
+                    ):
+                        return
+                    break
+                except StaleDataError:
+                    DEBATE_VERSION_CONFLICTS.labels("error").inc()
 
-    except Exception as exc:
-        now = utcnow()
-        with session_scope(_SESSIONMAKER) as db:
-            debate = _lock_debate(db, debate_uuid)
-            if debate is not None:
-                if debate.status == "canceled":
-                    return
-                debate.last_error = repr(exc)
-                debate.updated_at = now
-                retries = int(getattr(self.request, "retries", 0))
-                if retries >= int(self.max_retries):
-                    debate.status = "failed"
-                    debate.stop_reason = "error"
-                db.add(debate)
+            if retries < int(self.max_retries):
+                raise self.retry(exc=exc, countdown=min(60, 2**retries)) from exc
+            raise
+
+        finally:
+            # A speculation left behind (the step that would use it bailed out) is never consumed.
+            _SPECULATIONS.pop(debate_uuid, None)
+
+
+def _reap(
+    status: str, *, stalled_seconds: float, limit: int, values: dict[str, Any]
+) -> list[uuid.UUID]:
+    with session_scope(_SESSIONMAKER) as db:
+        stmt = build_reap_stalled_stmt(
+            status=status, stalled_seconds=stalled_seconds, limit=limit, values=values
+        )
+        return list(db.execute(stmt).scalars())
+
+
+@celery_app.task  # type: ignore[untyped-decorator]
+def reap_stalled_debates() -> dict[str, int]:
+    """
+    Recover debates whose continuation was lost (worker died mid-step, task lost by the broker).
+
+    Scheduled by Celery beat every `reaper_interval_seconds`. Stalled running debates get a fresh
+    `advance_debate`; if the step was merely slow, the duplicate loses the versioned persist.
+    Stalled stopping debates are finalized as stopped. Each status is swept at most
+    `reaper_batch_size` rows per run, so a backlog drains over a few runs instead of flooding
+    the queue.
+    """
 
-        retries = int(getattr(self.request, "retries", 0))
-        if retries < int(self.max_retries):
-            raise self.retry(exc=exc, countdown=min(60, 2**retries)) from exc
-        raise
+    settings = load_settings()
+    requeued = _reap(
+        "running",
+        stalled_seconds=settings.reaper_running_stall_seconds,
+        limit=settings.reaper_batch_size,
+        values={},
+    )
+    for debate_uuid in requeued:
+        advance_debate.apply_async(args=[str(debate_uuid)])
+    stopped = _reap(
+        "stopping",
+        stalled_seconds=settings.reaper_stopping_stall_seconds,
+        limit=settings.reaper_batch_size,
+        values={"status": "stopped", "stop_reason": "manual_stop"},
+    )
+
+    STALLED_DEBATES_RECOVERED.labels("requeued").inc(len(requeued))
+    STALLED_DEBATES_RECOVERED.labels("stopped").inc(len(stopped))
+    if requeued or stopped:
+        logger.warning(
+            "Recovered stalled debates: %d requeued, %d stopped", len(requeued), len(stopped)
+        )
+    return {"requeued": len(requeued), "stopped": len(stopped)}
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import uuid
+
+from llm_debate.runtime.aggregates import aggregate_turns
+from llm_debate.runtime.prompts import format_transcript
+
+
+def test_aggregate_turns_without_turns_starts_a_fresh_cursor() -> None:
+    aggregates = aggregate_turns([])
+    assert (aggregates.next_round, aggregates.next_actor) == (1, "debater_a")
+    assert aggregates.turn_count == 0
+    assert aggregates.last_turn_id is None
+    assert aggregates.transcript == ""
+
+
+def test_aggregate_turns_matches_persisted_history() -> None:
+    ids = [uuid.uuid4() for _ in range(3)]
+    turns = [
+        (ids[0], 1, "debater_a", "A1", {"completion_tokens": 3}),
+        (ids[1], 1, "debater_b", "B1", {"completion_tokens": 4}),
+        (ids[2], 2, "debater_a", "A2", {}),
+    ]
+    aggregates = aggregate_turns(turns)
+    assert (aggregates.next_round, aggregates.next_actor) == (2, "debater_b")
+    assert aggregates.turn_count == 3
+    assert aggregates.total_completion_tokens == 7
+    assert aggregates.last_turn_id == ids[2]
+    assert aggregates.transcript == format_transcript([(t[1], t[2], t[3]) for t in turns])
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+import uuid
+
+import pytest
+
+from llm_debate.api.cursors import decode_list_cursor, encode_list_cursor
+
+
+def test_list_cursor_round_trips() -> None:
+    updated_at = datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=UTC)
+    debate_id = uuid.uuid4()
+    cursor = encode_list_cursor(updated_at, debate_id)
+    assert "=" not in cursor
+    assert decode_list_cursor(cursor) == (updated_at, debate_id)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["", "not-a-cursor", encode_list_cursor(datetime(2025, 1, 1, tzinfo=UTC), uuid.uuid4())[:-4]],
+)
+def test_list_cursor_rejects_malformed_tokens(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_list_cursor(cursor)
+
+
+def test_list_cursor_rejects_naive_timestamps() -> None:
+    cursor = encode_list_cursor(datetime(2025, 1, 1), uuid.uuid4())
+    with pytest.raises(ValueError):
+        decode_list_cursor(cursor)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime
+import uuid
+
 from pydantic import ValidationError
 import pytest
 
-from llm_debate.api.schemas import DebateSettingsIn
+from llm_debate.api.schemas import DebateBatchCreate, DebateSettingsIn
+from llm_debate.runtime.turns import TurnOut
 
 
 def test_debate_settings_rejects_unknown_keys() -> None:
@@ -15,3 +19,36 @@ def test_debate_settings_rejects_invalid_stance() -> None:
     with pytest.raises(ValidationError):
         DebateSettingsIn.model_validate({"debater_a_side": "maybe"})
 
+
+def test_debate_settings_validates_judge_panel() -> None:
+    settings = DebateSettingsIn.model_validate(
+        {"judge_mode": "panel", "judge_panel": [{"model": "m1"}, {"temperature": 0.7}]}
+    )
+    assert settings.judge_panel is not None and len(settings.judge_panel) == 2
+    with pytest.raises(ValidationError):
+        DebateSettingsIn.model_validate({"judge_panel": [{"temperature": 3}]})
+    with pytest.raises(ValidationError):
+        DebateSettingsIn.model_validate({"judge_panel": []})
+
+
+def test_debate_batch_requires_debates_and_validates_items() -> None:
+    with pytest.raises(ValidationError):
+        DebateBatchCreate.model_validate({"debates": []})
+    with pytest.raises(ValidationError):
+        DebateBatchCreate.model_validate({"debates": [{"topic": "t", "settings": {"bogus": 1}}]})
+    batch = DebateBatchCreate.model_validate({"debates": [{"topic": "t"}], "start": True})
+    assert batch.start is True
+
+
+def test_projected_turn_omits_unrequested_fields() -> None:
+    turn = TurnOut(
+        id=uuid.uuid4(),
+        debate_id=uuid.uuid4(),
+        round=1,
+        actor="debater_a",
+        model="deepseek-chat",
+        created_at=datetime.now(tz=UTC),
+    )
+    dumped = turn.model_dump(mode="json", exclude_unset=True)
+    assert "model" in dumped
+    assert not {"content", "usage", "metadata"} & dumped.keys()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import Any, cast
+import uuid
+
+import orjson
+import pytest
+
+from llm_debate.db.bulk_import import (
+    _INSERT_DEBATES,
+    _INSERT_TURNS,
+    _SELECT_TURNS,
+    _staging_row,
+    import_ndjson,
+)
+
+
+class _FakeCopy:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self._rows = rows
+
+    def __enter__(self) -> _FakeCopy:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        return None
+
+    def write_row(self, row: tuple[Any, ...]) -> None:
+        self._rows.append(row)
+
+
+class _FakeCursor:
+    """Records statements; every INSERT reports `rowcount` rows and SELECTs return nothing."""
+
+    def __init__(self, rowcount: int) -> None:
+        self.statements: list[str] = []
+        self.copied: list[tuple[Any, ...]] = []
+        self.rowcount = rowcount
+
+    def __enter__(self) -> _FakeCursor:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        return None
+
+    def execute(self, sql: str, params: object = None) -> None:
+        self.statements.append(sql)
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        return []
+
+    def copy(self, sql: str) -> _FakeCopy:
+        return _FakeCopy(self.copied)
+
+
+class _FakeConnection:
+    def __init__(self, cursor: _FakeCursor) -> None:
+        self._cursor = cursor
+
+    def cursor(self) -> _FakeCursor:
+        return self._cursor
+
+
+def _line(**row: Any) -> bytes:
+    return orjson.dumps(row)
+
+
+def test_staging_row_parses_debate_and_turn_columns() -> None:
+    debate_id = uuid.uuid4()
+    row = _staging_row(
+        {
+            "debate_id": str(debate_id),
+            "topic": "T",
+            "status": "completed",
+            "settings": {"max_rounds": 2},
+            "round": 1,
+            "actor": "debater_a",
+            "content": "Hi",
+            "usage": {"total_tokens": 3},
+        }
+    )
+    assert row[0] == debate_id
+    assert row[4] == '{"max_rounds":2}'
+    assert isinstance(row[6], uuid.UUID)
+    assert row[7:10] == (1, "debater_a", "Hi")
+    assert row[11] == '{"total_tokens":3}'
+    assert row[12] is None
+
+
+def test_staging_row_without_turn_has_no_turn_id() -> None:
+    row = _staging_row({"debate_id": str(uuid.uuid4()), "topic": "T"})
+    assert row[6] is None
+    assert row[7] is None
+
+
+@pytest.mark.parametrize(
+    "line",
+    [b"{not json", b'{"topic": "no debate id"}', b'{"debate_id": "not-a-uuid"}', b"[1, 2]"],
+)
+def test_import_rejects_malformed_lines_with_their_number(line: bytes) -> None:
+    lines = [_line(debate_id=str(uuid.uuid4())), b"", line]
+    with pytest.raises(ValueError, match="Invalid export row on line 3: "):
+        import_ndjson(cast(Any, _FakeConnection(_FakeCursor(rowcount=0))), lines)
+
+
+def test_import_leaves_existing_debates_untouched() -> None:
+    cursor = _FakeCursor(rowcount=0)
+    debate_id = str(uuid.uuid4())
+    lines = [_line(debate_id=debate_id, round=1, actor="debater_a"), b"  \n"]
+    stats = import_ndjson(cast(Any, _FakeConnection(cursor)), lines)
+    assert stats.rows == 1
+    assert stats.debates_inserted == 0
+    assert len(cursor.copied) == 1
+    # Nothing was inserted, so no existing debate has its turns read or aggregates rewritten.
+    assert _SELECT_TURNS not in cursor.statements
+
+
+def test_import_sql_only_fills_debates_it_inserted() -> None:
+    assert "ON CONFLICT (id) DO NOTHING" in _INSERT_DEBATES
+    assert "INSERT INTO import_debates" in _INSERT_DEBATES
+    assert "JOIN import_debates USING (debate_id)" in _INSERT_TURNS
+    assert "ON CONFLICT (debate_id, round, actor) DO NOTHING" in _INSERT_TURNS
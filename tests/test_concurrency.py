@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from llm_debate.llm.concurrency import AsyncConcurrencyLimiter, ConcurrencyLimiter
+
+
+def test_async_limiter_caps_per_model_and_globally() -> None:
+    limiter = AsyncConcurrencyLimiter(max_in_flight=3, max_in_flight_per_model=2)
+    in_flight: dict[str, int] = {"a": 0, "b": 0}
+    peaks: dict[str, int] = {"a": 0, "b": 0, "total": 0}
+
+    async def call(model: str) -> None:
+        async with limiter.slot(model):
+            in_flight[model] += 1
+            peaks[model] = max(peaks[model], in_flight[model])
+            peaks["total"] = max(peaks["total"], sum(in_flight.values()))
+            await asyncio.sleep(0.01)
+            in_flight[model] -= 1
+
+    async def main() -> None:
+        await asyncio.gather(*(call(model) for model in ["a"] * 5 + ["b"] * 5))
+
+    asyncio.run(main())
+    assert peaks == {"a": 2, "b": 2, "total": 3}
+
+
+def test_async_limiter_zero_disables_caps() -> None:
+    limiter = AsyncConcurrencyLimiter(max_in_flight=0, max_in_flight_per_model=0)
+    in_flight = 0
+    peak = 0
+
+    async def call() -> None:
+        nonlocal in_flight, peak
+        async with limiter.slot("a"):
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    async def main() -> None:
+        await asyncio.gather(*(call() for _ in range(10)))
+
+    asyncio.run(main())
+    assert peak == 10
+
+
+def test_thread_limiter_caps_per_model() -> None:
+    limiter = ConcurrencyLimiter(max_in_flight=0, max_in_flight_per_model=2)
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def call() -> None:
+        nonlocal in_flight, peak
+        with limiter.slot("a"):
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak == 2
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, cast
+import uuid
+
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Update
+
+from llm_debate.db.debate_writes import (
+    build_reap_stalled_stmt,
+    build_set_status_unless_finished_stmt,
+)
+from llm_debate.db.models import Debate
+
+
+def _sql(stmt: Update) -> str:
+    dialect_factory = cast(Callable[[], Any], postgresql.dialect)
+    return str(stmt.compile(dialect=dialect_factory()))
+
+
+def test_set_status_skips_finished_debates_and_bumps_version() -> None:
+    sql = _sql(
+        build_set_status_unless_finished_stmt(
+            debate_id=uuid.uuid4(), values={"status": "stopping"}
+        )
+    )
+    assert "debates.status NOT IN" in sql
+    assert "version=(debates.version + " in sql
+    assert "RETURNING debates.id" in sql
+
+
+def test_orm_debate_writes_are_versioned() -> None:
+    assert inspect(Debate).version_id_col is Debate.__table__.c.version
+
+
+def test_reap_stalled_uses_in_flight_index_and_skips_live_leases() -> None:
+    sql = _sql(
+        build_reap_stalled_stmt(
+            status="stopping",
+            stalled_seconds=300,
+            limit=100,
+            values={"status": "stopped", "stop_reason": "manual_stop"},
+        )
+    )
+    assert "status IN ('running', 'stopping')" in sql
+    assert "debates.lease_expires_at IS NULL OR debates.lease_expires_at < now()" in sql
+    assert "ORDER BY debates.updated_at" in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "version=(debates.version + " in sql
+    assert "RETURNING debates.id" in sql
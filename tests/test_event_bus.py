@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import uuid
+
+from llm_debate.events.bus import (
+    BusMessage,
+    InMemoryEventBus,
+    debate_channel,
+    decode_message,
+    encode_message,
+)
+from llm_debate.events.sse import FrameCache, sse_frame, sse_frame_from_json
+
+
+def test_message_round_trip() -> None:
+    message = BusMessage(event="turn", data={"round": 1}, event_id="abc")
+    assert decode_message(encode_message(message)) == message
+
+
+def test_decode_rejects_malformed_payloads() -> None:
+    assert decode_message("not json") is None
+    assert decode_message('["turn"]') is None
+    assert decode_message('{"event": "turn"}') is None
+
+
+def test_sse_frame_layout() -> None:
+    assert sse_frame("turn", {"round": 1}, "t1") == b'id: t1\nevent: turn\ndata: {"round":1}\n\n'
+    assert sse_frame("error", {}, None) == b"event: error\ndata: {}\n\n"
+    assert sse_frame_from_json("turn", b'{"round":1}', "t1") == sse_frame("turn", {"round": 1}, "t1")
+
+
+def test_message_frame_is_encoded_once() -> None:
+    message = BusMessage(event="turn", data={"round": 1}, event_id="t1")
+    assert message.frame is message.frame
+    assert message.frame == sse_frame("turn", {"round": 1}, "t1")
+
+
+def test_frame_cache_evicts_least_recently_used() -> None:
+    cache = FrameCache(maxsize=2)
+    cache.put("a", b"A")
+    cache.put("b", b"B")
+    assert cache.get("a") == b"A"
+    cache.put("c", b"C")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"A"
+    assert cache.get("c") == b"C"
+
+
+def test_in_memory_bus_fans_out_per_debate() -> None:
+    async def scenario() -> None:
+        bus = InMemoryEventBus()
+        debate_id = uuid.uuid4()
+        first = bus.subscribe(debate_id)
+        second = bus.subscribe(debate_id)
+        other = bus.subscribe(uuid.uuid4())
+
+        message = BusMessage(event="turn", data={"round": 1}, event_id="t1")
+        bus.publish(debate_id, message)
+
+        assert await first.get(timeout=0.1) == message
+        assert await second.get(timeout=0.1) == message
+        assert await other.get(timeout=0.01) is None
+
+    asyncio.run(scenario())
+
+
+def test_publish_from_another_thread_reaches_subscriber() -> None:
+    async def scenario() -> None:
+        bus = InMemoryEventBus()
+        debate_id = uuid.uuid4()
+        subscription = bus.subscribe(debate_id)
+        message = BusMessage(event="turn", data={}, event_id="t1")
+        publisher = threading.Thread(target=bus.publish, args=(debate_id, message))
+        publisher.start()
+        assert await subscription.get(timeout=1.0) == message
+        publisher.join()
+
+    asyncio.run(scenario())
+
+
+def test_closed_subscription_stops_receiving() -> None:
+    async def scenario() -> None:
+        bus = InMemoryEventBus()
+        debate_id = uuid.uuid4()
+        subscription = bus.subscribe(debate_id)
+        subscription.close()
+        bus.publish(debate_id, BusMessage(event="turn", data={}))
+        assert await subscription.get(timeout=0.01) is None
+
+    asyncio.run(scenario())
+
+
+def test_debate_channel_is_scoped_by_id() -> None:
+    debate_id = uuid.uuid4()
+    assert str(debate_id) in debate_channel(debate_id)
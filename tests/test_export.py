@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import csv
+from datetime import UTC, datetime
+import io
+import json
+import uuid
+
+from llm_debate.api.export import EXPORT_COLUMNS, csv_chunk, csv_header, ndjson_chunk
+
+
+def _row(**overrides: object) -> dict[str, object]:
+    row: dict[str, object] = {column: None for column in EXPORT_COLUMNS}
+    row.update(
+        debate_id=uuid.UUID(int=1),
+        topic="Cats, dogs",
+        status="completed",
+        debate_created_at=datetime(2025, 1, 1, tzinfo=UTC),
+        round=1,
+        actor="judge",
+        content='Line one\nsaid "hi"',
+        usage={"completion_tokens": 3},
+        metadata={"winner": "a"},
+    )
+    row.update(overrides)
+    return row
+
+
+def test_ndjson_chunk_writes_one_object_per_line() -> None:
+    lines = ndjson_chunk([_row(), _row(round=2)]).decode("utf-8").splitlines()
+    assert [json.loads(line)["round"] for line in lines] == [1, 2]
+    assert json.loads(lines[0])["debate_id"] == str(uuid.UUID(int=1))
+    assert json.loads(lines[0])["metadata"] == {"winner": "a"}
+
+
+def test_csv_chunk_round_trips_through_csv_reader() -> None:
+    body = (csv_header() + csv_chunk([_row(), _row(actor=None, content=None)])).decode("utf-8")
+    records = list(csv.DictReader(io.StringIO(body)))
+    assert records[0]["topic"] == "Cats, dogs"
+    assert records[0]["content"] == 'Line one\nsaid "hi"'
+    assert json.loads(records[0]["usage"]) == {"completion_tokens": 3}
+    assert records[0]["debate_created_at"] == "2025-01-01T00:00:00+00:00"
+    assert records[1]["actor"] == ""
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, cast
+import uuid
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Update
+
+from llm_debate.db.leases import (
+    build_acquire_lease_stmt,
+    build_release_lease_stmt,
+    build_renew_lease_stmt,
+)
+
+
+def _sql(stmt: Update) -> str:
+    dialect_factory = cast(Callable[[], Any], postgresql.dialect)
+    return str(stmt.compile(dialect=dialect_factory()))
+
+
+def test_acquire_lease_takes_free_expired_or_own_lease() -> None:
+    sql = _sql(build_acquire_lease_stmt(debate_id=uuid.uuid4(), owner="w1", lease_seconds=30))
+    assert "debates.lease_owner IS NULL" in sql
+    assert "debates.lease_expires_at < now()" in sql
+    assert "RETURNING debates.id" in sql
+
+
+def test_renew_lease_skips_locked_row() -> None:
+    sql = _sql(build_renew_lease_stmt(debate_id=uuid.uuid4(), owner="w1", lease_seconds=30))
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "debates.lease_owner = " in sql
+
+
+def test_release_lease_only_clears_own_lease() -> None:
+    sql = _sql(build_release_lease_stmt(debate_id=uuid.uuid4(), owner="w1"))
+    assert "SET lease_owner=" in sql
+    assert "debates.lease_owner = " in sql
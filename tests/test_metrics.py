@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from llm_debate.core.metrics import render_metrics
+from llm_debate.db.engine import MeteredQueuePool, meter_checked_out
+from llm_debate.llm.deepseek import _record_attempt
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metered_pool_tracks_checkouts() -> None:
+    engine = create_engine("sqlite://", poolclass=MeteredQueuePool)
+    meter_checked_out(engine.pool, "sync")
+    checkouts = _sample("llm_debate_db_pool_checkout_seconds_count", pool="sync")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        assert _sample("llm_debate_db_pool_checked_out", pool="sync") == 1
+    assert _sample("llm_debate_db_pool_checked_out", pool="sync") == 0
+    assert _sample("llm_debate_db_pool_checkout_seconds_count", pool="sync") == checkouts + 1
+
+    with engine.connect() as conn:
+        conn.invalidate()
+    with engine.connect() as conn:
+        conn.detach()
+    engine.dispose()
+    with engine.connect() as conn:
+        assert _sample("llm_debate_db_pool_checked_out", pool="sync") == 1
+    assert _sample("llm_debate_db_pool_checked_out", pool="sync") == 0
+    engine.dispose()
+
+
+def test_record_attempt_counts_tokens_by_kind() -> None:
+    before = _sample("llm_debate_llm_tokens_total", model="m-test", kind="completion")
+    _record_attempt("m-test", 0.0, "ok", {"prompt_tokens": 7, "completion_tokens": 3})
+    _record_attempt("m-test", 0.0, "error")
+    assert _sample("llm_debate_llm_tokens_total", model="m-test", kind="completion") == before + 3
+    assert _sample("llm_debate_llm_request_seconds_count", model="m-test", outcome="error") == 1
+
+    body, content_type = render_metrics()
+    assert content_type.startswith("text/plain")
+    assert b'llm_debate_llm_tokens_total{kind="prompt",model="m-test"}' in body
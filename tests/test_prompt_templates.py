@@ -1,6 +1,18 @@
 from __future__ import annotations
 
-from llm_debate.runtime.prompts import system_prompt, user_prompt
+from llm_debate.runtime.prompts import (
+    append_transcript,
+    compact_transcript,
+    estimate_tokens,
+    format_transcript,
+    prompt_messages,
+    round_judge_messages,
+    summary_system_prompt,
+    summary_user_prompt,
+    system_prompt,
+    user_prompt,
+    verbatim_window_start,
+)
 
 
 def test_templates_render_for_debater_a() -> None:
@@ -37,3 +49,90 @@ def test_prompt_version_sanitized() -> None:
     )
     assert "Judge" in text
 
+
+def test_append_transcript_matches_full_format() -> None:
+    turns = [(1, "debater_a", "Opening"), (1, "debater_b", "Rebuttal"), (1, "judge", "A wins")]
+    transcript = ""
+    for round_number, actor, content in turns:
+        transcript = append_transcript(transcript, round_number, actor, content)
+    assert transcript == format_transcript(turns)
+
+
+def test_estimate_tokens_counts_cjk_denser_than_latin() -> None:
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcdefgh") == 2
+    assert estimate_tokens("辯論辯論") > estimate_tokens("abcd")
+
+
+def test_verbatim_window_keeps_whole_rounds_within_budget() -> None:
+    turns = [
+        (round_number, actor, "x" * 400)
+        for round_number in (1, 2, 3)
+        for actor in ("debater_a", "debater_b")
+    ]
+    assert verbatim_window_start(turns, budget_tokens=250) == 4
+    assert verbatim_window_start(turns, budget_tokens=10) == 4
+    assert verbatim_window_start(turns, budget_tokens=10_000) == 0
+    assert verbatim_window_start(turns[:5], budget_tokens=10) == 2
+
+
+def test_compact_transcript_prefixes_summary() -> None:
+    recent = [(3, "debater_a", "New point")]
+    text = compact_transcript("A argued X.", 2, recent)
+    assert text.startswith("Summary of rounds 1-2:\nA argued X.")
+    assert text.endswith(format_transcript(recent))
+    assert compact_transcript(None, 0, recent) == format_transcript(recent)
+
+
+def test_summary_user_prompt_renders() -> None:
+    text = summary_user_prompt(
+        "Topic",
+        None,
+        "Round 1 - Debater A: Hi",
+        through_round=1,
+        language="en",
+    )
+    assert "Topic: Topic" in text
+    assert "through round 1" in text
+
+
+def test_prompt_messages_v1_keeps_two_message_layout() -> None:
+    messages = prompt_messages(
+        "Topic", "", "debater_a", 1, debater_a_side="pro", language="en", prompt_version="v1"
+    )
+    assert [m["role"] for m in messages] == ["system", "user"]
+
+
+def test_prompt_messages_v2_prefix_is_stable_across_steps() -> None:
+    first_transcript = format_transcript([(1, "debater_a", "Opening")])
+    later_transcript = append_transcript(first_transcript, 1, "debater_b", "Rebuttal")
+    first = prompt_messages(
+        "Topic", first_transcript, "debater_a", 2, debater_a_side="pro", language="en", prompt_version="v2"
+    )
+    later = prompt_messages(
+        "Topic", later_transcript, "debater_a", 3, debater_a_side="pro", language="en", prompt_version="v2"
+    )
+    judge = prompt_messages(
+        "Topic", later_transcript, "judge", 2, debater_a_side="pro", language="en", prompt_version="v2"
+    )
+    assert [m["role"] for m in later] == ["system", "system", "user"]
+    assert later[0]["content"].startswith(first[0]["content"].rstrip())
+    assert judge[0] == later[0]
+    assert "Role: Debater A" in later[1]["content"]
+    assert "Round: 3" in later[2]["content"]
+    assert "Rebuttal" not in later[1]["content"] + later[2]["content"]
+
+
+def test_v2_takes_summary_templates_from_v1() -> None:
+    assert summary_system_prompt(language="en", prompt_version="v2") == summary_system_prompt(
+        language="en", prompt_version="v1"
+    )
+
+
+def test_round_judge_messages_fall_back_to_v1_templates() -> None:
+    v1 = round_judge_messages("Topic", "Round 2 - A: Hi", 2, language="en", prompt_version="v1")
+    v2 = round_judge_messages("Topic", "Round 2 - A: Hi", 2, language="en", prompt_version="v2")
+    assert v1 == v2
+    assert [m["role"] for m in v1] == ["system", "user"]
+    assert "Judge round 2 only" in v1[1]["content"]
+    assert "no_new_substantive_arguments" in v1[0]["content"]
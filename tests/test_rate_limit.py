@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from types import SimpleNamespace
+from typing import Any, cast
+
+import httpx
+from openai import APIConnectionError
+
+from llm_debate.llm.concurrency import ConcurrencyLimiter
+from llm_debate.llm.deepseek import DeepSeekClient
+from llm_debate.llm.rate_limit import InMemoryTokenBucketLimiter, retry_after_seconds
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_request_bucket_refills_continuously() -> None:
+    clock = _Clock()
+    limiter = InMemoryTokenBucketLimiter(requests_per_minute=2, tokens_per_minute=0, clock=clock)
+    assert limiter.acquire("m", 100) == 0
+    assert limiter.acquire("m", 100) == 0
+    assert limiter.acquire("m", 100) == 30
+    clock.now = 30
+    assert limiter.acquire("m", 100) == 0
+    assert limiter.acquire("other", 100) == 0
+
+
+def test_token_bucket_waits_for_cost_and_accepts_refunds() -> None:
+    clock = _Clock()
+    limiter = InMemoryTokenBucketLimiter(requests_per_minute=0, tokens_per_minute=600, clock=clock)
+    assert limiter.acquire("m", 500) == 0
+    assert limiter.acquire("m", 500) == 40
+    limiter.refund("m", 400)
+    assert limiter.acquire("m", 500) == 0
+
+
+def test_block_holds_back_callers() -> None:
+    clock = _Clock()
+    limiter = InMemoryTokenBucketLimiter(requests_per_minute=100, tokens_per_minute=0, clock=clock)
+    limiter.block("m", 5)
+    assert limiter.acquire("m", 1) == 5
+    clock.now = 5
+    assert limiter.acquire("m", 1) == 0
+
+
+def test_retry_after_seconds_parses_header_forms() -> None:
+    assert retry_after_seconds({"retry-after": "3"}, default=1) == 3
+    assert retry_after_seconds({"retry-after-ms": "250"}, default=1) == 0.25
+    assert retry_after_seconds({}, default=1) == 1
+    assert retry_after_seconds({"retry-after": "soon"}, default=1) == 1
+    later = format_datetime(datetime.now(tz=UTC) + timedelta(seconds=30), usegmt=True)
+    assert 25 < retry_after_seconds({"retry-after": later}, default=1) <= 30
+
+
+class _FlakyCompletions:
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+
+    def create(self, **_: Any) -> Any:
+        if self.failures > 0:
+            self.failures -= 1
+            raise APIConnectionError(request=httpx.Request("POST", "http://llm.test"))
+        message = SimpleNamespace(content="ok", reasoning_content=None)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=message)],
+            model="m",
+            usage={"total_tokens": 10},
+        )
+
+
+def test_retried_call_reserves_rate_budget_once() -> None:
+    limiter = InMemoryTokenBucketLimiter(requests_per_minute=0, tokens_per_minute=600, clock=_Clock())
+    client = DeepSeekClient.__new__(DeepSeekClient)
+    client._client = cast(Any, SimpleNamespace(chat=SimpleNamespace(completions=_FlakyCompletions(1))))
+    client._limiter = ConcurrencyLimiter(max_in_flight=0, max_in_flight_per_model=0)
+    client._rate_limiter = limiter
+    result = client.chat_completion(model="m", messages=[{"role": "user", "content": "hi"}], max_tokens=100)
+    assert result.content == "ok"
+    assert limiter.acquire("m", 590) == 0
+    assert limiter.acquire("m", 1) > 0
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Any
+
+from llm_debate.events.coalesce import DeltaCoalescer
+from llm_debate.llm.deepseek import CachingChatClient, ChatResult, DeltaSink
+from llm_debate.llm.response_cache import InMemoryResponseCache, response_cache_key
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingClient:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def chat_completion(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        max_tokens: int,
+        response_format: dict[str, Any] | None = None,
+        stream_to: DeltaSink | None = None,
+        temperature: float | None = None,
+    ) -> ChatResult:
+        self.calls += 1
+        return ChatResult(
+            content=f"answer {self.calls}",
+            model=model,
+            usage={"completion_tokens": 2},
+            metadata={},
+        )
+
+
+def _key(**overrides: Any) -> str:
+    request: dict[str, Any] = {
+        "model": "deepseek-chat",
+        "messages": [{"role": "user", "content": "hi"}],
+        "max_tokens": 10,
+        "response_format": None,
+        "temperature": None,
+    }
+    request.update(overrides)
+    return response_cache_key(**request)
+
+
+def test_response_cache_key_covers_request_shape() -> None:
+    assert _key() == _key()
+    assert _key(messages=[{"content": "hi", "role": "user"}]) == _key()
+    assert _key(temperature=0.5) != _key()
+    assert _key(max_tokens=11) != _key()
+    assert _key(response_format={"type": "json_object"}) != _key()
+
+
+def test_in_memory_cache_expires_and_evicts_by_size() -> None:
+    clock = _Clock()
+    cache = InMemoryResponseCache(max_bytes=10, ttl_seconds=60, clock=clock)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    assert cache.get("a") == b"aaaa"
+    cache.put("c", b"cccc")
+    # "b" was least recently used once "a" was read.
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    clock.now = 61
+    assert cache.get("a") is None
+    cache.put("big", b"x" * 11)
+    assert cache.get("big") is None
+
+
+def test_caching_client_policies() -> None:
+    inner = _CountingClient()
+    client = CachingChatClient(
+        inner, cache=InMemoryResponseCache(max_bytes=1 << 20, ttl_seconds=60)
+    )
+    request: dict[str, Any] = {
+        "model": "deepseek-chat",
+        "messages": [{"role": "user", "content": "hi"}],
+        "max_tokens": 10,
+    }
+
+    first = client.chat_completion(**request, cache_policy="read_write")
+    assert "cache_hit" not in first.metadata
+    flushed: list[tuple[int, str]] = []
+    sink = DeltaCoalescer(
+        lambda offset, text: flushed.append((offset, text)), interval_ms=1000, max_fragments=100
+    )
+    hit = client.chat_completion(**request, stream_to=sink, cache_policy="read_write")
+    assert inner.calls == 1
+    assert hit.content == first.content
+    assert hit.usage == first.usage
+    assert hit.metadata["cache_hit"] is True
+    assert isinstance(hit.metadata["cached_duration_ms"], int)
+    assert flushed == [(0, first.content)]
+
+    assert client.chat_completion(**request).content == "answer 2"
+    assert client.chat_completion(**request, cache_policy="refresh").content == "answer 3"
+    assert client.chat_completion(**request, cache_policy="read_write").content == "answer 3"
+    assert inner.calls == 3
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
+from llm_debate.runtime.cursor import cursor_after_step
 from llm_debate.runtime.steps import (
+    Actor,
+    NextStep,
+    completion_tokens_from_usage,
     compute_next_step,
     judge_no_new_streak,
+    prompt_cache_hit_ratio,
+    prompt_cache_tokens_from_usage,
+    should_stop_for_no_new_arguments,
     should_stop_for_rounds,
     should_stop_for_runtime,
     should_stop_for_token_budget,
+    speculative_next_step,
     sum_completion_tokens,
+    sum_usage,
 )
 
 
@@ -50,6 +60,8 @@ def test_token_budget_helpers() -> None:
     total = sum_completion_tokens([{"completion_tokens": 10}, {"completion_tokens": 5}, {}])
     assert total == 15
     assert should_stop_for_token_budget(settings={"max_total_output_tokens": 15}, total_completion_tokens=15)
+    assert completion_tokens_from_usage({"completion_tokens": 7}) == 7
+    assert completion_tokens_from_usage({"completion_tokens": "7"}) == 0
 
 
 def test_judge_no_new_streak() -> None:
@@ -59,3 +71,121 @@ def test_judge_no_new_streak() -> None:
         {"no_new_substantive_arguments": True},
     ]
     assert judge_no_new_streak(metas) == 2
+
+
+def test_should_stop_for_no_new_arguments() -> None:
+    stale = {"no_new_substantive_arguments": True}
+    fresh = {"no_new_substantive_arguments": False}
+    settings = {"judge_mode": "per_round", "no_new_arguments_streak": 2}
+    assert should_stop_for_no_new_arguments(
+        settings=settings,
+        next_actor="debater_a",
+        completed_rounds=3,
+        round_verdicts={1: fresh, 2: stale, 3: stale},
+    )
+    # The last completed round is not judged yet: the streak ends at the round before.
+    assert should_stop_for_no_new_arguments(
+        settings=settings,
+        next_actor="debater_a",
+        completed_rounds=3,
+        round_verdicts={1: stale, 2: stale},
+    )
+    # A round without a verdict breaks the streak.
+    assert not should_stop_for_no_new_arguments(
+        settings=settings,
+        next_actor="debater_a",
+        completed_rounds=3,
+        round_verdicts={1: stale, 3: stale},
+    )
+    # Never mid-round.
+    assert not should_stop_for_no_new_arguments(
+        settings=settings,
+        next_actor="debater_b",
+        completed_rounds=3,
+        round_verdicts={1: fresh, 2: stale, 3: stale},
+    )
+    assert not should_stop_for_no_new_arguments(
+        settings={**settings, "judge_mode": "end"},
+        next_actor="debater_a",
+        completed_rounds=2,
+        round_verdicts={1: stale, 2: stale},
+    )
+
+
+def test_no_new_arguments_stop_lands_on_a_round_boundary() -> None:
+    # Replays the worker's claims: round N is judged while debater A opens round N+1.
+    settings = {"judge_mode": "per_round", "no_new_arguments_streak": 2}
+    verdicts: dict[int, dict[str, Any]] = {}
+    transcript: list[tuple[int, Actor]] = []
+    next_round: int = 1
+    next_actor: Actor = "debater_a"
+    while not should_stop_for_no_new_arguments(
+        settings=settings,
+        next_actor=next_actor,
+        completed_rounds=next_round - 1,
+        round_verdicts=verdicts,
+    ):
+        if next_actor == "debater_a" and next_round > 1:
+            verdicts[next_round - 1] = {"no_new_substantive_arguments": True}
+        transcript.append((next_round, next_actor))
+        next_round, next_actor = cursor_after_step(
+            next_round=next_round, next_actor=next_actor, persisted_actor=next_actor
+        )
+        assert next_round < 10
+
+    # Stopped before debater A of round 4; the final judge covers three whole rounds.
+    assert (next_round, next_actor) == (4, "debater_a")
+    assert len(transcript) == 6
+    assert transcript[-1] == (3, "debater_b")
+
+
+def test_prompt_cache_tokens_from_usage() -> None:
+    assert prompt_cache_tokens_from_usage(
+        {"prompt_tokens": 100, "prompt_cache_hit_tokens": 64, "prompt_cache_miss_tokens": 36}
+    ) == {"prompt_cache_hit_tokens": 64, "prompt_cache_miss_tokens": 36}
+    assert prompt_cache_tokens_from_usage(
+        {"prompt_tokens": 100, "prompt_tokens_details": {"cached_tokens": 80}}
+    ) == {"prompt_cache_hit_tokens": 80, "prompt_cache_miss_tokens": 20}
+    assert prompt_cache_tokens_from_usage({"prompt_tokens": 100}) == {}
+
+
+def test_prompt_cache_hit_ratio() -> None:
+    metadata = [
+        {"prompt_cache_hit_tokens": 0, "prompt_cache_miss_tokens": 100},
+        {"prompt_cache_hit_tokens": 300, "prompt_cache_miss_tokens": 100},
+        {"duration_ms": 5},
+    ]
+    assert prompt_cache_hit_ratio(metadata) == 0.6
+    assert prompt_cache_hit_ratio([{"duration_ms": 5}]) is None
+
+
+def test_sum_usage_adds_integer_counters() -> None:
+    usages: list[dict[str, Any]] = [
+        {"prompt_tokens": 10, "completion_tokens": 3, "prompt_tokens_details": {"cached_tokens": 4}},
+        {"prompt_tokens": 12, "completion_tokens": 5, "prompt_cache_hit_tokens": 8},
+    ]
+    assert sum_usage(usages) == {
+        "prompt_tokens": 22,
+        "completion_tokens": 8,
+        "prompt_cache_hit_tokens": 8,
+    }
+
+
+def test_speculative_next_step() -> None:
+    now = datetime.now(tz=UTC)
+    settings = {"max_rounds": 2, "max_runtime_seconds": 600, "max_total_output_tokens": 100}
+
+    def predict(actor: Actor, step_round: int, tokens: int = 0, **overrides: Any) -> Any:
+        return speculative_next_step(
+            settings={**settings, **overrides},
+            actor=actor,
+            step_round=step_round,
+            created_at=now,
+            total_completion_tokens=tokens,
+        )
+
+    assert predict("debater_a", 1) == NextStep(round=1, actor="debater_b")
+    assert predict("debater_b", 1) == NextStep(round=2, actor="debater_a")
+    assert predict("debater_b", 2) == NextStep(round=2, actor="judge")
+    assert predict("debater_a", 2, tokens=100) == NextStep(round=1, actor="judge")
+    assert predict("debater_b", 1, judge_mode="per_round") is None
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+from llm_debate.events.coalesce import DeltaCoalescer
+from llm_debate.llm.deepseek import _SinkRelay, acollect_stream, collect_stream
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _chunk(content: str | None = None, *, usage: dict[str, Any] | None = None) -> SimpleNamespace:
+    choices = [] if content is None else [SimpleNamespace(delta=SimpleNamespace(content=content))]
+    return SimpleNamespace(model="deepseek-chat", choices=choices, usage=usage)
+
+
+def test_coalescer_flushes_on_fragment_count() -> None:
+    clock = _Clock()
+    flushed: list[tuple[int, str]] = []
+    coalescer = DeltaCoalescer(
+        lambda offset, text: flushed.append((offset, text)),
+        interval_ms=1000,
+        max_fragments=2,
+        clock=clock,
+    )
+    for fragment in ["a", "b", "c", "d", "e"]:
+        coalescer.push(fragment)
+    coalescer.flush()
+    assert flushed == [(0, "ab"), (2, "cd"), (4, "e")]
+
+
+def test_coalescer_flushes_on_interval() -> None:
+    clock = _Clock()
+    flushed: list[tuple[int, str]] = []
+    coalescer = DeltaCoalescer(
+        lambda offset, text: flushed.append((offset, text)),
+        interval_ms=100,
+        max_fragments=100,
+        clock=clock,
+    )
+    coalescer.push("a")
+    assert flushed == []
+    clock.now = 0.2
+    coalescer.push("b")
+    assert flushed == [(0, "ab")]
+
+
+def test_coalescer_reset_restarts_offsets() -> None:
+    flushed: list[tuple[int, str]] = []
+    coalescer = DeltaCoalescer(
+        lambda offset, text: flushed.append((offset, text)), interval_ms=0, max_fragments=1
+    )
+    coalescer.push("abc")
+    coalescer.reset()
+    coalescer.push("x")
+    assert flushed == [(0, "abc"), (0, "x")]
+
+
+def test_collect_stream_accumulates_content_and_usage() -> None:
+    flushed: list[tuple[int, str]] = []
+    coalescer = DeltaCoalescer(
+        lambda offset, text: flushed.append((offset, text)), interval_ms=1000, max_fragments=100
+    )
+    chunks = [_chunk("Hello"), _chunk(", "), _chunk("world"), _chunk(usage={"completion_tokens": 3})]
+    result = collect_stream(chunks, coalescer)
+    assert result.content == "Hello, world"
+    assert result.usage == {"completion_tokens": 3}
+    assert result.model == "deepseek-chat"
+    assert flushed == [(0, "Hello, world")]
+
+
+def test_acollect_stream_matches_collect_stream() -> None:
+    flushed: list[tuple[int, str]] = []
+    coalescer = DeltaCoalescer(
+        lambda offset, text: flushed.append((offset, text)), interval_ms=1000, max_fragments=2
+    )
+    chunks = [_chunk("a"), _chunk("b"), _chunk("c"), _chunk(usage={"completion_tokens": 3})]
+
+    async def stream() -> AsyncIterator[SimpleNamespace]:
+        for chunk in chunks:
+            yield chunk
+
+    result = asyncio.run(acollect_stream(stream(), coalescer))
+    assert result.content == "abc"
+    assert result.metadata["streamed"] is True
+    assert flushed == [(0, "ab"), (2, "c")]
+
+
+def test_sink_relay_replays_loop_calls_on_the_calling_thread() -> None:
+    pushed: list[tuple[str, int]] = []
+
+    class _Sink:
+        def push(self, fragment: str) -> None:
+            pushed.append((fragment, threading.get_ident()))
+
+        def flush(self) -> None:
+            pushed.append(("<flush>", threading.get_ident()))
+
+        def reset(self) -> None:
+            pushed.clear()
+
+    relay = _SinkRelay()
+
+    async def stream() -> AsyncIterator[SimpleNamespace]:
+        for chunk in [_chunk("a"), _chunk("b"), _chunk(usage={"completion_tokens": 2})]:
+            yield chunk
+
+    def run_loop() -> None:
+        relay.reset()
+        asyncio.run(acollect_stream(stream(), relay))
+        relay.close()
+
+    loop_thread = threading.Thread(target=run_loop)
+    loop_thread.start()
+    relay.replay(_Sink())
+    loop_thread.join()
+    assert pushed == [(text, threading.get_ident()) for text in ("a", "b", "<flush>")]
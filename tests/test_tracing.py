@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Any
+
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+import pytest
+from sqlalchemy import create_engine, text
+
+from llm_debate.core.tracing import inject_task_headers, task_span, trace_engine, tracer
+
+_EXPORTER = InMemorySpanExporter()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _provider() -> None:
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(_EXPORTER))
+    trace.set_tracer_provider(provider)
+
+
+@pytest.fixture(autouse=True)
+def _clear() -> None:
+    _EXPORTER.clear()
+
+
+def test_api_published_task_joins_the_request_trace() -> None:
+    headers: dict[str, Any] = {}
+    with tracer.start_as_current_span("POST /debates/{debate_id}/start") as request_span:
+        inject_task_headers(headers)
+    assert headers["trace_link_only"] is False
+
+    with task_span("advance_debate", headers, {}) as step_span:
+        step_context = step_span.get_span_context()
+    assert step_context.trace_id == request_span.get_span_context().trace_id
+
+
+def test_step_published_task_starts_a_linked_trace() -> None:
+    first: dict[str, Any] = {}
+    with tracer.start_as_current_span("POST /debates/{debate_id}/start"):
+        inject_task_headers(first)
+
+    second: dict[str, Any] = {}
+    with task_span("advance_debate", first, {}) as step_span:
+        inject_task_headers(second)
+    assert second["trace_link_only"] is True
+
+    with task_span("advance_debate", second, {}) as next_span:
+        next_context = next_span.get_span_context()
+    assert next_context.trace_id != step_span.get_span_context().trace_id
+    finished = _EXPORTER.get_finished_spans()[-1]
+    assert [link.context.span_id for link in finished.links] == [
+        step_span.get_span_context().span_id
+    ]
+
+
+def test_trace_engine_records_statements() -> None:
+    engine = create_engine("sqlite://")
+    trace_engine(engine)
+    with tracer.start_as_current_span("step") as parent, engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    query = next(span for span in _EXPORTER.get_finished_spans() if span.name == "SELECT")
+    assert query.attributes is not None
+    assert query.attributes["db.statement"] == "SELECT 1"
+    assert query.parent is not None
+    assert query.parent.span_id == parent.get_span_context().span_id
+    engine.dispose()
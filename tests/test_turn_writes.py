@@ -7,7 +7,11 @@ import uuid
 
 from sqlalchemy.dialects import postgresql
 
-from llm_debate.db.turn_writes import build_insert_turn_idempotent_stmt
+from llm_debate.db.turn_writes import (
+    build_insert_round_verdict_idempotent_stmt,
+    build_insert_summary_idempotent_stmt,
+    build_insert_turn_idempotent_stmt,
+)
 
 
 def test_insert_turn_is_idempotent() -> None:
@@ -28,3 +32,37 @@ def test_insert_turn_is_idempotent() -> None:
     assert "ON CONFLICT" in sql
     assert "DO NOTHING" in sql
     assert "RETURNING" in sql
+
+
+def test_insert_summary_is_idempotent() -> None:
+    stmt = build_insert_summary_idempotent_stmt(
+        values={
+            "debate_id": uuid.uuid4(),
+            "through_round": 2,
+            "content": "A argued X; B conceded Y.",
+            "model": "deepseek-chat",
+            "usage": {},
+            "created_at": datetime.now(tz=UTC),
+        }
+    )
+    dialect_factory = cast(Callable[[], Any], postgresql.dialect)
+    sql = str(stmt.compile(dialect=dialect_factory()))
+    assert "ON CONFLICT (debate_id, through_round) DO NOTHING" in sql
+    assert "RETURNING" in sql
+
+
+def test_insert_round_verdict_is_idempotent() -> None:
+    stmt = build_insert_round_verdict_idempotent_stmt(
+        values={
+            "debate_id": uuid.uuid4(),
+            "round": 3,
+            "verdict": {"no_new_substantive_arguments": True},
+            "model": "deepseek-chat",
+            "usage": {},
+            "created_at": datetime.now(tz=UTC),
+        }
+    )
+    dialect_factory = cast(Callable[[], Any], postgresql.dialect)
+    sql = str(stmt.compile(dialect=dialect_factory()))
+    assert "ON CONFLICT (debate_id, round) DO NOTHING" in sql
+    assert "RETURNING" in sql
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import Literal
+
+import pytest
+
+from llm_debate.runtime.verdicts import (
+    JudgeVerdict,
+    aggregate_verdicts,
+    default_panel_temperatures,
+)
+
+
+def _verdict(
+    winner: Literal["a", "b", "tie"], score_a: int, score_b: int, *, stale: bool = False
+) -> JudgeVerdict:
+    return JudgeVerdict(
+        summary=f"{winner} {score_a}-{score_b}",
+        score_a=score_a,
+        score_b=score_b,
+        winner=winner,
+        no_new_substantive_arguments=stale,
+    )
+
+
+def test_aggregate_verdicts_majority_winner_and_mean_scores() -> None:
+    verdict = aggregate_verdicts(
+        [_verdict("a", 8, 6), _verdict("b", 5, 7), _verdict("a", 7, 6, stale=True)]
+    )
+    assert verdict.winner == "a"
+    assert (verdict.score_a, verdict.score_b) == (7, 6)
+    assert verdict.summary == "a 8-6"
+    assert verdict.no_new_substantive_arguments is False
+
+
+def test_aggregate_verdicts_split_vote_falls_back_to_mean_scores() -> None:
+    assert aggregate_verdicts([_verdict("a", 6, 5), _verdict("b", 4, 8)]).winner == "b"
+    assert aggregate_verdicts([_verdict("a", 6, 5), _verdict("b", 5, 6)]).winner == "tie"
+
+
+def test_aggregate_verdicts_stale_needs_strict_majority() -> None:
+    verdicts = [_verdict("a", 6, 5, stale=True), _verdict("a", 6, 5)]
+    assert aggregate_verdicts(verdicts).no_new_substantive_arguments is False
+    verdicts.append(_verdict("a", 6, 5, stale=True))
+    assert aggregate_verdicts(verdicts).no_new_substantive_arguments is True
+
+
+def test_aggregate_verdicts_requires_verdicts() -> None:
+    with pytest.raises(ValueError):
+        aggregate_verdicts([])
+
+
+def test_default_panel_temperatures_spread_the_judges() -> None:
+    assert default_panel_temperatures(1) == [None]
+    assert default_panel_temperatures(3) == [0.2, 0.6, 1.0]
+    assert len(set(default_panel_temperatures(5))) == 5